@@ -0,0 +1,118 @@
+"""Measure time and memory of materializing documents from a cursor.
+
+A fake cursor api serves batches decoded from JSON, like the server would, so
+only the client side is measured::
+
+    python benchmarks/bench_cursor.py [rows] [fields]
+
+"""
+
+import gc
+import json
+import sys
+import time
+
+try:
+    import tracemalloc
+
+except ImportError:
+    # python 2 has no tracemalloc
+    tracemalloc = None
+
+from arangodb import cursor, db
+
+
+class FakeCursors(object):
+
+    """Serve rows in batches like the cursor api."""
+
+    def __init__(self, rows, fields, batch=1000):
+        self.rows = rows
+        self.batch = batch
+
+        doc = dict(('field_{0}'.format(i), 'value {0}'.format(i)) for i in range(fields))
+        self.batch_json = json.dumps([
+            dict(doc, _id='{0}/{1}'.format('{collection}', i), _key=str(i), _rev='1')
+            for i in range(batch)
+        ])
+
+    def _result(self, collection, offset):
+        count = min(self.batch, self.rows - offset)
+        result = json.loads(self.batch_json.replace('{collection}', collection))[:count]
+
+        return {
+            'result': result,
+            'hasMore': offset + count < self.rows,
+            'id': offset + count,
+        }
+
+    def create(self, query, bind=None, **kwargs):
+        self.collection = bind['@collection']
+
+        return self._result(self.collection, 0)
+
+    def pursue(self, cursor_id):
+        return self._result(self.collection, cursor_id)
+
+
+class FakeClient(object):
+    def __init__(self, rows, fields):
+        self.cursors = FakeCursors(rows, fields)
+
+
+class Regular(db.Document):
+    pass
+
+
+class Custom(db.Document):
+
+    """Is constructed by __init__ and __setitem__ per key."""
+
+    def __setitem__(self, key, value):
+        super(Custom, self).__setitem__(key, value)
+
+
+class Compact(db.Document):
+    __compact__ = True
+
+
+def materialize(cls, rows, fields):
+    client = FakeClient(rows, fields)
+    cursor.Cursor._set_client_factory(lambda _: client)
+
+    return list(cursor.Cursor('FOR d IN @@collection RETURN d', {'@collection': cls.__name__}).iter_documents())
+
+
+def measure(cls, rows, fields):
+    gc.collect()
+
+    start = time.time()
+    documents = materialize(cls, rows, fields)
+    duration = time.time() - start
+
+    if tracemalloc is None:
+        print("{0:10} {1:8d} rows {2:8.3f}s".format(cls.__name__, len(documents), duration))
+        return
+
+    del documents
+    gc.collect()
+
+    tracemalloc.start()
+    documents = materialize(cls, rows, fields)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print("{0:10} {1:8d} rows {2:8.3f}s  retained {3:8.1f} MiB  peak {4:8.1f} MiB".format(
+        cls.__name__, len(documents), duration, current / 2. ** 20, peak / 2. ** 20))
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    fields = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+
+    for cls in (Custom, Regular, Compact):
+        measure(cls, rows, fields)
+
+
+if __name__ == '__main__':
+    main()
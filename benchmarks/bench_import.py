@@ -0,0 +1,87 @@
+"""Measure the import time of the package and the time to define model classes.
+
+Each import is measured in a fresh interpreter::
+
+    python benchmarks/bench_import.py [classes] [graphs]
+
+"""
+
+import subprocess
+import sys
+import time
+
+from arangodb import db, graph
+
+
+IMPORT = "import time; start = time.time(); import arangodb.graph; print(time.time() - start)"
+
+
+def measure_import(runs=5):
+    durations = [
+        float(subprocess.check_output([sys.executable, '-c', IMPORT]).decode().strip())
+        for _ in range(runs)
+    ]
+
+    print("import arangodb.graph {0:8.3f}s  (best of {1})".format(min(durations), runs))
+
+
+def define_documents(count):
+    return [
+        type('Model{0}'.format(i), (db.Document, ), {
+            'by_name': db.Hash('name'),
+            'field_{0}'.format(i): None,
+        })
+        for i in range(count)
+    ]
+
+
+def define_graphs(count, members=10):
+    graphs = []
+    for i in range(count):
+        vertices = [
+            type('graph_{0}_vertex_{1}'.format(i, j), (graph.GraphVertex, type(
+                'Graph{0}Vertex{1}'.format(i, j), (db.Document, ), {})), {})
+            for j in range(members)
+        ]
+        edge = type('graph_{0}_edge'.format(i), (graph.GraphEdge, type(
+            'Graph{0}Edge'.format(i), (db.Edge, ), {})), {})
+
+        dct = dict((vertex.__name__, vertex) for vertex in vertices)
+        dct['edge'] = edge
+
+        graphs.append(type('Graph{0}'.format(i), (graph.Graph, ), dct))
+
+    return graphs
+
+
+def measure_definition(classes, graphs):
+    start = time.time()
+    define_documents(classes)
+    duration = time.time() - start
+
+    print("{0:6d} document classes {1:8.3f}s".format(classes, duration))
+
+    start = time.time()
+    defined = define_graphs(graphs)
+    duration = time.time() - start
+
+    print("{0:6d} graphs           {1:8.3f}s".format(graphs, duration))
+
+    start = time.time()
+    for cls in defined:
+        cls.__definition__      # pylint: disable=W0104
+    duration = time.time() - start
+
+    print("{0:6d} graph members    {1:8.3f}s".format(graphs, duration))
+
+
+def main():
+    classes = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    graphs = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+
+    measure_import()
+    measure_definition(classes, graphs)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,651 @@
+"""A local adjacency index of a graph for fast neighborhood queries."""
+
+from array import array
+from collections import OrderedDict, deque
+
+import mmap
+import tempfile
+
+from six import itervalues, string_types
+from six.moves import range
+
+from . import api, cursor, db, exc
+
+import threading
+import logging
+
+LOG = logging.getLogger(__name__)
+
+
+def _build_rows(size, sources, targets, serials=None):
+    offsets = array('l', [0]) * (size + 1)
+
+    for source in sources:
+        offsets[source + 1] += 1
+
+    for i in range(size):
+        offsets[i + 1] += offsets[i]
+
+    position = array('l', offsets[:-1])
+    sorted_targets = array('l', [0]) * len(sources)
+    sorted_serials = None if serials is None else array('l', [0]) * len(sources)
+
+    for k, (source, target) in enumerate(zip(sources, targets)):
+        sorted_targets[position[source]] = target
+
+        if serials is not None:
+            sorted_serials[position[source]] = serials[k]
+
+        position[source] += 1
+
+    return offsets, sorted_targets, sorted_serials
+
+
+def build_csr(size, sources, targets):
+    """Sort edges by source into compressed sparse rows.
+
+    :returns: a tuple of offsets, where the targets of vertex `i` are
+        `targets[offsets[i]:offsets[i + 1]]`, and the sorted targets
+    """
+
+    offsets, sorted_targets, _ = _build_rows(size, sources, targets)
+
+    return offsets, sorted_targets
+
+
+class Adjacency(object):
+
+    """An immutable snapshot of edges as outbound and inbound compressed sparse rows.
+
+    Every edge has a serial, which is never reused, so a later removal of an
+    edge is found without rebuilding the rows.
+    """
+
+    def __init__(self, ids, sources, targets, serials=None):
+        if serials is None:
+            serials = array('l', range(len(sources)))
+
+        self.ids = list(ids)
+        self.index = dict((_id, i) for i, _id in enumerate(self.ids))
+
+        self.outbound = _build_rows(len(self.ids), sources, targets, serials)
+        self.inbound = _build_rows(len(self.ids), targets, sources, serials)
+
+    def __len__(self):
+        """The count of vertices."""
+
+        return len(self.ids)
+
+    def _rows(self, direction):
+        if direction in (db.EDGE_DIRECTION_OUTBOUND, db.EDGE_DIRECTION_ANY):
+            yield self.outbound
+
+        if direction in (db.EDGE_DIRECTION_INBOUND, db.EDGE_DIRECTION_ANY):
+            yield self.inbound
+
+    def iter_neighbors(self, i, direction, removed=()):
+        """Iterate the neighbors of vertex `i`, without the edges of removed serials."""
+
+        if i >= len(self.ids):
+            return
+
+        for offsets, targets, serials in self._rows(direction):
+            for k in range(offsets[i], offsets[i + 1]):
+                if serials[k] not in removed:
+                    yield targets[k]
+
+    def degree(self, i, direction, removed=()):
+        if i >= len(self.ids):
+            return 0
+
+        if not removed:
+            return sum(offsets[i + 1] - offsets[i] for offsets, _, _ in self._rows(direction))
+
+        return sum(1 for _ in self.iter_neighbors(i, direction, removed))
+
+
+def vertex_id(vertex):
+    return vertex if isinstance(vertex, string_types) else vertex['_id']
+
+
+class AdjacencyIndex(object):
+
+    """A client side index of the edges of a graph in compact arrays.
+
+    Neighbors, degrees and breadth first searches are answered locally
+    without a request::
+
+        index = AdjacencyIndex(MyGraph).load()
+        index.start(interval=60)
+
+        index.neighbors(person, direction=db.EDGE_DIRECTION_OUTBOUND)
+        index.bfs(person, depth=2)
+
+    The index is loaded in batches from the edge collections of the graph
+    with only `_id`, `_from` and `_to`. The loaded edges are kept as
+    compressed sparse rows, changes since then as a small delta per vertex,
+    which is merged into new rows, when it exceeds a ratio of all edges.
+
+    Changes are applied by :py:meth:`apply_changes`, e.g. from an own change
+    feed, or by :py:meth:`poll` from the write-ahead log since the tick of
+    the load. Changes applied during a load are replayed on the loaded edges.
+    """
+
+    def __init__(self, graph=None, edges=None, batch=10000, merge_ratio=0.1, feed=True):
+        """
+        :param graph: a graph class, whose edge collections are indexed
+        :param edges: edge classes or collection names instead of those of a graph
+        :param batch: the count of edges per batch while loading
+        :param merge_ratio: merge the changes into new rows, if they exceed this ratio of all edges
+        :param feed: follow the write-ahead log of the server, see :py:meth:`poll`
+        """
+
+        if edges is None:
+            edges = list(itervalues(graph.__graph_edges__))
+
+        self.edges = list(edges)
+        self.collections = [getattr(edge, '__collection_name__', edge) for edge in self.edges]
+        self.batch = batch
+        self.merge_ratio = merge_ratio
+        self.feed = feed
+
+        # the vertices, which are only appended
+        self.ids = []
+        self.vertex_index = {}
+
+        # the current edges as parallel arrays of vertex indexes and serials
+        self.edge_ids = []
+        self.edge_index = {}
+        self.sources = array('l')
+        self.targets = array('l')
+        self.serials = array('l')
+        self.next_serial = 0
+
+        self.adjacency = Adjacency([], array('l'), array('l'))
+
+        # the changes since the rows were built
+        self.added_outbound = {}
+        self.added_inbound = {}
+        self.removed = set()
+        self.changed = 0
+
+        # the tick of the write-ahead log, which is contained in the index
+        self.tick = None
+
+        # the changes applied during a load
+        self.buffered = None
+
+        self.lock = threading.RLock()
+        self.load_lock = threading.Lock()
+        self.timer = None
+
+    def __len__(self):
+        """The count of edges."""
+
+        return len(self.edge_ids)
+
+    def _vertex(self, _id):
+        i = self.vertex_index.get(_id)
+
+        if i is None:
+            i = self.vertex_index[_id] = len(self.ids)
+            self.ids.append(_id)
+
+        return i
+
+    def _add(self, edge, change=True):
+        if edge['_id'] in self.edge_index:
+            # a modified edge
+            self._remove(edge['_id'])
+
+        source, target = self._vertex(edge['_from']), self._vertex(edge['_to'])
+        serial = self.next_serial
+        self.next_serial += 1
+
+        self.edge_index[edge['_id']] = len(self.edge_ids)
+        self.edge_ids.append(edge['_id'])
+        self.sources.append(source)
+        self.targets.append(target)
+        self.serials.append(serial)
+
+        if change:
+            self.added_outbound.setdefault(source, []).append((serial, target))
+            self.added_inbound.setdefault(target, []).append((serial, source))
+            self.changed += 1
+
+    def _remove(self, edge_id):
+        i = self.edge_index.pop(edge_id, None)
+
+        if i is None:
+            return
+
+        self.removed.add(self.serials[i])
+        self.changed += 1
+
+        # move the last edge into the gap
+        last = len(self.edge_ids) - 1
+
+        if i != last:
+            self.edge_ids[i] = self.edge_ids[last]
+            self.sources[i] = self.sources[last]
+            self.targets[i] = self.targets[last]
+            self.serials[i] = self.serials[last]
+            self.edge_index[self.edge_ids[i]] = i
+
+        self.edge_ids.pop()
+        self.sources.pop()
+        self.targets.pop()
+        self.serials.pop()
+
+    def _merge(self):
+        """Build new rows of all current edges and forget the changes."""
+
+        self.adjacency = Adjacency(self.ids, self.sources, self.targets, self.serials)
+
+        self.added_outbound = {}
+        self.added_inbound = {}
+        self.removed = set()
+        self.changed = 0
+
+    def _apply(self, inserted, removed):
+        for edge_id in removed:
+            self._remove(edge_id)
+
+        for edge in inserted:
+            self._add(edge)
+
+        if self.changed > self.merge_ratio * max(len(self.edge_ids), 1):
+            self._merge()
+
+    def _iter_edges(self):
+        for edge in self.edges:
+            batches = cursor.CollectionCursor(edge, fields=['_id', '_from', '_to'], batch=self.batch).iter_batches()
+
+            for batch in batches:
+                for doc in batch:
+                    yield doc
+
+    def _last_tick(self):
+        if not self.feed:
+            return None
+
+        try:
+            return cursor.Cursor.client.wal.last_tick()
+
+        except exc.ApiError:
+            LOG.warning("The write-ahead log is not available, the adjacency index is reloaded instead")
+
+            return None
+
+    def load(self):
+        """Load all edges and replace the index.
+
+        :returns: self
+        """
+
+        with self.load_lock:
+            with self.lock:
+                self.buffered = []
+
+            try:
+                tick = self._last_tick()
+
+                loaded = AdjacencyIndex(edges=self.edges, batch=self.batch, feed=False)
+
+                for edge in self._iter_edges():
+                    loaded._add(edge, change=False)      # pylint: disable=W0212
+
+            except Exception:
+                with self.lock:
+                    self.buffered = None
+
+                raise
+
+            with self.lock:
+                buffered, self.buffered = self.buffered, None
+
+                self.ids, self.vertex_index = loaded.ids, loaded.vertex_index
+                self.edge_ids, self.edge_index = loaded.edge_ids, loaded.edge_index
+                self.sources, self.targets = loaded.sources, loaded.targets
+                self.serials, self.next_serial = loaded.serials, loaded.next_serial
+                self.tick = tick
+
+                self._merge()
+
+                # the loaded edges may miss changes, which were applied meanwhile
+                for inserted, removed in buffered:
+                    self._apply(inserted, removed)
+
+        LOG.debug("Loaded %d edges of %d vertices", len(self.edge_ids), len(self.ids))
+
+        return self
+
+    refresh = load
+
+    def apply_changes(self, inserted=(), removed=()):
+        """Apply changes of edges, e.g. from a change feed, in one step.
+
+        :param inserted: inserted or modified edges with `_id`, `_from` and `_to`
+        :param removed: the `_id` of removed edges
+        """
+
+        inserted, removed = list(inserted), list(removed)
+
+        with self.lock:
+            if self.buffered is not None:
+                self.buffered.append((inserted, removed))
+
+            self._apply(inserted, removed)
+
+    def _changes(self, entries):
+        inserted, removed = [], []
+
+        for entry in entries:
+            if entry.get('cname') not in self.collections:
+                continue
+
+            data = entry.get('data') or {}
+            _id = '/'.join((entry['cname'], data.get('_key', '')))
+
+            if entry.get('type') == api.WAL_DOCUMENT:
+                inserted.append(dict(data, _id=_id))
+
+            elif entry.get('type') == api.WAL_REMOVE:
+                removed.append(_id)
+
+        return inserted, removed
+
+    def poll(self, chunk_size=None):
+        """Apply the changes of the edge collections from the write-ahead log since the last load or poll.
+
+        :returns: the count of applied changes
+        """
+
+        if self.tick is None:
+            raise exc.ArangoException("The adjacency index has no tick of the write-ahead log to follow")
+
+        wal = cursor.Cursor.client.wal
+        count = 0
+
+        with self.load_lock:
+            more = True
+
+            while more:
+                entries, tick, more = wal.tail(self.tick, chunk_size=chunk_size)
+                inserted, removed = self._changes(entries)
+
+                with self.lock:
+                    self._apply(inserted, removed)
+                    self.tick = tick
+
+                count += len(inserted) + len(removed)
+
+        return count
+
+    def _update(self):
+        """Poll the changes or reload the index, if there is no change feed."""
+
+        if self.tick is None:
+            self.refresh()
+            return
+
+        try:
+            self.poll()
+
+        except exc.ApiError:
+            LOG.warning("Following the write-ahead log failed, reload the adjacency index", exc_info=True)
+            self.refresh()
+
+    def start(self, interval):
+        """Update the index every interval seconds in a background thread.
+
+        The changes are polled from the write-ahead log, or the index is reloaded without it.
+        """
+
+        def run():
+            try:
+                self._update()
+
+            except Exception:       # pylint: disable=W0703
+                LOG.exception("Update of adjacency index failed")
+
+            self._schedule(interval)
+
+        with self.lock:
+            self.stop()
+            self.timer = threading.Timer(interval, run)
+            self.timer.daemon = True
+            self.timer.start()
+
+    def _schedule(self, interval):
+        with self.lock:
+            # not stopped meanwhile
+            if self.timer is not None:
+                self.start(interval)
+
+    def stop(self):
+        with self.lock:
+            if self.timer is not None:
+                self.timer.cancel()
+                self.timer = None
+
+    def _iter_neighbors(self, i, direction):
+        """Iterate the neighbors of vertex `i` in the rows and the changes, the lock must be held."""
+
+        for neighbor in self.adjacency.iter_neighbors(i, direction, self.removed):
+            yield neighbor
+
+        for added, wanted in ((self.added_outbound, (db.EDGE_DIRECTION_OUTBOUND, db.EDGE_DIRECTION_ANY)),
+                              (self.added_inbound, (db.EDGE_DIRECTION_INBOUND, db.EDGE_DIRECTION_ANY))):
+            if direction in wanted:
+                for serial, neighbor in added.get(i, ()):
+                    if serial not in self.removed:
+                        yield neighbor
+
+    def neighbors(self, vertex, direction=db.EDGE_DIRECTION_ANY):
+        """:returns: the `_id` of all distinct neighbors of a vertex or its `_id`"""
+
+        with self.lock:
+            i = self.vertex_index.get(vertex_id(vertex))
+
+            if i is None:
+                return []
+
+            return [self.ids[j] for j in OrderedDict.fromkeys(self._iter_neighbors(i, direction))]
+
+    def degree(self, vertex, direction=db.EDGE_DIRECTION_ANY):
+        """:returns: the count of edges of a vertex"""
+
+        with self.lock:
+            i = self.vertex_index.get(vertex_id(vertex))
+
+            if i is None:
+                return 0
+
+            return sum(1 for _ in self._iter_neighbors(i, direction))
+
+    def bfs(self, start, depth=1, direction=db.EDGE_DIRECTION_ANY):
+        """Search breadth first up to depth hops.
+
+        :returns: an :py:class:`OrderedDict` of the `_id` of reached vertices to their distance,
+            without the start
+        """
+
+        with self.lock:
+            i = self.vertex_index.get(vertex_id(start))
+
+            if i is None:
+                return OrderedDict()
+
+            distances = OrderedDict(((i, 0), ))
+            queue = deque([i])
+
+            while queue:
+                current = queue.popleft()
+                distance = distances[current] + 1
+
+                if distance > depth:
+                    continue
+
+                for neighbor in self._iter_neighbors(current, direction):
+                    if neighbor not in distances:
+                        distances[neighbor] = distance
+                        queue.append(neighbor)
+
+            del distances[i]
+
+            return OrderedDict((self.ids[j], distance) for j, distance in distances.items())
+
+
+class CSRMatrix(object):
+
+    """The outbound adjacency of a subgraph as compressed sparse rows of integer vertex ids.
+
+    The `_id` of vertex `i` is `ids[i]` and its targets are
+    `targets[offsets[i]:offsets[i + 1]]`. A memory-mapped file contains the
+    offsets followed by the targets as native `long` integers.
+    """
+
+    def __init__(self, ids, offsets, targets, mapped=None, views=()):
+        self.ids = ids
+        self.offsets = offsets
+        self.targets = targets
+
+        self.mapped = mapped
+        self.views = list(views)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self):
+        """The count of edges."""
+
+        return len(self.targets)
+
+    def row(self, i):
+        return self.targets[self.offsets[i]:self.offsets[i + 1]]
+
+    def close(self):
+        """Release a memory-mapped file."""
+
+        for view in self.views:
+            view.release()
+
+        del self.views[:]
+
+        if self.mapped is not None:
+            self.mapped.close()
+            self.mapped = None
+
+
+# python 2 cannot view a memory-mapped file as integers
+MEMORYVIEW_CAST = hasattr(memoryview, 'cast')
+
+
+def _allocate(path, offsets, count):
+    """:returns: the targets array and a :py:class:`CSRMatrix` for it"""
+
+    if path is None or not MEMORYVIEW_CAST:
+        targets = array('l', [0]) * count
+
+        return targets, CSRMatrix(None, offsets, targets)
+
+    size = (len(offsets) + count) * offsets.itemsize
+
+    with open(path, 'w+b') as fileobj:
+        fileobj.truncate(size)
+        mapped = mmap.mmap(fileobj.fileno(), size)
+
+    view = memoryview(mapped).cast('l')
+
+    offsets_view = view[:len(offsets)]
+    offsets_view[:] = offsets
+    targets = view[len(offsets):]
+
+    return targets, CSRMatrix(None, offsets_view, targets, mapped, views=(offsets_view, targets, view))
+
+
+def export_adjacency(vertex_collections, edge_collections, path=None, batch=10000, chunk=1 << 20):
+    """Stream vertices and edges into a :py:class:`CSRMatrix`, without creating documents.
+
+    Only the vertex mapping and the offsets are kept in memory. The edges are
+    spooled as integer pairs to a temporary file and placed into their rows in
+    a second pass, directly into the memory-mapped output file, if a path is
+    given. Edges to vertices outside of the vertex collections are skipped.
+
+    :param vertex_collections: document classes or collection names
+    :param edge_collections: edge classes or collection names
+    :param path: the file for memory-mapped offsets and targets
+    :param batch: the count of documents per cursor batch
+    :param chunk: the count of edges read at once in the second pass
+    """
+
+    index = {}
+    ids = []
+
+    for collection in vertex_collections:
+        for docs in cursor.CollectionCursor(collection, fields=['_id'], batch=batch).iter_batches():
+            for doc in docs:
+                if doc['_id'] not in index:
+                    index[doc['_id']] = len(ids)
+                    ids.append(doc['_id'])
+
+    degrees = array('l', [0]) * len(ids)
+    count = skipped = 0
+
+    with tempfile.TemporaryFile() as pairs:
+        for collection in edge_collections:
+            for docs in cursor.CollectionCursor(collection, fields=['_from', '_to'], batch=batch).iter_batches():
+                spool = array('l')
+
+                for doc in docs:
+                    source, target = index.get(doc['_from']), index.get(doc['_to'])
+
+                    if source is None or target is None:
+                        skipped += 1
+                        continue
+
+                    degrees[source] += 1
+                    spool.append(source)
+                    spool.append(target)
+
+                spool.tofile(pairs)
+                count += len(spool) // 2
+
+        offsets = array('l', [0]) * (len(ids) + 1)
+
+        for i, degree in enumerate(degrees):
+            offsets[i + 1] = offsets[i] + degree
+
+        del degrees
+
+        targets, matrix = _allocate(path, offsets, count)
+        position = array('l', offsets[:-1])
+
+        pairs.seek(0)
+        remaining = count * 2
+
+        while remaining:
+            spool = array('l')
+            spool.fromfile(pairs, min(chunk * 2, remaining))
+            remaining -= len(spool)
+
+            for k in range(0, len(spool), 2):
+                source = spool[k]
+                targets[position[source]] = spool[k + 1]
+                position[source] += 1
+
+    if path is not None and matrix.mapped is None:
+        # the same file layout, but written at once
+        with open(path, 'wb') as fileobj:
+            offsets.tofile(fileobj)
+            targets.tofile(fileobj)
+
+    LOG.debug("Exported %d edges of %d vertices, skipped %d edges", count, len(ids), skipped)
+
+    matrix.ids = ids
+
+    return matrix
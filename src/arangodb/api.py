@@ -7,10 +7,12 @@ from itertools import chain
 from six.moves import map
 from six import iteritems
 
+import json
+
 import requests
 import requests.adapters
 
-from . import exc
+from . import exc, transaction
 
 import logging
 
@@ -26,6 +28,10 @@ def json_result():
         def wrapped(*args, **kwargs):
             response = func(*args, **kwargs)
 
+            if response.status_code == 304:
+                # not modified, so there is no content
+                return None
+
             headers = dict(response.headers.lower_items())
             if headers.get('content-type', '').startswith('application/json'):
                 json_content = response.json()
@@ -93,6 +99,28 @@ class Client(object):
         self.graphs = Graphs(self.api(self.database, 'gharial'))
         self.indexes = Indexes(self.api(self.database, 'index'))
         self.queries = Queries(self.api(self.database, 'query'))
+        self.exports = Exports(self.api(self.database, 'export'))
+        self.transactions = Transactions(self.api(self.database, 'transaction'))
+        self.pregel = Pregel(self.api(self.database, 'control_pregel'))
+        self.wal = Wal(self.api(self.database, 'wal'))
+
+    def transaction(self, read=(), write=(), stream=False, **options):
+        """Create a server-side transaction, see :py:class:`arangodb.transaction.Transaction`."""
+
+        return transaction.Transaction(self, read=read, write=write, stream=stream, **options)
+
+    def _transaction_kwargs(self, kwargs):
+        """Add the header of the current stream transaction to a request."""
+
+        current = transaction.current()
+
+        if current is not None and current.id is not None and current.is_for(self):
+            headers = dict(kwargs.get('headers') or {})
+            headers[transaction.TRANSACTION_HEADER] = current.id
+
+            kwargs['headers'] = headers
+
+        return kwargs
 
     def url(self, *path):
         """Return a full url to the arangodb server."""
@@ -101,26 +129,31 @@ class Client(object):
 
     @json_result()
     def get(self, *path, **kwargs):
-        return self.session.get(self.url(*path), **kwargs)
+        return self.session.get(self.url(*path), **self._transaction_kwargs(kwargs))
 
     @json_result()
     def post(self, *path, **kwargs):
-        return self.session.post(self.url(*path), **kwargs)
+        return self.session.post(self.url(*path), **self._transaction_kwargs(kwargs))
 
     @json_result()
     def put(self, *path, **kwargs):
-        return self.session.put(self.url(*path), **kwargs)
+        return self.session.put(self.url(*path), **self._transaction_kwargs(kwargs))
 
     @json_result()
     def patch(self, *path, **kwargs):
-        return self.session.patch(self.url(*path), **kwargs)
+        return self.session.patch(self.url(*path), **self._transaction_kwargs(kwargs))
 
     def head(self, *path, **kwargs):
-        return self.session.head(self.url(*path), **kwargs)
+        return self.session.head(self.url(*path), **self._transaction_kwargs(kwargs))
+
+    def get_raw(self, *path, **kwargs):
+        """Get a response, whose content is no JSON document, e.g. a dump."""
+
+        return self.session.get(self.url(*path), **self._transaction_kwargs(kwargs))
 
     @json_result()
     def delete(self, *path, **kwargs):
-        return self.session.delete(self.url(*path), **kwargs)
+        return self.session.delete(self.url(*path), **self._transaction_kwargs(kwargs))
 
     def api(self, database, *path, **kwargs):
         """Just expose the HTTP methods to this session, by partially pre binding the path."""
@@ -161,7 +194,7 @@ class ApiProxy(object):
 
     def __init__(self, session, *path, **kwargs):
         # wrap the session and preselect api
-        for method in ('get', 'post', 'put', 'patch', 'delete', 'head'):
+        for method in ('get', 'post', 'put', 'patch', 'delete', 'head', 'get_raw'):
             setattr(self, method, partial(getattr(session, method), *path, **kwargs))
 
 
@@ -239,10 +272,12 @@ class DocumentsMixin(object):
         """Get a document or all documents.
 
         :param handle: the document handle or the collection name
+        :param rev: only return the document, if its revision differs, otherwise `None`
 
         """
 
         params = {}
+        headers = {}
 
         if len(handle) == 1 and '/' not in handle[0]:
             params = dict(collection=handle[0])
@@ -252,7 +287,10 @@ class DocumentsMixin(object):
 
             handle = ()
 
-        return self.api.get(*handle, params=params)
+        if kwargs.get('rev') is not None:
+            headers['If-None-Match'] = '"{0}"'.format(kwargs['rev'])
+
+        return self.api.get(*handle, params=params, headers=headers)
 
     def delete(self, *handle):
         """Delete a document."""
@@ -274,6 +312,60 @@ class DocumentsMixin(object):
 
         return self.api.patch(*handle, json=doc, params=params)
 
+    # multi document operations
+    # see https://docs.arangodb.com/HTTP/Document/WorkingWithDocuments.html
+
+    def create_many(self, collection, docs, overwrite=False):
+        """Create many documents with one request.
+
+        :param overwrite: replace documents with the same `_key` or an `overwriteMode`
+        :returns: a list of meta data or :py:class:`arangodb.exc.ApiError` per document
+        """
+
+        params = {}
+
+        if overwrite is True:
+            params['overwrite'] = True
+
+        elif overwrite:
+            params['overwriteMode'] = overwrite
+
+        return item_results(self.api.post(collection, json=list(docs), params=params))
+
+    def replace_many(self, collection, docs):
+        """Replace many documents, which have a `_key`, with one request."""
+
+        return item_results(self.api.put(collection, json=list(docs)))
+
+    def update_many(self, collection, docs, **kwargs):
+        """Partially update many documents, which have a `_key`, with one request."""
+
+        params = {}
+
+        params['keepNull'] = kwargs.get('keep', False)
+        params['mergeObjects'] = kwargs.get('merge', True)
+
+        return item_results(self.api.patch(collection, json=list(docs), params=params))
+
+    def delete_many(self, collection, keys):
+        """Delete many documents by key with one request."""
+
+        return item_results(self.api.delete(collection, json=list(keys)))
+
+
+def item_results(results):
+    """Turn the errors of a multi document response into exceptions."""
+
+    return [
+        exc.ApiError(
+            code=result.get('code'),
+            num=result.get('errorNum'),
+            message=result.get('errorMessage'),
+            args=(),
+        ) if result.get('error', False) else result
+        for result in results
+    ]
+
 
 class Documents(Api, DocumentsMixin):
     pass
@@ -359,6 +451,165 @@ class Cursors(Api):
         return self.api.delete(name)
 
 
+class Exports(Api):
+
+    """Export all documents of a collection.
+
+    The export is continued like a cursor.
+    see https://docs.arangodb.com/HttpBulkImports/Exporting.html
+    """
+
+    def create(self, collection, fields=None, **kwargs):
+        body = dict(
+            remap_fields(
+                kwargs,
+                'batch', 'ttl', 'count', 'flush',
+                batch='batchSize'
+            )
+        )
+
+        if fields is not None:
+            body['restrict'] = {
+                'type': 'include',
+                'fields': list(fields)
+            }
+
+        return self.api.post(json=body, params={'collection': collection})
+
+
+# the types of log entries of a document change
+WAL_DOCUMENT = 2300
+WAL_REMOVE = 2302
+
+
+class Wal(Api):
+
+    """Tail the write-ahead log of a database as a change feed.
+
+    see https://docs.arangodb.com/HTTP/Replications/WALAccess.html
+    """
+
+    def last_tick(self):
+        return self.api.get('lastTick')['tick']
+
+    def tail(self, from_tick, chunk_size=None):
+        """Read the log entries after a tick.
+
+        :returns: a tuple of the entries, the last included tick and if there are more entries
+        """
+
+        params = {'from': from_tick}
+
+        if chunk_size is not None:
+            params['chunkSize'] = chunk_size
+
+        response = self.api.get_raw('tail', params=params)
+
+        if response.status_code >= 400:
+            raise exc.ApiError(response.status_code, None, response.text, args=())
+
+        if response.status_code == 204:
+            return [], from_tick, False
+
+        headers = dict(response.headers.lower_items())
+
+        entries = [json.loads(line) for line in response.text.splitlines() if line.strip()]
+        last_tick = headers.get('x-arango-replication-lastincluded', '0')
+
+        return entries, from_tick if last_tick == '0' else last_tick, \
+            headers.get('x-arango-replication-checkmore') == 'true'
+
+
+class Transactions(Api):
+
+    """Javascript and stream transactions.
+
+    see https://docs.arangodb.com/HTTP/Transaction/index.html
+    """
+
+    @staticmethod
+    def _body(read, write, kwargs):
+        body = {
+            'collections': {
+                'read': list(read),
+                'write': list(write),
+            }
+        }
+
+        body.update(
+            remap_fields(
+                kwargs,
+                'sync', 'lock_timeout',
+                sync='waitForSync',
+                lock_timeout='lockTimeout'
+            )
+        )
+
+        return body
+
+    def execute(self, action, read=(), write=(), params=None, **kwargs):
+        """Execute a javascript function on the server in one transaction.
+
+        :returns: the result of the action
+        """
+
+        body = self._body(read, write, kwargs)
+        body['action'] = action
+
+        if params is not None:
+            body['params'] = params
+
+        return self.api.post(json=body)['result']
+
+    def begin(self, read=(), write=(), **kwargs):
+        """Begin a stream transaction.
+
+        :returns: the transaction id
+        """
+
+        return self.api.post('begin', json=self._body(read, write, kwargs))['result']['id']
+
+    def commit(self, trx_id):
+        return self.api.put(trx_id)['result']
+
+    def abort(self, trx_id):
+        return self.api.delete(trx_id)['result']
+
+
+class Pregel(Api):
+
+    """Run graph algorithms on the server.
+
+    see https://docs.arangodb.com/HTTP/Pregel/index.html
+    """
+
+    def start(self, algorithm, graph=None, vertex_collections=None, edge_collections=None, params=None):
+        """Start a pregel job for a graph or for vertex and edge collections.
+
+        :returns: the job id
+        """
+
+        body = {'algorithm': algorithm}
+
+        if graph is not None:
+            body['graphName'] = graph
+
+        else:
+            body['vertexCollections'] = list(vertex_collections)
+            body['edgeCollections'] = list(edge_collections)
+
+        if params:
+            body['params'] = params
+
+        return self.api.post(json=body)
+
+    def status(self, job_id):
+        return self.api.get(job_id)
+
+    def cancel(self, job_id):
+        return self.api.delete(job_id)
+
+
 class Indexes(Api):
     def get(self, *handle, **kwargs):
         """Get a document or all documents.
@@ -0,0 +1,119 @@
+"""A document cache, which is revalidated by the document revision."""
+
+from collections import OrderedDict
+from copy import deepcopy
+
+import json
+import threading
+
+
+class DocumentCache(object):
+
+    """A LRU cache of raw documents.
+
+    A cached document is always revalidated by its `_rev` with the server, so an
+    unchanged document is answered with a `304 Not Modified` without a body.
+
+    Enable it for a document class::
+
+        class Config(db.Document):
+            __cache__ = cache.DocumentCache(size=100)
+
+    """
+
+    def __init__(self, size=1000, max_bytes=None):
+        """
+        :param size: the max count of cached documents
+        :param max_bytes: the max sum of the JSON size of cached documents
+        """
+
+        self.size = size
+        self.max_bytes = max_bytes
+
+        # _id -> (doc, bytes)
+        self.entries = OrderedDict()
+        self.bytes = 0
+
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, _id):
+        return _id in self.entries
+
+    def _sizeof(self, doc):
+        if self.max_bytes is None:
+            return 0
+
+        return len(json.dumps(doc))
+
+    def get(self, _id):
+        """:returns: a copy of the cached document or `None`"""
+
+        with self.lock:
+            entry = self.entries.pop(_id, None)
+
+            if entry is None:
+                return None
+
+            # most recently used
+            self.entries[_id] = entry
+
+        return deepcopy(entry[0])
+
+    def put(self, doc):
+        """Cache a copy of a document, which must have an `_id` and `_rev`."""
+
+        doc = deepcopy(doc)
+        size = self._sizeof(doc)
+
+        if self.max_bytes is not None and size > self.max_bytes:
+            self.evict(doc['_id'])
+            return
+
+        with self.lock:
+            self._evict(doc['_id'])
+
+            self.entries[doc['_id']] = doc, size
+            self.bytes += size
+
+            while len(self.entries) > self.size \
+                    or (self.max_bytes is not None and self.bytes > self.max_bytes):
+                _, (_, evicted_size) = self.entries.popitem(last=False)
+                self.bytes -= evicted_size
+
+    def _evict(self, _id):
+        entry = self.entries.pop(_id, None)
+
+        if entry is not None:
+            self.bytes -= entry[1]
+
+    def evict(self, _id):
+        with self.lock:
+            self._evict(_id)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.bytes = 0
+
+    def load(self, api, name, key):
+        """Get a document from the server, unless the cached revision is still valid."""
+
+        _id = '/'.join((name, key))
+        cached = self.get(_id)
+
+        if cached is None:
+            doc = api.get(name, key)
+
+        else:
+            doc = api.get(name, key, rev=cached['_rev'])
+
+            if doc is None:
+                # not modified
+                return cached
+
+        self.put(doc)
+
+        return doc
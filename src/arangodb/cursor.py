@@ -1,44 +1,207 @@
-from . import meta
+from array import array
+from collections import OrderedDict
+
+from six.moves import map
+
+from . import meta, util, exc, export
+from .export import MISSING, field_getter
 
 import logging
 
 LOG = logging.getLogger(__name__)
 
 
+class Column(object):
+
+    """The values of a field in a contiguous array and a mask of missing values.
+
+    A missing or null value has a mask of 1 and a default value in a typed array.
+    """
+
+    def __init__(self, typecode=None, default=0):
+        """
+        :param typecode: an :py:mod:`array` typecode or None to store python objects in a list
+        :param default: the value to store for a missing value in a typed array
+        """
+
+        self.typecode = typecode
+        self.default = default
+
+        self.values = [] if typecode is None else array(typecode)
+        self.mask = array('b')
+
+    def __len__(self):
+        return len(self.mask)
+
+    def __getitem__(self, index):
+        if self.mask[index]:
+            return None
+
+        return self.values[index]
+
+    def __iter__(self):
+        for value, missing in zip(self.values, self.mask):
+            yield None if missing else value
+
+    def extend(self, values):
+        """Append a batch of values, :py:data:`MISSING` or None is masked."""
+
+        mask = array('b', (value is MISSING or value is None for value in values))
+        self.mask.extend(mask)
+
+        if self.typecode is None:
+            self.values.extend(None if missing else value for value, missing in zip(values, mask))
+
+        else:
+            self.values.extend(self.default if missing else value for value, missing in zip(values, mask))
+
+
 class Cursor(meta.CursorBase):
 
     """A cursor is created to perform queries."""
 
-    def __init__(self, query, bind=None, **kwargs):
+    def __init__(self, query, bind=None, lazy=False, prefetch=False, **kwargs):
+        """
+        :param lazy: deserialize documents on first access, see :py:meth:`arangodb.query.Query.lazy`
+        :param prefetch: fetch the next batch in the background, while the current one is processed
+        """
+
         self.query = query
         self.bind = bind
+        self.lazy = lazy
+        self.prefetch = prefetch
         self.kwargs = kwargs
 
-    def iter_result(self):
+    def _create(self):
+        LOG.debug("Create cursor: `%s`, %s, %s", self.query, self.bind, self.kwargs)
+
+        return self.__class__.api.create(self.query, bind=self.bind, **self.kwargs)
+
+    def _iter_cursors(self):
+        cursor = self._create()
+
+        yield cursor
+
+        while cursor['result'] and cursor['hasMore']:
+            # fetch next batch
+            cursor = self.__class__.api.pursue(cursor['id'])
+
+            yield cursor
+
+    def iter_batches(self):
         """Iterate over all batches of result."""
 
-        LOG.debug("Create cursor: `%s`, %s, %s", self.query, self.bind, self.kwargs)
-        cursor = self.__class__.api.create(self.query, bind=self.bind, **self.kwargs)
+        cursors = self._iter_cursors()
 
-        while cursor['result']:
-            for result in cursor['result']:
-                yield result
+        if self.prefetch:
+            cursors = util.prefetched(cursors)
 
-            if not cursor['hasMore']:
+        for cursor in cursors:
+            if not cursor['result']:
                 # step out
                 break
 
-            # fetch next batch
-            cursor = self.__class__.api.pursue(cursor['id'])
+            yield cursor['result']
+
+    def iter_result(self):
+        """Iterate over all results."""
+
+        for batch in self.iter_batches():
+            for result in batch:
+                yield result
 
     def iter_documents(self):
 
         """If you expect document instances to be returned from the cursor,
         call this to instantiate them."""
 
-        for doc in self.iter_result():
-            yield meta.BaseDocument._polymorph(doc)         # pylint: disable=W0212
+        # pylint: disable=W0212
+        if self.lazy:
+            for doc in self.iter_result():
+                yield meta.BaseDocument._polymorph_lazy(doc)
+
+        else:
+            for batch in self.iter_batches():
+                for doc in meta.BaseDocument._polymorph_batch(batch):
+                    yield doc
+
+    def to_columns(self, fields, dtypes=None):
+        """Collect fields of all results into columns, batch by batch.
+
+        :param fields: the field names, a nested field is a dotted path
+        :param dtypes: a dict of field name to :py:mod:`array` typecode, other fields are kept in lists
+        :returns: an :py:class:`OrderedDict` of field name to :py:class:`Column`
+        """
+
+        dtypes = dtypes or {}
+
+        columns = OrderedDict((field, Column(dtypes.get(field))) for field in fields)
+        getters = [(column, field_getter(field)) for field, column in columns.items()]
+
+        for batch in self.iter_batches():
+            for column, get in getters:
+                column.extend(list(map(get, batch)))
+
+        return columns
+
+    def export(self, path_or_fileobj, format='jsonl', fields=None, compression=None):     # pylint: disable=W0622
+        """Write all results batch by batch to a file, without creating documents.
+
+        :param format: `jsonl` or `csv`
+        :param fields: only write these fields, a nested field is a dotted path
+        :param compression: `gzip`, `bz2` or None
+        :returns: the count of written results
+        """
+
+        return export.export(self.iter_batches(), path_or_fileobj, format=format, fields=fields,
+                             compression=compression)
 
     def first_document(self):
         for doc in self.iter_documents():
             return doc
+
+
+class CollectionCursor(Cursor):
+
+    """A cursor over all documents of a collection.
+
+    It uses the export api, if the server provides it, otherwise a query.
+    """
+
+    query_all = "FOR doc IN @@collection RETURN doc"
+    query_fields = "FOR doc IN @@collection RETURN KEEP(doc, @fields)"
+
+    def __init__(self, collection, fields=None, **kwargs):
+        """
+        :param collection: a document class or collection name
+        :param fields: only return these fields
+        """
+
+        self.collection = getattr(collection, '__collection_name__', collection)
+        self.fields = fields
+
+        bind = {'@collection': self.collection}
+
+        if fields is None:
+            query = self.query_all
+
+        else:
+            query = self.query_fields
+            bind['fields'] = list(fields)
+
+        super(CollectionCursor, self).__init__(query, bind, **kwargs)
+
+    def _create(self):
+        try:
+            LOG.debug("Export collection: `%s`, %s, %s", self.collection, self.fields, self.kwargs)
+
+            return self.__class__.client.exports.create(self.collection, fields=self.fields, **self.kwargs)
+
+        except exc.ApiError as ex:
+            # the export api is not available for every storage engine
+            if ex.code not in (404, 501):
+                raise
+
+            LOG.info("Export of `%s` is not available: %s", self.collection, ex.message)
+
+        return super(CollectionCursor, self)._create()
@@ -1,6 +1,11 @@
 """Some classes to easy work with arangodb."""
 
-from . import meta, util, query
+from collections import OrderedDict
+from multiprocessing.pool import ThreadPool
+
+from six import iteritems, itervalues
+
+from . import meta, util, query, exc, cursor, api, transaction
 
 import logging
 
@@ -10,6 +15,8 @@ LOG = logging.getLogger(__name__)
 class QueryMixin(object):
     # pylint: disable=E0213
 
+    __slots__ = ()
+
     @util.classproperty
     def alias(cls):
         """A query alias for this collection."""
@@ -25,9 +32,60 @@ class QueryMixin(object):
 
         return query.Query(cls.alias, query.Collection(cls)).action(cls.alias)
 
+    @classmethod
+    def _check_missing(cls, keys, docs):
+        missing = [key for key, doc in zip(keys, docs) if doc is None]
+
+        if missing:
+            raise exc.DocumentNotFound(404, exc.DocumentNotFound.error_num,
+                                       "documents not found: {0}".format(', '.join(missing)),
+                                       args=(), kwargs={'keys': missing})
+
+    @classmethod
+    def load_many(cls, keys, strict=False):
+        """Load documents with one query.
+
+        :param keys: keys of this collection or `_id` handles of any collection
+        :param strict: raise :py:exc:`arangodb.exc.DocumentNotFound` with all missing keys
+        :returns: a list of documents in order of keys, `None` for a missing document
+        """
+
+        keys = list(keys)
+        handle = query.Alias('handle')
+
+        q = query.Query(handle, [cls._handle(key) for key in keys])\
+            .action(query.DOCUMENT(handle))
+
+        docs = list(q.cursor.iter_result())
+
+        if strict:
+            cls._check_missing(keys, docs)
+
+        meta.BaseDocument._cache_loaded(docs)          # pylint: disable=W0212
+
+        # pylint: disable=W0212
+        found = iter(meta.BaseDocument._polymorph_batch([doc for doc in docs if doc is not None]))
+
+        return [None if doc is None else next(found) for doc in docs]
+
+    @classmethod
+    def export(cls, path_or_fileobj, format='jsonl', fields=None, compression=None,     # pylint: disable=W0622
+               batch=None):
+        """Write all documents of this collection batch by batch to a file.
+
+        See :py:meth:`arangodb.cursor.Cursor.export`
+        """
+
+        kwargs = {} if batch is None else {'batch': batch}
+
+        return cursor.CollectionCursor(cls, fields=fields, **kwargs)\
+            .export(path_or_fileobj, format=format, fields=fields, compression=compression)
+
 
 class Document(meta.DocumentBase, QueryMixin):
-    pass
+    __slots__ = ()
+
+    __abstract__ = True
 
 
 EDGE_DIRECTION_ANY = 'any'
@@ -39,9 +97,17 @@ class Edge(meta.EdgeBase, QueryMixin):
 
     """An edge between two documents.
 
-    When the edge is loaded the two dowuments are also loaded.
+    When the edge is loaded the two documents are also loaded and
+    available as :py:attr:`from_document` and :py:attr:`to_document`.
     """
 
+    __slots__ = ('__endpoints__', )
+
+    # __init__ and __setitem__ only deal with documents for _from and _to
+    __adoptable__ = True
+
+    __abstract__ = True
+
     def __init__(self, *args, **kwargs):
         """
         call scheme:
@@ -67,16 +133,32 @@ class Edge(meta.EdgeBase, QueryMixin):
 
         super(Edge, self).__init__(*args, **kwargs)
 
+    def _init(self, data, raw=None):
+        super(Edge, self)._init(data, raw)
+
+        # the documents of _from and _to, if known
+        self.__endpoints__ = {}
+
     def __setitem__(self, key, value):
         if key in ('_from', '_to') and isinstance(value, meta.BaseDocument):
             # check for documents and reduce to _id
-            if '_id' not in value:
-                raise TypeError(
-                    "The document for setting `{0}` has no `_id`: {1}"
-                    .format(key, value)
-                )
+            if '_id' in value:
+                super(Edge, self).__setitem__(key, value['_id'])
+
+            else:
+                current = transaction.collecting(value.__class__)
+
+                # the _id of a document, which is created in the transaction, is set on commit
+                if current is None or not current.pending(value):
+                    raise TypeError(
+                        "The document for setting `{0}` has no `_id`: {1}"
+                        .format(key, value)
+                    )
 
-            super(Edge, self).__setitem__(key, value['_id'])
+                if key in self:
+                    del self[key]
+
+            self.__endpoints__[key] = value
 
         else:
             super(Edge, self).__setitem__(key, value)
@@ -97,6 +179,24 @@ class Edge(meta.EdgeBase, QueryMixin):
     def _to(self, value):
         self['_to'] = value
 
+    def _endpoint(self, key):
+        """Return the document of _from or _to and load it, if not already known."""
+
+        document = self.__endpoints__.get(key)
+
+        if document is None or document.get('_id') != self[key]:
+            document = self.__endpoints__[key] = Document.load(self[key])
+
+        return document
+
+    @property
+    def from_document(self):
+        return self._endpoint('_from')
+
+    @property
+    def to_document(self):
+        return self._endpoint('_to')
+
     @classmethod
     def _create(cls, doc):
         """Create a db instance."""
@@ -113,46 +213,108 @@ class Edge(meta.EdgeBase, QueryMixin):
 
     @classmethod
     def load(cls, key):
-        """Load the edge and connected documents."""
+        """Load the edge and connected documents with one query."""
 
-        edge = super(Edge, cls).load(key)
-
-        edge['_from'] = Document.load(edge['_from'])
-        edge['_to'] = Document.load(edge['_to'])
+        edge, = cls.load_many((key, ), strict=True)
 
         return edge
 
     @classmethod
-    def connections_query(cls, alias, document, direction=EDGE_DIRECTION_ANY):
+    def load_many(cls, keys, strict=False):
+        """Load edges together with their connected documents with one query.
+
+        :param keys: keys or `_id` handles of edges
+        :param strict: raise :py:exc:`arangodb.exc.DocumentNotFound` with all missing keys
+        :returns: a list of edges in order of keys, `None` for a missing edge
+        """
+
+        keys = list(keys)
+        handle = query.Alias('handle')
+        alias = query.Alias('edge')
+
+        q = query.Query(handle, [cls._handle(key) for key in keys])\
+            .let(alias, query.DOCUMENT(handle))\
+            .action(query.Object({
+                'edge': alias,
+                'from': query.DOCUMENT(alias._from),
+                'to': query.DOCUMENT(alias._to),
+            }))
+
+        edges = []
+        for row in q.cursor.iter_result():
+            if row['edge'] is None:
+                edges.append(None)
+                continue
+
+            # pylint: disable=W0212
+            meta.BaseDocument._cache_loaded((row['edge'], row['from'], row['to']))
+
+            edge = meta.BaseDocument._polymorph(cls.deserialize(row['edge']))
+
+            for key, name in (('_from', 'from'), ('_to', 'to')):
+                if row[name] is not None:
+                    edge.__endpoints__[key] = meta.BaseDocument._polymorph(Document.deserialize(row[name]))
+
+            edges.append(edge)
+
+        if strict:
+            cls._check_missing(keys, edges)
+
+        return edges
+
+    @classmethod
+    def _traversal(cls, start, direction, collection=None):
+        """A traversal to the direct neighbors of start, optionally restricted to a document class."""
+
+        options = {}
+        if collection is not None:
+            options['vertexCollections'] = [collection.__collection_name__]
+
+        return query.Traversal(start, cls, direction=direction, options=options)
+
+    @classmethod
+    def connections_query(cls, alias, document, direction=EDGE_DIRECTION_ANY, collection=None):
+        """Query the direct neighbors of document by a traversal over this edge collection.
+
+        :param collection: restrict the neighbors to this document class
+        """
+
         assert isinstance(document, meta.BaseDocument), "document is Document or Edge"
 
-        # pylint: disable=W0212
-        q = query.Query(
-            alias,
-            query.PATHS(
-                query.Collection(document),
-                query.Collection(cls),
-                direction)
-        )\
-            .filter(alias.source._id == document._id)\
-            .filter(query.LENGTH(alias.edges) == 1)\
-            .action(alias.destination)
+        q = query.Query(alias, cls._traversal(document, direction, collection))\
+            .action(alias)
 
         return q
 
     @classmethod
     def connections(cls, document, collection=None, direction=EDGE_DIRECTION_ANY):
-        alias = query.Alias('p')
-
-        q = cls.connections_query(alias, document, direction)
+        alias = query.Alias('v')
 
-        if collection is not None:
-            # pylint: disable=W0212
-            q = q\
-                .filter(query.FIND_FIRST(alias.destination._id, collection.__collection_name__) != -1)
+        q = cls.connections_query(alias, document, direction, collection=collection)
 
         return q.cursor.iter_documents()
 
+    @classmethod
+    def connections_many(cls, documents, collection=None, direction=EDGE_DIRECTION_ANY):
+        """Lookup the direct neighbors of all documents with one query.
+
+        :returns: an :py:class:`OrderedDict` of start `_id` to a list of neighbor documents
+        """
+
+        connections = OrderedDict((document['_id'], []) for document in documents)
+
+        start = query.Alias('start')
+        alias = query.Alias('v')
+
+        q = query.Query(start, list(connections))\
+            .join(alias, cls._traversal(start, direction, collection))\
+            .action(query.Object(start=start, vertex=alias))
+
+        for row in q.cursor.iter_result():
+            connections[row['start']].append(meta.BaseDocument._polymorph(row['vertex']))     # pylint: disable=W0212
+
+        return connections
+
     @classmethod
     def inbounds(cls, document, collection=None):
         return cls.connections(document, collection, direction=EDGE_DIRECTION_INBOUND)
@@ -164,48 +326,108 @@ class Edge(meta.EdgeBase, QueryMixin):
 
 class Index(meta.IndexBase):
 
-    """An index representation."""
+    """An index representation.
+
+    Indexes may be declared as attributes of a document class and are created
+    by :py:func:`sync_indexes`::
+
+        class Person(db.Document):
+            by_name = db.Hash('name', unique=True)
+            by_email = db.Persistent('email', sparse=True)
+
+    """
 
     collection = None
     index_type = None
     unique = False
+    sparse = None
 
+    def __init__(self, *fields, **kwargs):
+        """
+        :param fields: the indexed fields
+        :param unique: a unique index
+        :param sparse: do not index documents, which miss a field or have null
+        :param collection: a collection or document class, if not declared in a class
+        """
 
-INDEX_TYPE_HASH = "hash"
+        self.fields = list(fields)
 
+        self.unique = kwargs.pop('unique', self.unique)
+        self.sparse = kwargs.pop('sparse', self.sparse)
+        self.collection = kwargs.pop('collection', self.collection)
 
-class Hash(Index):
+        # type specific options
+        self.options = dict(api.remap_fields(kwargs, **INDEX_OPTIONS))
 
-    """A hash index."""
+    def __repr__(self):
+        return "<{0.__class__.__name__}: {0.collection_name} {0.fields}>".format(self)
 
-    collection = None
-    index_type = INDEX_TYPE_HASH
+    @property
+    def collection_name(self):
+        return getattr(self.collection, '__collection_name__', self.collection)
 
-    # unique can be setted at class level
-    unique = False
+    @property
+    def definition(self):
+        """The index definition for the server."""
 
-    def __init__(self, *fields, **kwargs):
-        self.fields = fields
+        definition = {'unique': self.unique}
+
+        if self.sparse is not None:
+            definition['sparse'] = self.sparse
+
+        definition.update(self.options)
 
-        if "unique" in kwargs:
-            self.unique = kwargs['unique']
+        return definition
 
-        if "collection" in kwargs:
-            self.collection = kwargs['collection']
+    def matches(self, index):
+        """:returns: True, if an index of the server is equal to this one"""
 
+        if index_kind(index['type']) != index_kind(self.index_type) or index.get('fields') != self.fields:
+            return False
+
+        return all(index.get(key, False) == value for key, value in iteritems(self.definition))
+
+    def _create(self, indexes_api):
         if self.collection is None:
             raise TypeError("No index collection specified!")
 
+        return indexes_api.create(self.collection_name, self.index_type, fields=self.fields, **self.definition)
+
     def save(self):
-        if isinstance(self.collection, meta.BaseDocument):
-            collection = self.collection.__collection_name__
+        return self._create(self.__class__.api)
+
+
+INDEX_TYPE_HASH = "hash"
+INDEX_TYPE_SKIPLIST = "skiplist"
+INDEX_TYPE_PERSISTENT = "persistent"
+INDEX_TYPE_GEO = "geo"
+INDEX_TYPE_FULLTEXT = "fulltext"
+INDEX_TYPE_TTL = "ttl"
+
+INDEX_OPTIONS = {
+    'geo_json': 'geoJson',
+    'min_length': 'minLength',
+    'expire_after': 'expireAfter',
+}
+
+
+def index_kind(index_type):
+    """Hash and skiplist indexes are just persistent ones with RocksDB, geo indexes may be reported as geo1/geo2."""
+
+    if index_type in (INDEX_TYPE_HASH, INDEX_TYPE_SKIPLIST, INDEX_TYPE_PERSISTENT):
+        return INDEX_TYPE_PERSISTENT
+
+    if index_type.startswith(INDEX_TYPE_GEO):
+        return INDEX_TYPE_GEO
+
+    return index_type
 
-        else:
-            collection = self.collection
 
-        result = self.api.create(collection, self.index_type, fields=self.fields, unique=self.unique)
+class Hash(Index):
 
-        return result
+    """A hash index."""
+
+    index_type = INDEX_TYPE_HASH
 
 
 class UniqueHash(Hash):
@@ -213,3 +435,69 @@ class UniqueHash(Hash):
     """A unique hash index."""
 
     unique = True
+
+
+class Skiplist(Index):
+
+    """A sorted index for ranges."""
+
+    index_type = INDEX_TYPE_SKIPLIST
+
+
+class Persistent(Index):
+
+    """A sorted index."""
+
+    index_type = INDEX_TYPE_PERSISTENT
+
+
+class Geo(Index):
+
+    """A geo index of a `[lat, lon]` field, a `geo_json` field or two fields."""
+
+    index_type = INDEX_TYPE_GEO
+
+
+class Fulltext(Index):
+
+    """A fulltext index of a field with an optional `min_length` of words."""
+
+    index_type = INDEX_TYPE_FULLTEXT
+
+
+class TTL(Index):
+
+    """Remove documents `expire_after` seconds after the date of a field."""
+
+    index_type = INDEX_TYPE_TTL
+
+    def __init__(self, field, expire_after, **kwargs):
+        super(TTL, self).__init__(field, expire_after=expire_after, **kwargs)
+
+
+def sync_indexes(documents=None, threads=8):
+    """Create all declared indexes, which are missing on the server, in parallel for all collections.
+
+    :param documents: the document classes, defaults to all with declared indexes
+    :param threads: the max count of collections synced at once
+    :returns: an :py:class:`OrderedDict` of collection name to created indexes
+    """
+
+    if documents is None:
+        documents = [cls for cls in itervalues(meta.BaseDocument.__documents__) if cls.__indexes__]
+
+    documents = list(documents)
+
+    if not documents:
+        return OrderedDict()
+
+    pool = ThreadPool(min(threads, len(documents)))
+
+    try:
+        created = pool.map(lambda cls: cls.sync_indexes(), documents)
+
+    finally:
+        pool.close()
+        pool.join()
+
+    return OrderedDict((cls.__collection_name__, indexes) for cls, indexes in zip(documents, created))
@@ -51,6 +51,18 @@ class Unauthorized(ArangoException):
     pass
 
 
+class TransactionError(ArangoException):
+    pass
+
+
+class PregelFailed(ArangoException):
+    pass
+
+
+class PregelTimeout(PregelFailed):
+    pass
+
+
 class ApiError(with_metaclass(MetaApiError, ArangoException)):
     """Raise when an api error occurs."""
 
@@ -70,6 +82,10 @@ class ApiError(with_metaclass(MetaApiError, ArangoException)):
 
 # basically an implementation of https://docs.arangodb.com/ErrorCodes/README.html
 
+class DocumentNotFound(ApiError):
+    error_num = 1202
+
+
 class CollectionNotFound(ApiError):
     error_num = 1203
 
@@ -100,3 +116,7 @@ class EdgeCollectionAlreadyUsed(GraphError):
 
 class GraphNotFound(GraphError):
     error_num = 1924
+
+
+class InvalidEdge(GraphError):
+    error_num = 1935
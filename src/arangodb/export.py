@@ -0,0 +1,198 @@
+"""Write batches of results to files."""
+
+from contextlib import contextmanager
+
+import bz2
+import csv
+import gzip
+import io
+import json
+
+import six
+
+
+class BZ2Writer(io.RawIOBase):
+
+    """Compress into a binary file object, which :py:class:`bz2.BZ2File` of python 2 can not."""
+
+    def __init__(self, fileobj):
+        super(BZ2Writer, self).__init__()
+        self.fileobj = fileobj
+        self.compressor = bz2.BZ2Compressor()
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self.fileobj.write(self.compressor.compress(bytes(data) if six.PY3 else data))
+        return len(data)
+
+    def close(self):
+        if not self.closed:
+            self.fileobj.write(self.compressor.flush())
+
+        super(BZ2Writer, self).close()
+
+
+COMPRESSIONS = {
+    'gzip': lambda fileobj: gzip.GzipFile(fileobj=fileobj, mode='wb'),
+    'bz2': BZ2Writer,
+}
+
+
+@contextmanager
+def open_output(path_or_fileobj, compression=None):
+    """Open a text file for writing, optionally compressed.
+
+    A file object for a compressed output has to be binary.
+    """
+
+    if compression is not None and compression not in COMPRESSIONS:
+        raise TypeError("Unknown compression: {0}".format(compression))
+
+    if isinstance(path_or_fileobj, six.string_types):
+        if compression is None:
+            with io.open(path_or_fileobj, 'w', encoding='utf-8', newline='') as text:
+                yield text
+
+            return
+
+        with io.open(path_or_fileobj, 'wb') as fileobj:
+            with open_output(fileobj, compression) as text:
+                yield text
+
+        return
+
+    if compression is None:
+        yield path_or_fileobj
+        return
+
+    compressed = COMPRESSIONS[compression](path_or_fileobj)
+
+    text = io.TextIOWrapper(compressed, encoding='utf-8', newline='')
+    try:
+        yield text
+
+    finally:
+        text.flush()
+        # just close the compressor and not the file object
+        text.detach()
+        compressed.close()
+
+
+MISSING = object()
+
+
+def field_getter(field):
+    """:returns: a function to get a field, which may be a dotted path, from a dict or :py:data:`MISSING`"""
+
+    path = field.split('.')
+
+    def get(dct):
+        for name in path:
+            try:
+                dct = dct[name]
+
+            except (KeyError, TypeError, IndexError):
+                return MISSING
+
+        return dct
+
+    return get
+
+
+def iter_projected(batch, fields):
+    getters = [(field, field_getter(field)) for field in fields]
+
+    for row in batch:
+        yield [(field, get(row)) for field, get in getters]
+
+
+def write_jsonl(batches, fileobj, fields=None):
+    count = 0
+
+    for batch in batches:
+        if fields is not None:
+            batch = [
+                dict((field, value) for field, value in row if value is not MISSING)
+                for row in iter_projected(batch, fields)
+            ]
+
+        fileobj.write(u''.join(json.dumps(row) + u'\n' for row in batch))
+        count += len(batch)
+
+    return count
+
+
+def csv_value(value):
+    if value is MISSING or value is None:
+        return u''
+
+    if isinstance(value, (dict, list)):
+        return json.dumps(value)
+
+    return value
+
+
+def format_csv(rows):
+    """Format rows as CSV text, also with the bytes based csv module of python 2."""
+
+    buf = six.StringIO()
+    writer = csv.writer(buf)
+
+    if six.PY2:
+        rows = (
+            [value.encode('utf-8') if isinstance(value, six.text_type) else value for value in row]
+            for row in rows
+        )
+
+    writer.writerows(rows)
+    text = buf.getvalue()
+
+    return text.decode('utf-8') if six.PY2 else text
+
+
+def write_csv(batches, fileobj, fields=None):
+    """Write a header and all rows, nested values are JSON encoded.
+
+    Without fields, the fields of the first result are taken.
+    """
+
+    count = 0
+
+    for batch in batches:
+        if fields is None:
+            if not batch:
+                continue
+
+            fields = sorted(batch[0])
+
+        if not count:
+            fileobj.write(format_csv([fields]))
+
+        fileobj.write(format_csv(
+            [csv_value(value) for _, value in row]
+            for row in iter_projected(batch, fields)
+        ))
+        count += len(batch)
+
+    return count
+
+
+WRITERS = {
+    'jsonl': write_jsonl,
+    'csv': write_csv,
+}
+
+
+def export(batches, path_or_fileobj, format='jsonl', fields=None, compression=None):      # pylint: disable=W0622
+    """Write batches of results to a file, as soon as they arrive.
+
+    :returns: the count of written results
+    """
+
+    if format not in WRITERS:
+        raise TypeError("Unknown export format: {0}".format(format))
+
+    with open_output(path_or_fileobj, compression) as fileobj:
+        return WRITERS[format](batches, fileobj, fields)
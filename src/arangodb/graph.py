@@ -1,22 +1,222 @@
-import inspect
-from itertools import chain
+from collections import OrderedDict
 
-from six import with_metaclass
+from six import with_metaclass, iteritems
 
-from . import db, api, exc, meta
-
-
-import logging
-logging.basicConfig(level=logging.DEBUG)
+from . import meta, exc
 
 
 class GraphEdge(with_metaclass(meta.MetaGraphEdge, meta.GraphBase)):
-    pass
+    __slots__ = ()
 
 
 class GraphVertex(with_metaclass(meta.MetaGraphVertex, meta.GraphBase)):
-    pass
+    __slots__ = ()
+
+
+def save_grouped(documents, chunk=None, overwrite=False):
+    """Save documents of several classes in batches per class.
+
+    :returns: the results in order of documents, see :py:meth:`arangodb.meta.BaseDocument.save_many`
+    """
+
+    results = [None] * len(documents)
+
+    groups = OrderedDict()
+    for i, document in enumerate(documents):
+        groups.setdefault(document.__class__, []).append(i)
+
+    for cls, indexes in iteritems(groups):
+        # pylint: disable=W0212
+        saved = cls._save_many([documents[i] for i in indexes], chunk=chunk, overwrite=overwrite)
+
+        for i, result in zip(indexes, saved):
+            results[i] = result
+
+    return results
 
 
 class Graph(with_metaclass(meta.MetaGraph)):
-    pass
+
+    @classmethod
+    def adjacency_index(cls, interval=None, batch=10000):
+        """Load a local adjacency index of all edges of this graph.
+
+        See :py:class:`arangodb.adjacency.AdjacencyIndex`
+
+        :param interval: update the index every interval seconds
+        """
+
+        from . import adjacency
+
+        index = adjacency.AdjacencyIndex(cls, batch=batch).load()
+
+        if interval is not None:
+            index.start(interval)
+
+        return index
+
+    @classmethod
+    def pregel(cls, algorithm, store=True, result_field='result', **params):
+        """Start a pregel job for this graph.
+
+        :param algorithm: e.g. :py:data:`arangodb.pregel.PAGERANK`
+        :param store: write the results into the vertices, otherwise keep them for
+            :py:func:`arangodb.query.PREGEL_RESULT`
+        :param result_field: the vertex attribute of the result
+        :param params: algorithm specific parameters like `maxGSS` or `source`
+        :returns: a :py:class:`arangodb.pregel.PregelJob`
+        """
+
+        from . import pregel
+
+        params = dict(params, store=store, resultField=result_field)
+        job_id = cls.client.pregel.start(algorithm, graph=cls.__graph_name__, params=params)
+
+        return pregel.PregelJob(cls, job_id, store=store, result_field=result_field)
+
+    @classmethod
+    def pagerank(cls, **params):
+        from . import pregel
+
+        return cls.pregel(pregel.PAGERANK, **params)
+
+    @classmethod
+    def sssp(cls, source, **params):
+        """Single source shortest paths from a vertex or its `_id`."""
+
+        from . import pregel
+
+        if isinstance(source, meta.BaseDocument):
+            source = source['_id']
+
+        return cls.pregel(pregel.SSSP, source=source, **params)
+
+    @classmethod
+    def connected_components(cls, **params):
+        from . import pregel
+
+        return cls.pregel(pregel.CONNECTED_COMPONENTS, **params)
+
+    @classmethod
+    def label_propagation(cls, **params):
+        from . import pregel
+
+        return cls.pregel(pregel.LABEL_PROPAGATION, **params)
+
+    @classmethod
+    def shortest_path(cls, start, target, direction='any', weight=None, default_weight=None, **options):
+        """Search the shortest path between two vertices of this graph.
+
+        See :py:func:`arangodb.paths.shortest_path`
+        """
+
+        from . import paths
+
+        return paths.shortest_path(start, target, graph=cls, direction=direction, weight=weight,
+                                   default_weight=default_weight, **options)
+
+    @classmethod
+    def k_shortest_paths(cls, start, target, limit, direction='any', weight=None, default_weight=None, **options):
+        """Search the shortest paths between two vertices of this graph.
+
+        See :py:func:`arangodb.paths.k_shortest_paths`
+        """
+
+        from . import paths
+
+        return paths.k_shortest_paths(start, target, limit, graph=cls, direction=direction, weight=weight,
+                                      default_weight=default_weight, **options)
+
+    @classmethod
+    def export_adjacency(cls, vertex_collections=None, edge_collections=None, path=None, batch=10000):
+        """Export the outbound adjacency of this graph or a subgraph to compressed sparse rows.
+
+        See :py:func:`arangodb.adjacency.export_adjacency`
+
+        :param vertex_collections: defaults to all vertex collections of this graph
+        :param edge_collections: defaults to all edge collections of this graph
+        """
+
+        from . import adjacency
+
+        if vertex_collections is None:
+            vertex_collections = list(cls.__graph_vertices__)
+
+        if edge_collections is None:
+            edge_collections = list(cls.__graph_edges__)
+
+        return adjacency.export_adjacency(vertex_collections, edge_collections, path=path, batch=batch)
+
+    @classmethod
+    def _member(cls, members, document_cls, kind):
+        if members.get(document_cls.__collection_name__) is None:
+            raise TypeError("{0} is no {1} of graph {2}".format(document_cls.__name__, kind, cls.__graph_name__))
+
+    @classmethod
+    def bulk_load(cls, vertices=(), edges=(), chunk=1000, overwrite=False):
+        """Save vertices first and then edges in large batches.
+
+        Edges are edge documents or tuples of `(edge class, from vertex, to vertex[, dict])`,
+        whose vertices may be new ones of `vertices`. All edges are validated
+        locally by the graph definition, before any request is made.
+
+        :param chunk: the max count of documents per request
+        :param overwrite: replace existing documents with the same `_key`
+        :returns: a tuple of the results for vertices and edges, see
+            :py:meth:`arangodb.meta.BaseDocument.save_many`; an edge between
+            vertices, which could not be saved, has a :py:exc:`arangodb.exc.InvalidEdge`
+        """
+
+        vertices = list(vertices)
+
+        for vertex in vertices:
+            cls._member(cls.__graph_vertices__, vertex.__class__, 'vertex')
+
+        # (edge class, from vertex, to vertex, data) or an edge document
+        pending = []
+
+        # pylint: disable=W0212
+        for edge in edges:
+            if isinstance(edge, tuple):
+                edge_cls, from_vertex, to_vertex = edge[:3]
+                data = edge[3] if len(edge) > 3 else {}
+
+                cls._member(cls.__graph_edges__, edge_cls, 'edge')
+                edge_cls._validate_endpoints(from_vertex.__collection_name__, to_vertex.__collection_name__)
+
+                pending.append((edge_cls, from_vertex, to_vertex, data))
+
+            else:
+                cls._member(cls.__graph_edges__, edge.__class__, 'edge')
+                edge._validate()
+
+                pending.append(edge)
+
+        vertex_results = save_grouped(vertices, chunk=chunk, overwrite=overwrite)
+
+        edge_documents = []
+        edge_results = [None] * len(pending)
+
+        for i, edge in enumerate(pending):
+            if isinstance(edge, tuple):
+                edge_cls, from_vertex, to_vertex, data = edge
+
+                unsaved = [vertex for vertex in (from_vertex, to_vertex) if '_id' not in vertex]
+
+                if unsaved:
+                    edge_results[i] = exc.InvalidEdge(
+                        400, exc.InvalidEdge.error_num,
+                        "{0} has an unsaved vertex: {1}".format(edge_cls.__name__, unsaved[0]), args=()
+                    )
+                    continue
+
+                edge = edge_cls(from_vertex, to_vertex, **data)
+
+            edge_documents.append((i, edge))
+
+        saved = save_grouped([edge for _, edge in edge_documents], chunk=chunk, overwrite=overwrite)
+
+        for (i, _), result in zip(edge_documents, saved):
+            edge_results[i] = result
+
+        return vertex_results, edge_results
@@ -8,7 +8,7 @@ from itertools import chain
 
 from six import with_metaclass, itervalues, iteritems, iterkeys
 
-from . import api, exc
+from . import api, exc, transaction
 
 import logging
 
@@ -56,6 +56,23 @@ class MetaBase(type):
         raise NotImplementedError("There is no api implemented for the general meta class!")
 
 
+def _adoptable(base):
+    """:returns: the explicit `__adoptable__` of a base or its mro, otherwise if no plain class,
+        e.g. a mixin, customizes `__init__` or `__setitem__`"""
+
+    for cls in base.__mro__:
+        if cls is object:
+            continue
+
+        if '__adoptable__' in vars(cls):
+            return cls.__adoptable__
+
+        if '__init__' in vars(cls) or '__setitem__' in vars(cls):
+            return False
+
+    return True
+
+
 class MetaDocumentBase(MetaBase):
 
     """Document type.
@@ -75,12 +92,33 @@ class MetaDocumentBase(MetaBase):
         # stores an optional de/serializer
         cls.__objective__ = None
 
+        # declared indexes of this collection
+        cls.__indexes__ = []
+
+        for _, index in sorted((item for item in iteritems(dct) if isinstance(item[1], IndexBase)),
+                               key=lambda item: item[0]):
+            if index.collection is None:
+                index.collection = cls
+
+            cls.__indexes__.append(index)
+
+        # server documents may be adopted without calling __init__ and __setitem__,
+        # if the class does not customize them
+        if '__adoptable__' not in dct:
+            cls.__adoptable__ = '__init__' not in dct and '__setitem__' not in dct \
+                and all(_adoptable(base) for base in bases)
+
     def __new__(mcs, name, bases, dct):
 
         # we set our collection name to class name if not already done
         if '__collection_name__' not in dct:
             dct['__collection_name__'] = name
 
+        # compact documents have no instance dict
+        compact = dct.get('__compact__', any(getattr(base, '__compact__', False) for base in bases))
+        if compact and '__slots__' not in dct:
+            dct['__slots__'] = ()
+
         cls = type.__new__(mcs, name, bases, dct)
 
         # register our base class or a document class
@@ -105,10 +143,19 @@ class MetaDocumentBase(MetaBase):
         else:
             mcs.__documents__[cls.__collection_name__] = cls
 
+    @property
+    def __abstract__(cls):
+        """A library base class, which has no collection on the server."""
+
+        return cls.__dict__.get('__abstract__', False)
+
+    def _collection_type(cls):
+        return api.EDGE_COLLECTION if isinstance(cls, MetaEdgeBase) else api.DOCUMENT_COLLECTION
+
     def _create_collection(cls):
         """Try to create a collection."""
 
-        col_type = api.EDGE_COLLECTION if isinstance(cls, MetaEdgeBase) else api.DOCUMENT_COLLECTION
+        col_type = cls._collection_type()
 
         col = cls.client.collections.get(cls.__collection_name__)
         if col is None:
@@ -124,20 +171,92 @@ class MetaDocumentBase(MetaBase):
 
         LOG.info("Collection in use: %s", cls)
 
-    def _polymorph(cls, dct):
-        """Just create a proper instance for this dct."""
+    def _lookup(cls, _id, dct):
+        """Lookup the document class for an `_id`."""
 
         # dct must have an _id to infer collection
-        if '_id' not in dct or '/' not in dct['_id']:
+        if _id is None or '/' not in _id:
             raise TypeError("Cannot infer document type!", dct)
 
-        collection, _ = dct['_id'].split('/')
+        collection, _ = _id.split('/')
 
         # lookup type
         if collection not in cls.__documents__:
             raise TypeError("Unknown document type!", collection)
 
-        return cls.__documents__[collection](dct)
+        return cls.__documents__[collection]
+
+    def _polymorph(cls, dct):
+        """Just create a proper instance for this dct."""
+
+        document_cls = cls._lookup(dct.get('_id'), dct)
+
+        # pylint: disable=W0212
+        if document_cls.__adoptable__ and type(dct) is dict:
+            return document_cls._adopt(dct)
+
+        document = document_cls(dct)
+
+        # the document is in sync with the server
+        document._clean()
+
+        return document
+
+    def _polymorph_batch(cls, batch):
+        """Create proper instances for a batch of documents, in the same order.
+
+        The documents are grouped by collection, so that the document class is
+        looked up and the deserializer is applied once per collection.
+        """
+
+        documents = [None] * len(batch)
+
+        # collection -> indexes in batch
+        groups = OrderedDict()
+
+        for i, dct in enumerate(batch):
+            try:
+                _id = dct['_id']
+                collection = _id[:_id.index('/')]
+
+            except (KeyError, ValueError, AttributeError):
+                raise TypeError("Cannot infer document type!", dct)
+
+            groups.setdefault(collection, []).append(i)
+
+        for collection, indexes in iteritems(groups):
+            if collection not in cls.__documents__:
+                raise TypeError("Unknown document type!", collection)
+
+            document_cls = cls.__documents__[collection]
+
+            dcts = [batch[i] for i in indexes]
+            if document_cls.__objective__ is not None:
+                dcts = document_cls.deserialize_many(dcts)
+
+            # pylint: disable=W0212
+            if document_cls.__adoptable__:
+                adopt = document_cls._adopt
+
+                for i, dct in zip(indexes, dcts):
+                    documents[i] = adopt(dct) if type(dct) is dict else cls._polymorph(dct)
+
+            else:
+                for i, dct in zip(indexes, dcts):
+                    documents[i] = cls._polymorph(dct)
+
+        return documents
+
+    def _polymorph_lazy(cls, dct):
+        """Create a proper instance for a server document, which is deserialized on first access."""
+
+        document_cls = cls._lookup(dct.get('_id'), dct)
+
+        if not document_cls.__adoptable__ or document_cls.__objective__ is None or type(dct) is not dict:
+            # nothing to defer, an adopted document is its server document
+            return cls._polymorph(dct)
+
+        return document_cls._adopt({}, dct)         # pylint: disable=W0212
 
     @property
     def api(cls):
@@ -181,6 +300,11 @@ class MetaIndexBase(MetaBase):
         return cls.client.indexes
 
 
+class IndexBase(with_metaclass(MetaIndexBase)):
+
+    """An index representation."""
+
+
 class MetaQueryBase(MetaBase):
 
     @property
@@ -298,26 +422,43 @@ class MetaGraph(MetaBase):
     def __init__(cls, name, bases, dct):
         super(MetaGraph, cls).__init__(name, bases, dct)
 
-        cls.__graph_edges__ = {}
-        cls.__graph_vertices__ = {}
-
         # graph name is always the first none base
         if cls.__graph_base__ is not cls and cls.__graph_name__ is None:
             cls.__graph_name__ = name
 
-        # lookup graph classes to attach graph specific api proxy
-        for name in dir(cls):
-
-            attr = getattr(cls, name)
-            if isinstance(attr, MetaGraphEdge) or isinstance(attr, MetaGraphVertex):
+        # attach the graph specific api proxy to graph classes of this class body,
+        # inherited ones already belong to the base graph
+        for attr in itervalues(dct):
+            if isinstance(attr, (MetaGraphEdge, MetaGraphVertex)):
                 attr.__graph__ = cls
 
-                # collect graph edges and vertices
-                if isinstance(attr, MetaGraphEdge):
-                    cls.__graph_edges__[attr.__collection_name__] = attr
+    def _members(cls):
+        """Collect graph edges and vertices of this class and its bases on first use."""
+
+        members = cls.__dict__.get('__graph_members__')
+
+        if members is None:
+            edges, vertices = {}, {}
+
+            for base in reversed(cls.__mro__):
+                for attr in itervalues(vars(base)):
+                    if isinstance(attr, MetaGraphEdge):
+                        edges[attr.__collection_name__] = attr
+
+                    elif isinstance(attr, MetaGraphVertex):
+                        vertices[attr.__collection_name__] = attr
+
+            members = cls.__graph_members__ = edges, vertices
+
+        return members
+
+    @property
+    def __graph_edges__(cls):
+        return cls._members()[0]
 
-                else:
-                    cls.__graph_vertices__[attr.__collection_name__] = attr
+    @property
+    def __graph_vertices__(cls):
+        return cls._members()[1]
 
     @property
     def __definition__(cls):
@@ -386,48 +527,127 @@ def polymorph(wrapped):
 
 class BaseDocument(with_metaclass(MetaDocumentBase)):
 
-    """Is an object, which is able to connect to a session."""
+    """Is an object, which is able to connect to a session.
+
+    A subclass may set `__compact__ = True` to get documents without an
+    instance dict, which also skip copying their data on de/serialization.
+    So a serialized compact document is its data and must not be modified.
+    """
+
+    __slots__ = ('__data__', '__dirty__', '__raw__', '__partial__')
+
+    __compact__ = False
+    __adoptable__ = True
+
+    # an optional :py:class:`arangodb.cache.DocumentCache`
+    __cache__ = None
 
     def __init__(self, *args, **kwargs):
-        self.__data__ = {}
+        self._init({})
 
         # we have to call __setitem__
         self.update(*args, **kwargs)
 
+    def _init(self, data, raw=None):
+        """Initialize the instance state."""
+
+        self.__data__ = data
+
+        # the keys set or deleted since load or save
+        self.__dirty__ = set()
+
+        # the server document, which is not deserialized yet
+        self.__raw__ = raw
+
+        # only some fields were loaded, so the document must never be replaced
+        self.__partial__ = False
+
+    @classmethod
+    def _adopt(cls, data, raw=None):
+        """Create a clean instance, which owns data, without copying it or calling `__setitem__`."""
+
+        document = cls.__new__(cls)
+        document._init(data, raw)            # pylint: disable=W0212
+
+        return document
+
+    def _materialize(self):
+        """Deserialize a lazy document."""
+
+        raw, self.__raw__ = self.__raw__, None
+
+        if raw is not None:
+            self.__data__ = self.deserialize(raw)
+
     def __setitem__(self, key, value):
+        if self.__raw__ is not None:
+            self._materialize()
+
         self.__data__[key] = value
+        self.__dirty__.add(key)
 
     def __getitem__(self, key):
+        if self.__raw__ is not None:
+            self._materialize()
+
         return self.__data__[key]
 
     def __delitem__(self, key):
+        if self.__raw__ is not None:
+            self._materialize()
+
         del self.__data__[key]
+        self.__dirty__.add(key)
 
     def __contains__(self, key):
+        if self.__raw__ is not None:
+            self._materialize()
+
         return key in self.__data__
 
     def __iter__(self):
+        self._materialize()
+
         return self.__data__.__iter__()
 
     def keys(self):
+        self._materialize()
+
         return self.__data__.keys()
 
     def iteritems(self):
+        self._materialize()
+
         return iteritems(self.__data__)
 
     def iterkeys(self):
+        self._materialize()
+
         return iterkeys(self.__data__)
 
     def itervalues(self):
+        self._materialize()
+
         return itervalues(self.__data__)
 
     def copy(self):
+        self._materialize()
+
         clone = self.__class__()
         clone.__data__ = self.__data__.copy()
+        clone.__dirty__ = self.__dirty__.copy()
+        clone.__partial__ = self.__partial__
         return clone
 
     def update(self, *args, **kwargs):
-        for key, value in iteritems(dict(*args, **kwargs)):
+        if len(args) == 1 and not kwargs and isinstance(args[0], dict):
+            # no need for a copy
+            items = iteritems(args[0])
+
+        else:
+            items = iteritems(dict(*args, **kwargs))
+
+        for key, value in items:
             self[key] = value
 
     def get(self, key, default=None):
@@ -461,13 +681,61 @@ class BaseDocument(with_metaclass(MetaDocumentBase)):
         self['_rev'] = value
 
     @classmethod
-    def _iter_all(cls):
-        """query all documents and create instances.
+    def _handle(cls, key):
+        """Return the document handle for a key of this collection, or the handle itself."""
+
+        if '/' in key:
+            return key
+
+        return '/'.join((cls.__collection_name__, key))
+
+    @classmethod
+    def sync_indexes(cls):
+        """Create the declared indexes, which are missing on the server.
+
+        :returns: the created indexes
+        """
+
+        if not cls.__indexes__:
+            return []
+
+        indexes_api = cls.client.indexes
+        existing = indexes_api.get(cls.__collection_name__)['indexes']
+
+        created = []
+        for index in cls.__indexes__:
+            if not any(index.matches(other) for other in existing):
+                LOG.info("Create index: %s", index)
+                created.append(index._create(indexes_api))         # pylint: disable=W0212
+
+        return created
+
+    @classmethod
+    def _iter_all(cls, batch=None, fields=None, prefetch=False):
+        """Scan all documents of the collection batch by batch and create instances.
 
-        This can be very big, use this just for debugging!
+        :param batch: the count of documents per batch
+        :param fields: only load these fields, a partial document is always saved as a patch
+        :param prefetch: fetch the next batch, while the current one is processed
         """
-        for _id in cls.api.get(cls.__collection_name__)['documents']:
-            yield cls.load(_id)
+
+        from .cursor import CollectionCursor
+
+        kwargs = {} if batch is None else {'batch': batch}
+
+        if fields is None:
+            return CollectionCursor(cls, prefetch=prefetch, **kwargs).iter_documents()
+
+        fields = list(fields) + [field for field in ('_id', '_key', '_rev') if field not in fields]
+
+        return cls._iter_partial(CollectionCursor(cls, fields=fields, prefetch=prefetch, **kwargs).iter_documents())
+
+    @staticmethod
+    def _iter_partial(documents):
+        for document in documents:
+            document.__partial__ = True
+
+            yield document
 
     @classmethod
     def _create(cls, doc):
@@ -482,14 +750,37 @@ class BaseDocument(with_metaclass(MetaDocumentBase)):
         if cls.__objective__ is not None:
             return cls.__objective__.deserialize(doc)
 
+        if cls.__compact__:
+            return doc
+
         return doc.copy()
 
+    @classmethod
+    def deserialize_many(cls, docs):
+        """Take the deserializer to validate a batch of documents.
+
+        An objective may implement `deserialize_many` for a faster batch.
+        """
+
+        if cls.__objective__ is not None:
+            deserialize_many = getattr(cls.__objective__, 'deserialize_many', None)
+
+            if deserialize_many is not None:
+                return deserialize_many(docs)
+
+        return [cls.deserialize(doc) for doc in docs]
+
     def serialize(self):
         """Take the serializer to adjust the document."""
 
+        self._materialize()
+
         if self.__objective__ is not None:
             return self.__objective__.serialize(self.__data__)
 
+        if self.__compact__:
+            return self.__data__
+
         return self.__data__.copy()
 
     @classmethod
@@ -503,33 +794,265 @@ class BaseDocument(with_metaclass(MetaDocumentBase)):
         else:
             name = cls.__collection_name__
 
-        doc = cls.api.get(name, key)
+        cache = cls.__documents__.get(name, cls).__cache__
+
+        if cache is None:
+            doc = cls.api.get(name, key)
+
+        else:
+            doc = cache.load(cls.api, name, key)
 
         return cls.deserialize(doc)
 
-    def save(self):
-        """Save the document to db or update."""
+    def _clean(self):
+        """Forget all modifications."""
 
-        serialized = self.serialize()
+        self.__dirty__.clear()
+
+    @property
+    def dirty(self):
+        """True, if a key was set or deleted since load or save."""
+
+        return bool(self.__dirty__)
+
+    def _patch(self, serialized):
+        """Collect the modified fields for a partial update.
+
+        Deleted keys are sent as `null` without keeping nulls on the server.
+
+        :returns: a tuple of the patch and the keepNull flag or `None`, if the document has to be replaced
+        """
+
+        if self.__objective__ is not None:
+            # we cannot map the modified keys to serialized ones
+            return None
+
+        dirty = self.__dirty__.difference(('_id', '_key', '_rev'))
+
+        patch = dict((key, serialized[key]) for key in dirty if key in serialized)
+        deleted = [key for key in dirty if key not in serialized]
+
+        if not deleted:
+            return patch, True
+
+        if any(value is None for value in itervalues(patch)):
+            # a null value would be deleted together with the deleted keys
+            return None
+
+        patch.update((key, None) for key in deleted)
+
+        return patch, False
+
+    @classmethod
+    def _cache_loaded(cls, docs):
+        """Put raw documents, which were loaded by a query, into the cache of their class.
+
+        So documents loaded in bulk are as current in the cache as those of :py:meth:`load`.
+        """
+
+        for doc in docs:
+            if doc is None:
+                continue
+
+            document_cls = cls.__documents__.get(doc['_id'].split('/')[0])
+
+            if document_cls is not None and document_cls.__cache__ is not None:
+                document_cls.__cache__.put(doc)
+
+    def _saved(self, serialized, doc):
+        """Update self and the cache by the server response of a save."""
+
+        meta_fields = dict((k, doc[k]) for k in ('_id', '_key', '_rev'))
+
+        self.update(meta_fields)
+        self._clean()
+
+        if self.__cache__ is not None:
+            self.__cache__.put(dict(serialized, **meta_fields))
+
+    def _deleted(self):
+        if self.__cache__ is not None:
+            self.__cache__.evict(self['_id'])
+
+    def _operation(self, serialized):
+        """:returns: a tuple of `create`, `replace` or `update`, the document to send and the keepNull flag or
+            `None`, if nothing was modified"""
 
         # test for existing key
-        if '_id' in self:
-            # replace
-            doc = self.__class__.api.replace(serialized, self['_id'])
+        if '_id' not in self:
+            return 'create', serialized, None
 
-        else:
-            # create
+        patch = self._patch(serialized)
+
+        if patch is None and self.__partial__:
+            # a replace would delete all fields, which were not loaded
+            if not self.__dirty__:
+                return None
+
+            if any(key not in self.__data__ for key in self.__dirty__):
+                raise exc.ArangoException("A partial document cannot be saved with deleted fields", self)
+
+            return 'update', serialized, True
+
+        if patch is None:
+            return 'replace', serialized, None
+
+        if not patch[0]:
+            # nothing to do
+            return None
+
+        # update only the modified fields
+        return 'update', patch[0], patch[1]
+
+    def _save(self, api):
+        serialized = self.serialize()
+        operation = self._operation(serialized)
+
+        if operation is None:
+            return
+
+        kind, doc, keep = operation
+
+        if kind == 'create':
             doc = self._create(serialized)
 
+        elif kind == 'replace':
+            doc = api.replace(serialized, self['_id'])
+
+        else:
+            doc = api.update(doc, self['_id'], keep=keep, merge=False)
+
         # update self
-        for k in ('_id', '_key', '_rev'):
-            self[k] = doc[k]
+        self._saved(serialized, doc)
+
+    def save(self):
+        """Save the document to db or update only its modified fields.
+
+        If nothing was modified since load or save, no request is made. Since
+        only set or deleted keys are tracked, you have to set a key again after
+        modifying a nested value in place.
+        """
+
+        current = transaction.collecting(self.__class__)
+
+        if current is not None:
+            current.save(self)
+            return
+
+        self._save(self.__class__.api)
 
     def delete(self):
         """Delete a document."""
 
+        current = transaction.collecting(self.__class__)
+
+        if current is not None:
+            current.delete(self)
+            return None
+
+        self._deleted()
+
         return self.__class__.api.delete(self['_id'])
 
+    @staticmethod
+    def _iter_chunks(items, chunk=None):
+        if chunk is None:
+            chunk = len(items) or 1
+
+        for i in range(0, len(items), chunk):
+            yield items[i:i + chunk]
+
+    @classmethod
+    def _save_many(cls, documents, chunk=None, overwrite=False):
+        client = cls.client
+        transaction.check_not_collecting(client, "Saving many documents")
+
+        # the document api handles also edges
+        documents_api = client.documents
+
+        results = [None] * len(documents)
+
+        # (collection, method, options) -> [(index, serialized, body)]
+        groups = OrderedDict()
+
+        # pylint: disable=W0212
+        for i, document in enumerate(documents):
+            serialized = document.serialize()
+            operation = document._operation(serialized)
+
+            if operation is None:
+                continue
+
+            kind, body, keep = operation
+
+            if kind == 'create':
+                method, options = 'create_many', (('overwrite', overwrite), )
+
+            elif kind == 'replace':
+                method, options = 'replace_many', ()
+
+            else:
+                method, options = 'update_many', (('keep', keep), ('merge', False))
+                body = dict(body, _key=document['_key'])
+
+            groups.setdefault((document.__collection_name__, method, options), []).append((i, serialized, body))
+
+        for (collection, method, options), items in iteritems(groups):
+            for part in cls._iter_chunks(items, chunk):
+                saved = getattr(documents_api, method)(collection, [body for _, _, body in part], **dict(options))
+
+                for (i, serialized, _), result in zip(part, saved):
+                    if not isinstance(result, exc.ApiError):
+                        documents[i]._saved(serialized, result)
+
+                    results[i] = result
+
+        return results
+
+    @classmethod
+    def save_many(cls, documents, chunk=None, overwrite=False):
+        """Save many documents with one request per collection, kind of change and chunk.
+
+        New documents are created, modified ones are updated or replaced like in :py:meth:`save`.
+
+        :param chunk: the max count of documents per request
+        :param overwrite: replace existing documents with the same `_key` on create, or an `overwriteMode`
+        :returns: a list of meta data, :py:class:`arangodb.exc.ApiError` or `None` for unmodified documents
+        """
+
+        return cls._save_many(list(documents), chunk=chunk, overwrite=overwrite)
+
+    @classmethod
+    def delete_many(cls, documents, chunk=None):
+        """Delete many documents with one request per collection and chunk.
+
+        :returns: a list of meta data or :py:class:`arangodb.exc.ApiError` per document
+        """
+
+        client = cls.client
+        transaction.check_not_collecting(client, "Deleting many documents")
+
+        documents = list(documents)
+        results = [None] * len(documents)
+
+        groups = OrderedDict()
+        for i, document in enumerate(documents):
+            groups.setdefault(document.__collection_name__, []).append(i)
+
+        documents_api = client.documents
+
+        for collection, indexes in iteritems(groups):
+            for part in cls._iter_chunks(indexes, chunk):
+                deleted = documents_api.delete_many(collection, [documents[i]['_key'] for i in part])
+
+                for i, result in zip(part, deleted):
+                    if not isinstance(result, exc.ApiError):
+                        documents[i]._deleted()         # pylint: disable=W0212
+
+                    results[i] = result
+
+        return results
+
     def __str__(self):
         return self.get(
             '_id',
@@ -543,24 +1066,25 @@ class DocumentBase(with_metaclass(MetaDocumentBase, BaseDocument)):
 
     """Just an arangodb document."""
 
+    __slots__ = ()
+
+    __abstract__ = True
+
 
 class EdgeBase(with_metaclass(MetaEdgeBase, BaseDocument)):
-    pass
+    __slots__ = ()
 
 
 class CursorBase(with_metaclass(MetaCursorBase)):
     pass
 
 
-class IndexBase(with_metaclass(MetaIndexBase)):
-
-    """An index representation."""
-
-
 class GraphBase(object):
 
     """The base class for edges and vertices."""
 
+    __slots__ = ()
+
     __graph__ = None
 
     @classmethod
@@ -570,24 +1094,101 @@ class GraphBase(object):
         return cls.graph_api.create(cls.__collection_name__, doc)
 
     def save(self):
-        """Save the document to db or update."""
+        """Save the document to db or update only its modified fields."""
 
-        serialized = self.serialize()
+        current = transaction.collecting(self.__class__)
 
-        # test for existing key
-        if '_id' in self:
-            # replace
-            doc = self.__class__.graph_api.replace(serialized, self['_id'])
+        if current is not None:
+            self._validate()
+            current.save(self)
+            return
 
-        else:
-            # create
-            doc = self._create(serialized)
-
-        # update self
-        for k in ('_id', '_key', '_rev'):
-            self[k] = doc[k]
+        self._save(self.__class__.graph_api)
 
     def delete(self):
         """Delete a document."""
 
+        current = transaction.collecting(self.__class__)
+
+        if current is not None:
+            current.delete(self)
+            return None
+
+        self._deleted()
+
         return self.__class__.graph_api.delete(self['_id'])
+
+    def _validate(self):
+        """Raise :py:exc:`arangodb.exc.InvalidEdge`, if an edge does not connect the vertices of its definition."""
+
+        self._validate_endpoints(*[self._endpoint_collection(field) for field in ('_from', '_to')])
+
+    def _endpoint_collection(self, key):
+        # a document, which is created in the same transaction, has no `_id` yet
+        endpoint = getattr(self, '__endpoints__', {}).get(key)
+
+        if key not in self and endpoint is not None:
+            return endpoint.__collection_name__
+
+        return (self.get(key) or '').split('/')[0]
+
+    @classmethod
+    def _validate_endpoints(cls, from_collection, to_collection):
+        """Raise :py:exc:`arangodb.exc.InvalidEdge`, if the definition has no edge between these collections."""
+
+        for collection, vertices in (
+                (from_collection, getattr(cls, '__from_vertices__', None)),
+                (to_collection, getattr(cls, '__to_vertices__', None))
+        ):
+            if vertices and collection not in [vertex.__collection_name__ for vertex in vertices]:
+                raise exc.InvalidEdge(400, exc.InvalidEdge.error_num,
+                                      "`{0}` is not a vertex collection of {1}".format(collection, cls.__name__),
+                                      args=())
+
+    @classmethod
+    def save_many(cls, documents, chunk=None, overwrite=False):
+        """Validate all edges by the graph definition, before saving them.
+
+        See :py:meth:`BaseDocument.save_many`
+        """
+
+        documents = list(documents)
+
+        for document in documents:
+            document._validate()        # pylint: disable=W0212
+
+        return cls._save_many(documents, chunk=chunk, overwrite=overwrite)
+
+    @classmethod
+    def delete_many(cls, documents, chunk=None):
+        """Delete many documents and like the graph api also all edges of deleted vertices.
+
+        See :py:meth:`BaseDocument.delete_many`
+        """
+
+        from . import query
+
+        documents = list(documents)
+        results = super(GraphBase, cls).delete_many(documents, chunk=chunk)
+
+        vertices = [
+            document['_id']
+            for document, result in zip(documents, results)
+            if not isinstance(document.__class__, MetaGraphEdge) and not isinstance(result, exc.ApiError)
+        ]
+
+        if vertices and cls.__graph__ is not None:
+            alias = query.Alias('edge')
+
+            for edge in itervalues(cls.__graph__.__graph_edges__):
+                q = query.Query(alias, query.Collection(edge))\
+                    .filter(query.Operator(
+                        query.Operator(alias._from, vertices, query._IN),        # pylint: disable=W0212
+                        query.Operator(alias._to, vertices, query._IN),          # pylint: disable=W0212
+                        query._OR                                                # pylint: disable=W0212
+                    ))\
+                    .action(query.Remove(alias, edge))
+
+                list(q.cursor.iter_result())
+
+        return results
@@ -0,0 +1,108 @@
+"""Shortest paths between vertices, searched on the server."""
+
+from numbers import Number
+
+from . import meta, query
+
+
+class Path(object):
+
+    """A path of vertex and edge documents.
+
+    The edge `edges[i]` connects `vertices[i]` and `vertices[i + 1]`.
+    """
+
+    def __init__(self, vertices, edges, weight):
+        self.vertices = vertices
+        self.edges = edges
+        self.weight = weight
+
+    def __repr__(self):
+        return "<{0.__class__.__name__}: {ids}>".format(self, ids=" -> ".join(v['_id'] for v in self.vertices))
+
+    def __len__(self):
+        """The count of edges."""
+
+        return len(self.edges)
+
+    def __iter__(self):
+        return iter(self.vertices)
+
+    @property
+    def start(self):
+        return self.vertices[0]
+
+    @property
+    def target(self):
+        return self.vertices[-1]
+
+    @classmethod
+    def _from_raw(cls, vertices, edges, weight):
+        # pylint: disable=W0212
+        return cls(meta.BaseDocument._polymorph_batch(vertices), meta.BaseDocument._polymorph_batch(edges), weight)
+
+
+def _weight(edges, weight=None, default_weight=None):
+    """The weight of a path like the server: the default weight is used for a missing or non-numeric value."""
+
+    if weight is None:
+        return len(edges)
+
+    default_weight = 1 if default_weight is None else default_weight
+
+    return sum(
+        value if isinstance(value, Number) and not isinstance(value, bool) else default_weight
+        for value in (edge.get(weight) for edge in edges)
+    )
+
+
+def shortest_path(start, target, edges=None, graph=None, direction='any', weight=None, default_weight=None,
+                  **options):
+    """Search the shortest path between two vertices of a graph or of edge collections.
+
+    See :py:class:`arangodb.query.ShortestPath`
+
+    :returns: a :py:class:`Path` or `None`, if the vertices are not connected
+    """
+
+    vertex, edge = query.Alias('vertex'), query.Alias('edge')
+
+    q = query.Query((vertex, edge), query.ShortestPath(
+        start, target, edges=edges, graph=graph, direction=direction,
+        weight=weight, default_weight=default_weight, options=options
+    )).action(query.Object(vertex=vertex, edge=edge))
+
+    rows = list(q.cursor.iter_result())
+
+    if not rows:
+        return None
+
+    # the start has no edge
+    path_edges = [row['edge'] for row in rows[1:]]
+
+    return Path._from_raw(                  # pylint: disable=W0212
+        [row['vertex'] for row in rows], path_edges, _weight(path_edges, weight, default_weight)
+    )
+
+
+def k_shortest_paths(start, target, limit, edges=None, graph=None, direction='any', weight=None,
+                     default_weight=None, **options):
+    """Search the shortest paths between two vertices of a graph or of edge collections.
+
+    See :py:class:`arangodb.query.KShortestPaths`
+
+    :param limit: the max count of paths
+    :returns: a list of :py:class:`Path` in order of their weight
+    """
+
+    path = query.Alias('path')
+
+    q = query.Query(path, query.KShortestPaths(
+        start, target, edges=edges, graph=graph, direction=direction,
+        weight=weight, default_weight=default_weight, options=options
+    )).limit(limit).action(path)
+
+    return [
+        Path._from_raw(raw['vertices'], raw['edges'], raw['weight'])         # pylint: disable=W0212
+        for raw in q.cursor.iter_result()
+    ]
@@ -0,0 +1,114 @@
+"""Pregel jobs for graph algorithms on the server."""
+
+from . import query, exc
+
+import time
+import logging
+
+LOG = logging.getLogger(__name__)
+
+
+PAGERANK = 'pagerank'
+SSSP = 'sssp'
+CONNECTED_COMPONENTS = 'connectedcomponents'
+LABEL_PROPAGATION = 'labelpropagation'
+
+STATE_RUNNING = 'running'
+STATE_STORING = 'storing'
+STATE_DONE = 'done'
+STATE_CANCELED = 'canceled'
+STATE_IN_ERROR = 'in error'
+STATE_FATAL_ERROR = 'fatal error'
+
+# a job in one of these states will not change anymore
+FINAL_STATES = (STATE_DONE, STATE_CANCELED, STATE_IN_ERROR, STATE_FATAL_ERROR)
+
+
+class PregelJob(object):
+
+    """A pregel job of a graph.
+
+    Without storing, the results are kept on the server and are read by
+    :py:func:`arangodb.query.PREGEL_RESULT`::
+
+        job = MyGraph.pregel(pregel.PAGERANK, maxGSS=50)
+        job.wait()
+
+        for vertex in job.iter_results():
+            print(vertex['_key'], vertex['result'])
+
+    """
+
+    def __init__(self, graph, job_id, store=True, result_field='result'):
+        self.graph = graph
+        self.id = job_id
+        self.store = store
+        self.result_field = result_field
+
+    def __repr__(self):
+        return "<{0.__class__.__name__}: {0.id}>".format(self)
+
+    @property
+    def api(self):
+        return self.graph.client.pregel
+
+    def status(self):
+        """:returns: the status of the job, e.g. its `state`, `gss` and `totalRuntime`"""
+
+        return self.api.status(self.id)
+
+    def cancel(self):
+        """Cancel the job and drop its results."""
+
+        return self.api.cancel(self.id)
+
+    def wait(self, interval=1, timeout=None):
+        """Poll the status until the job is done.
+
+        :param interval: the seconds between two polls
+        :param timeout: raise :py:exc:`arangodb.exc.PregelTimeout` after these seconds
+        :returns: the final status
+        """
+
+        started = time.time()
+
+        while True:
+            status = self.status()
+
+            if status['state'] in FINAL_STATES:
+                break
+
+            if timeout is not None and time.time() - started > timeout:
+                raise exc.PregelTimeout("Pregel job did not finish in time", self, status)
+
+            LOG.debug("Pregel job %s is %s", self.id, status['state'])
+            time.sleep(interval)
+
+        if status['state'] != STATE_DONE:
+            raise exc.PregelFailed("Pregel job did not finish", self, status)
+
+        return status
+
+    def iter_queries(self, alias=None):
+        """Queries of all vertices with their result.
+
+        Stored results are read with `_id`, `_key` and the result field from each vertex collection.
+        """
+
+        if alias is None:
+            alias = query.Alias('vertex')
+
+        if not self.store:
+            yield query.Query(alias, query.PREGEL_RESULT(self.id)).action(alias)
+            return
+
+        for vertex in self.graph.__graph_vertices__.values():
+            yield query.Query(alias, query.Collection(vertex))\
+                .action(query.KEEP(alias, '_id', '_key', self.result_field))
+
+    def iter_results(self):
+        """Stream the results of all vertices through cursors."""
+
+        for q in self.iter_queries():
+            for result in q.cursor.iter_result():
+                yield result
@@ -4,12 +4,14 @@ See https://docs.arangodb.com/Aql/Basics.html for details
 
 """
 
+import json
+
 from functools import wraps
 from inspect import isclass
 
 from collections import defaultdict, OrderedDict
 
-from six import with_metaclass
+from six import with_metaclass, iteritems
 from six.moves import map, zip
 
 from . import meta, util, cursor
@@ -197,11 +199,22 @@ SORT = KeyWord("SORT")
 LIMIT = KeyWord("LIMIT")
 LET = KeyWord("LET")
 COLLECT = KeyWord("COLLECT")
+AGGREGATE = KeyWord("AGGREGATE")
+WITH_COUNT = KeyWord("WITH COUNT")
+DISTINCT = KeyWord("DISTINCT")
 INSERT = KeyWord("INSERT")
 UPDATE = KeyWord("UPDATE")
 REPLACE = KeyWord("REPLACE")
 REMOVE = KeyWord("REMOVE")
+UPSERT = KeyWord("UPSERT")
+OPTIONS = KeyWord("OPTIONS")
+PRUNE = KeyWord("PRUNE")
+GRAPH = KeyWord("GRAPH")
+ANY = KeyWord("ANY")
+INBOUND = KeyWord("INBOUND")
+OUTBOUND = KeyWord("OUTBOUND")
 WITH = KeyWord("WITH")
+TO = KeyWord("TO")
 ASC = KeyWord("ASC")
 DESC = KeyWord("DESC")
 IN = KeyWord("IN")
@@ -346,6 +359,31 @@ class In(Expression):
             yield expr
 
 
+class Object(Expression):
+
+    """An object literal: `{"key": expr, ...}`.
+
+    Keys are sorted to get a stable query.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.items = sorted(iteritems(dict(*args, **kwargs)))
+
+    def __iter__(self):
+        yield Term("{")
+
+        for i, (key, value) in enumerate(self.items):
+            if i:
+                yield Term(", ")
+
+            yield Term("{0}: ".format(json.dumps(key)))
+
+            for expr in Value.fix(value):
+                yield expr
+
+        yield Term("}")
+
+
 class Function(List):
 
     def __init__(self, *exprs):
@@ -428,6 +466,7 @@ class DATE_NOW(Function): pass
 
 # ARRAY
 class LENGTH(Function): pass
+class COUNT(Function): pass
 class FLATTEN(Function): pass
 class MIN(Function): pass
 class MAX(Function): pass
@@ -438,6 +477,9 @@ class PERCENTILE(Function): pass
 class VARIANCE_POPULATION(Function): pass
 class STDDEV_POPULATION(Function): pass
 class SDTDEV_SAMPLE(Function): pass
+class STDDEV_SAMPLE(Function): pass
+class VARIANCE_SAMPLE(Function): pass
+class COUNT_DISTINCT(Function): pass
 # class REVERSE(Function): pass
 class FIRST(Function): pass
 class LAST(Function): pass
@@ -487,6 +529,7 @@ class TRAVERSAL(Function): pass
 class TRAVERSAL_TREE(Function): pass
 class SHORTEST_PATH(Function): pass
 class PATHS(Function): pass
+class PREGEL_RESULT(Function): pass
 
 # MISC
 class NOT_NULL(Function): pass
@@ -528,16 +571,16 @@ class Operator(Chain):
         super(Operator, self).__init__((Value.fix(self.a), self.op, Value.fix(self.b)))
 
 
-class Let(Expression):
+class Assignment(Expression):
+
+    """Assign an expression to an alias: `alias = expr`."""
+
     def __init__(self, alias, expr):
         self.alias_expr = alias
 
         self.expr = Value.fix(expr)
 
     def __iter__(self):
-        yield LET
-        yield SPACE
-
         for expr in self.alias_expr:
             yield expr
 
@@ -548,6 +591,95 @@ class Let(Expression):
         for expr in self.expr:
             yield expr
 
+    @classmethod
+    def iter_assignments(cls, assignments, named):
+        """:returns: a generator of assignments from `(alias, expr)` tuples and keyword arguments.
+
+        Keyword arguments are sorted by name to get a stable query.
+        """
+
+        for assignment in assignments:
+            if not isinstance(assignment, Assignment):
+                assignment = cls(*assignment)
+
+            yield assignment
+
+        for name in sorted(named):
+            yield cls(Alias(name), named[name])
+
+
+class Let(Assignment):
+    def __iter__(self):
+        yield LET
+        yield SPACE
+
+        for expr in super(Let, self).__iter__():
+            yield expr
+
+
+class Collect(Expression):
+
+    """Group and aggregate on the server.
+
+    COLLECT [groups] [AGGREGATE aggregates] [WITH COUNT INTO alias]
+
+    See https://docs.arangodb.com/Aql/Operations/Collect.html
+    """
+
+    def __init__(self, *groups):
+        self.groups = List(groups)
+        self.aggregates = List(())
+        self.count_alias = None
+
+    def group(self, *assignments):
+        self.groups.extend(assignments)
+
+        return self
+
+    def aggregate(self, *assignments):
+        if self.count_alias is not None:
+            raise TypeError("AGGREGATE cannot be combined with WITH COUNT INTO")
+
+        for assignment in assignments:
+            if not isinstance(assignment.expr, Function):
+                raise TypeError("An aggregate has to be a function call: {0!r}".format(assignment.expr))
+
+        self.aggregates.extend(assignments)
+
+        return self
+
+    def with_count(self, alias):
+        if len(self.aggregates):
+            raise TypeError("WITH COUNT INTO cannot be combined with AGGREGATE")
+
+        self.count_alias = alias
+
+        return self
+
+    def __iter__(self):
+        yield COLLECT
+
+        if len(self.groups):
+            yield SPACE
+
+            for expr in self.groups:
+                yield expr
+
+        if len(self.aggregates):
+            yield SPACE
+            yield AGGREGATE
+            yield SPACE
+
+            for expr in self.aggregates:
+                yield expr
+
+        if self.count_alias is not None:
+            for expr in (SPACE, WITH_COUNT, SPACE, INTO, SPACE):
+                yield expr
+
+            for expr in self.count_alias:
+                yield expr
+
 
 class Action(Expression):
     """A Kind of mandatory command for a query to perform.
@@ -562,13 +694,18 @@ class Action(Expression):
 class Return(Action):
     op = RETURN
 
-    def __init__(self, alias_or_object):
+    def __init__(self, alias_or_object, distinct=False):
         self.alias = alias_or_object
+        self.distinct = distinct
 
     def __iter__(self):
         yield self.op
         yield SPACE
 
+        if self.distinct:
+            yield DISTINCT
+            yield SPACE
+
         for expr in self.alias:
             yield expr
 
@@ -666,6 +803,10 @@ class For(Expression):
             yield expr
 
     def alias(self, alias):
+        # several aliases are used by traversals, e.g. `FOR v, e, p IN ...`
+        if isinstance(alias, (list, tuple)):
+            alias = List(alias)
+
         self.alias_expr = alias
 
         return self
@@ -677,15 +818,355 @@ class For(Expression):
         elif isclass(from_list) and issubclass(from_list, meta.BaseDocument):
             from_list = Collection(from_list)
 
-        self.list_expr = from_list
+        # a plain list of values is bound as a parameter
+        self.list_expr = Value.fix(from_list)
 
         return self
 
 
-class Remove(For, Action):
+class GraphSearch(Expression):
+
+    """The common part of graph traversals and path searches: a start vertex and a graph or edges."""
+
+    directions = {
+        'any': ANY,
+        'inbound': INBOUND,
+        'outbound': OUTBOUND,
+    }
+
+    def __init__(self, start, edges=None, graph=None, direction='any', options=None):
+        if (edges is None) == (graph is None):
+            raise TypeError("A {0} needs either edges or a graph!".format(self.__class__.__name__))
+
+        self.start = self._vertex(start)
+
+        if graph is not None:
+            self.edges = None
+            self.graph = Value(getattr(graph, '__graph_name__', graph))
+
+        else:
+            if not isinstance(edges, (list, tuple)):
+                edges = (edges, )
+
+            self.edges = List(edge if isinstance(edge, Expression) else Collection(edge) for edge in edges)
+            self.graph = None
+
+        try:
+            self.direction = self.directions[direction.lower()]
+
+        except KeyError:
+            raise TypeError("Unknown traversal direction: {0}".format(direction))
+
+        self.options = dict(options or {})
+
+    @staticmethod
+    def _vertex(vertex):
+        if isinstance(vertex, meta.BaseDocument):
+            vertex = vertex['_id']
+
+        return Value.fix(vertex)
+
+    def _set_options(self, **options):
+        for name, value in iteritems(options):
+            if value is not None:
+                self.options[name] = value
+
+    def _iter_graph(self):
+        if self.graph is not None:
+            yield GRAPH
+            yield SPACE
+
+            for expr in self.graph:
+                yield expr
+
+        else:
+            for expr in self.edges:
+                yield expr
+
+    def _iter_options(self):
+        if self.options:
+            yield SPACE
+            yield OPTIONS
+            yield SPACE
+            yield Options(self.options)
+
+
+class Traversal(GraphSearch):
+
+    """A graph traversal to loop over with :py:class:`.For`.
+
+    FOR v[, e[, p]] IN min..max OUTBOUND|INBOUND|ANY start GRAPH name|edges [PRUNE condition] [OPTIONS {...}]
+
+    See https://docs.arangodb.com/Aql/Graphs/Traversals.html
+    """
+
+    def __init__(self, start, edges=None, graph=None, direction='any', depth=1, prune=None, options=None,
+                 unique_vertices=None, unique_edges=None, bfs=None):
+        """
+        :param start: the start vertex, its document or `_id`
+        :param edges: an edge class/collection or a list of them
+        :param graph: a graph class or graph name instead of edges
+        :param direction: `any`, `inbound` or `outbound`
+        :param depth: a fixed depth or a tuple of min and max depth
+        :param prune: a condition to stop the traversal at a vertex
+        :param options: a dict of traversal options, like `vertexCollections`
+        :param unique_vertices: `none`, `path` or `global`
+        :param unique_edges: `none` or `path`
+        :param bfs: traverse breadth first
+        """
+
+        super(Traversal, self).__init__(start, edges=edges, graph=graph, direction=direction, options=options)
+
+        self.min_depth, self.max_depth = depth if isinstance(depth, (list, tuple)) else (depth, depth)
+        self.prune = prune
+
+        self._set_options(uniqueVertices=unique_vertices, uniqueEdges=unique_edges, bfs=bfs)
+
+    def __iter__(self):
+        yield Term("{0:d}..{1:d}".format(self.min_depth, self.max_depth))
+        yield SPACE
+        yield self.direction
+        yield SPACE
+
+        for expr in self.start:
+            yield expr
+
+        yield SPACE
+
+        for expr in self._iter_graph():
+            yield expr
+
+        if self.prune is not None:
+            yield SPACE
+            yield PRUNE
+            yield SPACE
+
+            for expr in self.prune:
+                yield expr
+
+        for expr in self._iter_options():
+            yield expr
+
+
+class ShortestPath(GraphSearch):
+
+    """The shortest path between two vertices to loop over with :py:class:`.For`.
+
+    FOR v[, e] IN OUTBOUND|INBOUND|ANY SHORTEST_PATH start TO target GRAPH name|edges [OPTIONS {...}]
+
+    Each vertex of the path is emitted in order, with the edge leading to it,
+    which is `null` for the start.
+
+    See https://docs.arangodb.com/Aql/Graphs/ShortestPath.html
+    """
+
+    op = KeyWord("SHORTEST_PATH")
+
+    def __init__(self, start, target, edges=None, graph=None, direction='any', weight=None, default_weight=None,
+                 options=None):
+        """
+        :param start: the start vertex, its document or `_id`
+        :param target: the target vertex, its document or `_id`
+        :param edges: an edge class/collection or a list of them
+        :param graph: a graph class or graph name instead of edges
+        :param direction: `any`, `inbound` or `outbound`
+        :param weight: the edge attribute with the weight of an edge, instead of counting the edges
+        :param default_weight: the weight of an edge without that attribute
+        :param options: a dict of further options
+        """
+
+        super(ShortestPath, self).__init__(start, edges=edges, graph=graph, direction=direction, options=options)
+
+        self.target = self._vertex(target)
+
+        self._set_options(weightAttribute=weight, defaultWeight=default_weight)
+
+    def __iter__(self):
+        yield self.direction
+        yield SPACE
+        yield self.op
+        yield SPACE
+
+        for expr in self.start:
+            yield expr
+
+        yield SPACE
+        yield TO
+        yield SPACE
+
+        for expr in self.target:
+            yield expr
+
+        yield SPACE
+
+        for expr in self._iter_graph():
+            yield expr
+
+        for expr in self._iter_options():
+            yield expr
+
+
+class KShortestPaths(ShortestPath):
+
+    """All paths between two vertices in order of their length resp. weight, which must be limited.
+
+    FOR p IN OUTBOUND|INBOUND|ANY K_SHORTEST_PATHS start TO target GRAPH name|edges [OPTIONS {...}] LIMIT count
+
+    Each path is an object with its `vertices`, `edges` and `weight`.
+
+    See https://docs.arangodb.com/Aql/Graphs/KShortestPaths.html
+    """
+
+    op = KeyWord("K_SHORTEST_PATHS")
+
+
+class Options(Term):
+
+    """Render options as an object literal, so the server knows them at query compile time."""
+
+    def __init__(self, options):
+        super(Options, self).__init__(json.dumps(options, sort_keys=True))
+
+
+class Modification(Action):
+
+    """A data modification of a collection.
+
+    Optionally followed by `OPTIONS {...}` and a `RETURN` of :py:data:`.NEW` or :py:data:`.OLD`.
+
+    See https://docs.arangodb.com/Aql/Operations/index.html
+    """
+
+    op = None
+    into = IN
+
+    def __init__(self, expr, collection, options=None, returns=None):
+        """
+        :param expr: the document, key or alias to modify
+        :param collection: a collection, document class or collection name
+        :param options: a dict of options like `ignoreErrors`, `waitForSync` or `mergeObjects`
+        :param returns: an expression to return, e.g. `NEW` or `OLD._key`
+        """
+
+        self.expr = Value.fix(expr)
+
+        if not isinstance(collection, Expression):
+            collection = Collection(collection)
+
+        self.collection_expr = collection
+        self.options = options
+
+        if returns is not None and not isinstance(returns, Expression):
+            returns = Alias(returns)
+
+        self.returns = returns
+
+    def _iter_operation(self):
+        """Yield the operation up to the collection part."""
+
+        yield self.op
+        yield SPACE
+
+        for expr in self.expr:
+            yield expr
+
+    def __iter__(self):
+        for expr in self._iter_operation():
+            yield expr
+
+        yield SPACE
+        yield self.into
+        yield SPACE
+
+        for expr in self.collection_expr:
+            yield expr
+
+        if self.options:
+            yield SPACE
+            yield OPTIONS
+            yield SPACE
+            yield Options(self.options)
+
+        if self.returns is not None:
+            yield SPACE
+            yield RETURN
+            yield SPACE
+
+            for expr in self.returns:
+                yield expr
+
+
+class Remove(Modification):
     op = REMOVE
 
 
+class Insert(Modification):
+    op = INSERT
+    into = INTO
+
+
+class Update(Modification):
+
+    """Update a document: `UPDATE doc IN collection` or `UPDATE key WITH doc IN collection`."""
+
+    op = UPDATE
+
+    def __init__(self, expr, collection, doc=None, **kwargs):
+        super(Update, self).__init__(expr, collection, **kwargs)
+
+        self.doc = doc if doc is None else Value.fix(doc)
+
+    def _iter_operation(self):
+        for expr in super(Update, self)._iter_operation():
+            yield expr
+
+        if self.doc is not None:
+            yield SPACE
+            yield WITH
+            yield SPACE
+
+            for expr in self.doc:
+                yield expr
+
+
+class Replace(Update):
+    op = REPLACE
+
+
+class Upsert(Modification):
+
+    """Insert a document or update resp. replace an existing one, which is found by search.
+
+    UPSERT search INSERT insert UPDATE|REPLACE update IN collection
+    """
+
+    op = UPSERT
+
+    def __init__(self, search, insert, update, collection, replace=False, **kwargs):
+        super(Upsert, self).__init__(search, collection, **kwargs)
+
+        self.insert = Value.fix(insert)
+        self.update = Value.fix(update)
+        self.replace = replace
+
+    def _iter_operation(self):
+        for expr in super(Upsert, self)._iter_operation():
+            yield expr
+
+        for op, doc in ((INSERT, self.insert), (self.replace and REPLACE or UPDATE, self.update)):
+            yield SPACE
+            yield op
+            yield SPACE
+
+            for expr in doc:
+                yield expr
+
+
+# the pseudo variables of a modification
+NEW = Alias("NEW")
+OLD = Alias("OLD")
+
+
 class QueryBase(with_metaclass(meta.MetaQueryBase, Expression)):
     pass
 
@@ -702,6 +1183,10 @@ class Query(QueryBase):
 
         self.filter_expr = self._get_filter(filter)
 
+        self.collect_expr = None
+
+        self.lazy_documents = False
+
         self.sort_expr = self._get_sort(sort)
 
         self.limit_expr = limit
@@ -735,14 +1220,23 @@ class Query(QueryBase):
         return sort_expr
 
     def __iter__(self):
-        for for_expr in self.for_exprs:
+        for i, for_expr in enumerate(self.for_exprs):
+            if i:
+                yield SPACE
+
             for expr in for_expr:
                 yield expr
+
         if len(self.filter_expr):
             yield SPACE
             for expr in self.filter_expr:
                 yield expr
 
+        if self.collect_expr is not None:
+            yield SPACE
+            for expr in self.collect_expr:
+                yield expr
+
         if len(self.sort_expr):
             yield SPACE
             for expr in self.sort_expr:
@@ -769,6 +1263,13 @@ class Query(QueryBase):
 
         return self
 
+    def let(self, alias, expr):
+        """Assign an expression to alias within the loop."""
+
+        self.for_exprs.append(Let(alias, expr))
+
+        return self
+
     def action(self, action):
         """Replace the action of that query."""
 
@@ -780,6 +1281,63 @@ class Query(QueryBase):
 
         return self
 
+    def _get_collect(self):
+        if self.collect_expr is None:
+            self.collect_expr = Collect()
+
+        return self.collect_expr
+
+    def collect(self, *groups, **named):
+        """Group the result by `(alias, expr)` tuples or `alias=expr` keywords.
+
+        Since the loop variables are not available after a COLLECT, you
+        have to set an action for the collected aliases.
+        """
+
+        self._get_collect().group(*Assignment.iter_assignments(groups, named))
+
+        return self
+
+    def aggregate(self, *aggregates, **named):
+        """Aggregate by `(alias, function)` tuples or `alias=function` keywords, e.g. `total=SUM(alias.amount)`."""
+
+        self._get_collect().aggregate(*Assignment.iter_assignments(aggregates, named))
+
+        return self
+
+    def with_count(self, alias):
+        """Count the members of each group into alias."""
+
+        if not isinstance(alias, Expression):
+            alias = Alias(alias)
+
+        self._get_collect().with_count(alias)
+
+        return self
+
+    def distinct(self):
+        """Remove duplicates from the returned values."""
+
+        if not isinstance(self.action_expr, Return):
+            raise TypeError("Only a RETURN action can be distinct: {0!r}".format(self.action_expr))
+
+        self.action_expr.distinct = True
+
+        return self
+
+    def lazy(self):
+        """Deserialize the documents of the cursor on their first access.
+
+        That is cheaper for a document class with an expensive objective, if only a few documents are used.
+        """
+
+        if not isinstance(self.action_expr, Return):
+            raise TypeError("Only the documents of a RETURN action can be lazy: {0!r}".format(self.action_expr))
+
+        self.lazy_documents = True
+
+        return self
+
     def sort(self, *criteria):
         self.sort_expr.extend(criteria)
 
@@ -803,4 +1361,7 @@ class Query(QueryBase):
     def cursor(self):
         """Return a cursor for this query, ready to iterate."""
 
+        if self.lazy_documents:
+            return cursor.Cursor(*self.query(), lazy=True)
+
         return cursor.Cursor(*self.query())
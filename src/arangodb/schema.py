@@ -0,0 +1,172 @@
+"""Create the collections, graphs and indexes of all classes at once."""
+
+from collections import OrderedDict
+from itertools import chain
+from multiprocessing.pool import ThreadPool
+
+from six import itervalues
+
+from . import meta, exc
+
+import threading
+import logging
+
+LOG = logging.getLogger(__name__)
+
+
+class Snapshot(object):
+
+    """The existing collections and graphs of a database, listed once."""
+
+    def __init__(self, client):
+        result = client.collections.get(no_system=True)
+
+        # the collections are listed as `result` since arangodb 3
+        collections = result.get('result', result.get('collections', []))
+
+        self.collections = dict((collection['name'], collection) for collection in collections)
+        self.graphs = dict((graph.get('name', graph.get('_key')), graph) for graph in client.graphs.get())
+
+
+# (endpoint, database) -> snapshot
+_snapshots = {}
+_lock = threading.Lock()
+
+
+def snapshot(client, refresh=False):
+    """:returns: the cached :py:class:`Snapshot` of the database of a client"""
+
+    key = (client.endpoint, client.database)
+
+    with _lock:
+        if refresh or key not in _snapshots:
+            _snapshots[key] = Snapshot(client)
+
+        return _snapshots[key]
+
+
+def clear():
+    """Forget all snapshots, e.g. after a collection was dropped."""
+
+    with _lock:
+        _snapshots.clear()
+
+
+def registered_documents():
+    """:returns: all document classes, which have a collection on the server"""
+
+    return [cls for cls in itervalues(meta.MetaDocumentBase.__documents__) if not cls.__abstract__]
+
+
+def registered_graphs():
+    return list(itervalues(meta.MetaGraph.__graphs__))
+
+
+def create_collection(cls):
+    """Create the collection of a document class, if it is missing.
+
+    :returns: the name of the created collection or `None`
+    """
+
+    client = cls.client
+    name = cls.__collection_name__
+    col_type = cls._collection_type()           # pylint: disable=W0212
+
+    existing = snapshot(client).collections.get(name)
+
+    if existing is None:
+        client.collections.create(name, type=col_type)
+        LOG.info("Created collection: %s", cls)
+
+        snapshot(client).collections[name] = {'name': name, 'type': col_type}
+
+        return name
+
+    if existing['type'] != col_type:
+        raise exc.ArangoException("An existing collection has the wrong type, solve this manually!",
+                                  existing, cls)
+
+    return None
+
+
+def create_graph(graph):
+    """Create a graph, if it is missing.
+
+    :returns: the name of the created graph or `None`
+    """
+
+    client = graph.client
+    name = graph.__graph_name__
+
+    existing = snapshot(client).graphs.get(name)
+
+    if existing is None:
+        graph.api.create(graph.__definition__)
+        LOG.info("Created graph: %s", name)
+
+        snapshot(client).graphs[name] = graph.__definition__
+
+        return name
+
+    if existing.get('edgeDefinitions', []) != graph.__definition__['edgeDefinitions']:
+        LOG.warning("The graph `%s` differs from its definition, solve this manually!", name)
+
+    return None
+
+
+def bootstrap(documents=None, graphs=None, indexes=True, threads=8, refresh=False):
+    """Create all missing collections, graphs and indexes.
+
+    The existing collections and graphs are listed once per database and
+    cached, all missing parts are created concurrently.
+
+    :param documents: the document classes, defaults to all registered
+    :param graphs: the graph classes, defaults to all registered
+    :param indexes: also create the missing declared indexes
+    :param threads: the max count of concurrent requests
+    :param refresh: list the existing collections and graphs again
+    :returns: a dict of the created `collections`, `graphs` and `indexes`
+    """
+
+    if refresh:
+        clear()
+
+    documents = registered_documents() if documents is None else list(documents)
+    graphs = registered_graphs() if graphs is None else list(graphs)
+
+    # derived graph classes share the graph of their base
+    graphs = list(OrderedDict((graph.__graph_name__, graph) for graph in graphs).values())
+
+    # one class per collection, including the collections of all graphs
+    collections = OrderedDict()
+    for cls in chain(
+            documents,
+            *[chain(itervalues(graph.__graph_edges__), itervalues(graph.__graph_vertices__)) for graph in graphs]
+    ):
+        collections.setdefault(cls.__collection_name__, cls)
+
+    if not collections:
+        return {'collections': [], 'graphs': [], 'indexes': OrderedDict()}
+
+    pool = ThreadPool(min(threads, len(collections)))
+
+    try:
+        created_collections = pool.map(create_collection, list(collections.values()))
+
+        # graphs need their collections
+        created_graphs = pool.map(create_graph, graphs)
+
+        indexed = [cls for cls in documents if cls.__indexes__] if indexes else []
+        created_indexes = pool.map(lambda cls: cls.sync_indexes(), indexed)
+
+    finally:
+        pool.close()
+        pool.join()
+
+    return {
+        'collections': [name for name in created_collections if name is not None],
+        'graphs': [name for name in created_graphs if name is not None],
+        'indexes': OrderedDict(
+            (cls.__collection_name__, created) for cls, created in zip(indexed, created_indexes) if created
+        ),
+    }
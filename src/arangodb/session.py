@@ -0,0 +1,286 @@
+"""A unit of work for documents."""
+
+from collections import OrderedDict
+from copy import deepcopy
+
+from six import iteritems
+
+from . import query, exc, cursor, transaction
+
+import logging
+
+LOG = logging.getLogger(__name__)
+
+
+class Session(object):
+
+    """Keep an identity map of loaded documents and flush all changes at once.
+
+    Within a session a document is loaded only once, so two loads of the same
+    `_id` return the same instance, including its local modifications.
+
+    New, modified and deleted documents are written on :py:meth:`commit` with
+    one query per collection and kind of change::
+
+        with Session() as session:
+            doc = session.load(MyDoc, 'key')
+            doc['foo'] = 'bar'
+
+            session.add(MyDoc(foo=1))
+
+    """
+
+    def __init__(self):
+        # _id -> document
+        self.identity_map = OrderedDict()
+
+        # the serialized documents at load or last flush, to find modifications
+        self.snapshots = {}
+
+        self.new = []
+        self.deleted = OrderedDict()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.commit()
+
+        else:
+            self.rollback()
+
+    def __contains__(self, document):
+        if '_id' in document:
+            return self.identity_map.get(document['_id']) is document
+
+        return any(doc is document for doc in self.new)
+
+    def _register(self, document):
+        """Return the document of the identity map for that `_id` or put document there."""
+
+        _id = document['_id']
+
+        registered = self.identity_map.get(_id)
+        if registered is not None:
+            return registered
+
+        self.identity_map[_id] = document
+        self._snapshot(document)
+
+        return document
+
+    def _snapshot(self, document):
+        # a deep copy to find also modifications of nested values in place
+        self.snapshots[document['_id']] = deepcopy(document.serialize())
+
+    def merge(self, document):
+        """Return the instance of this session for a document, e.g. one from a cursor."""
+
+        return self._register(document)
+
+    def iter_documents(self, cursor):
+        """Iterate the documents of a cursor, but yield instances of this session."""
+
+        for document in cursor.iter_documents():
+            yield self.merge(document)
+
+    def load(self, cls, key):
+        """Load a document only, if it is not already in this session."""
+
+        _id = cls._handle(key)         # pylint: disable=W0212
+
+        if _id in self.deleted:
+            raise exc.DocumentNotFound(404, exc.DocumentNotFound.error_num, "document deleted in session",
+                                       args=(key, ))
+
+        document = self.identity_map.get(_id)
+
+        if document is None:
+            document = self._register(cls.load(_id))
+
+        return document
+
+    def load_many(self, cls, keys, strict=False):
+        """Load all documents with one query, which are not already in this session.
+
+        :returns: a list of documents in order of keys, `None` for a missing document
+        """
+
+        handles = [cls._handle(key) for key in keys]         # pylint: disable=W0212
+
+        for _id in handles:
+            if _id in self.deleted:
+                raise exc.DocumentNotFound(404, exc.DocumentNotFound.error_num, "document deleted in session",
+                                           args=(_id, ))
+
+        missing = [_id for _id in handles if _id not in self.identity_map]
+
+        if missing:
+            for document in cls.load_many(missing, strict=strict):
+                if document is not None:
+                    self._register(document)
+
+        return [self.identity_map.get(_id) for _id in handles]
+
+    def add(self, document):
+        """Add a new or existing document to this session."""
+
+        if '_id' in document:
+            self.deleted.pop(document['_id'], None)
+
+            return self._register(document)
+
+        if document not in self:
+            self.new.append(document)
+
+        return document
+
+    def delete(self, document):
+        """Mark a document for deletion."""
+
+        if '_id' not in document:
+            self.new = [doc for doc in self.new if doc is not document]
+
+        else:
+            self.deleted[document['_id']] = self._register(document)
+
+    @property
+    def dirty(self):
+        """All modified documents."""
+
+        return [
+            document
+            for _id, document in iteritems(self.identity_map)
+            if _id not in self.deleted and document.serialize() != self.snapshots[_id]
+        ]
+
+    @staticmethod
+    def _by_collection(documents):
+        collections = OrderedDict()
+
+        for document in documents:
+            collections.setdefault(document.__collection_name__, []).append(document)
+
+        return collections
+
+    @staticmethod
+    def _execute(collection, docs, action):
+        alias = query.Alias('doc')
+
+        q = query.Query(alias, docs).action(action(alias, collection))
+
+        return list(q.cursor.iter_result())
+
+    # pylint: disable=W0212
+
+    def _insert(self, collection, documents):
+        metas = self._execute(
+            collection,
+            [document.serialize() for document in documents],
+            lambda alias, collection: query.Insert(alias, collection, returns=query.Object(
+                _id=query.NEW._id, _key=query.NEW._key, _rev=query.NEW._rev
+            ))
+        )
+
+        for document, doc in zip(documents, metas):
+            document.update(doc)
+            document._clean()
+
+            self._register(document)
+
+    def _patch(self, document):
+        """:returns: the modified fields of a document, which was loaded with only some fields"""
+
+        snapshot = self.snapshots[document['_id']]
+        serialized = document.serialize()
+
+        # a replace would delete all fields, which were not loaded
+        if any(key not in serialized for key in snapshot):
+            raise exc.ArangoException("A partial document cannot be saved with deleted fields", document)
+
+        return dict(
+            (key, value) for key, value in iteritems(serialized)
+            if key not in snapshot or snapshot[key] != value
+        )
+
+    def _update(self, collection, documents, patches):
+        revs = self._execute(
+            collection,
+            [dict(patch, _key=document['_key']) for document, patch in zip(documents, patches)],
+            lambda alias, collection: query.Update(alias, collection, options={'mergeObjects': False},
+                                                   returns=query.NEW._rev)
+        )
+
+        for document, rev in zip(documents, revs):
+            document['_rev'] = rev
+            document._clean()
+            self._snapshot(document)
+
+    def _replace(self, collection, documents):
+        revs = self._execute(
+            collection,
+            [document.serialize() for document in documents],
+            lambda alias, collection: query.Replace(alias, collection, returns=query.NEW._rev)
+        )
+
+        for document, rev in zip(documents, revs):
+            document['_rev'] = rev
+            document._clean()
+            self._snapshot(document)
+
+    def _remove(self, collection, documents):
+        self._execute(
+            collection,
+            [document['_key'] for document in documents],
+            query.Remove
+        )
+
+        for document in documents:
+            del self.identity_map[document['_id']]
+            del self.snapshots[document['_id']]
+            del self.deleted[document['_id']]
+
+    def flush(self):
+        """Write all changes to the server, with as few queries as possible."""
+
+        transaction.check_not_collecting(cursor.Cursor.client, "A session flush")
+
+        dirty = self.dirty
+        patches = dict((document['_id'], self._patch(document)) for document in dirty if document.__partial__)
+
+        new, self.new = self.new, []
+
+        for collection, documents in iteritems(self._by_collection(new)):
+            LOG.debug("Insert %d documents into %s", len(documents), collection)
+            self._insert(collection, documents)
+
+        for collection, documents in iteritems(self._by_collection(dirty)):
+            partial = [document for document in documents if document['_id'] in patches]
+            documents = [document for document in documents if document['_id'] not in patches]
+
+            if partial:
+                LOG.debug("Update %d partial documents in %s", len(partial), collection)
+                self._update(collection, partial, [patches[document['_id']] for document in partial])
+
+            if documents:
+                LOG.debug("Replace %d documents in %s", len(documents), collection)
+                self._replace(collection, documents)
+
+        for collection, documents in iteritems(self._by_collection(list(self.deleted.values()))):
+            LOG.debug("Remove %d documents from %s", len(documents), collection)
+            self._remove(collection, documents)
+
+    def commit(self):
+        self.flush()
+
+    def rollback(self):
+        """Forget all pending changes.
+
+        The documents itself keep their modifications.
+        """
+
+        self.identity_map.clear()
+        self.snapshots.clear()
+        del self.new[:]
+        self.deleted.clear()
@@ -0,0 +1,311 @@
+"""Server-side transactions."""
+
+from . import exc
+
+import threading
+
+import logging
+
+LOG = logging.getLogger(__name__)
+
+
+TRANSACTION_HEADER = 'x-arango-trx-id'
+
+
+# executes the collected writes of a javascript transaction
+ACTION = """
+function (params) {
+    var db = require('@arangodb').db;
+    var results = [];
+
+    function execute(collection, op) {
+        switch (op.type) {
+        case 'create':
+            return collection.insert(op.doc);
+        case 'replace':
+            return collection.replace(op.handle, op.doc);
+        case 'update':
+            return collection.update(op.handle, op.doc, {keepNull: op.keep, mergeObjects: false});
+        case 'delete':
+            return collection.remove(op.handle);
+        }
+
+        throw 'unknown operation: ' + op.type;
+    }
+
+    params.operations.forEach(function (op) {
+        // the _from and _to of edges to documents, which are created before
+        Object.keys(op.refs || {}).forEach(function (key) {
+            op.doc[key] = results[op.refs[key]]._id;
+        });
+
+        results.push(execute(db._collection(op.collection), op));
+    });
+
+    return results;
+}
+"""
+
+
+_local = threading.local()
+
+
+def _stack():
+    if not hasattr(_local, 'stack'):
+        _local.stack = []
+
+    return _local.stack
+
+
+def current(collecting=False, client=None):
+    """:returns: the innermost transaction of this thread or `None`
+
+    :param collecting: only return a javascript transaction, which collects the writes of documents
+    :param client: only return a transaction for the database of this client
+    """
+
+    stack = _stack()
+
+    if not stack:
+        return None
+
+    transaction = stack[-1]
+
+    if collecting and transaction.stream:
+        return None
+
+    if client is not None and not transaction.is_for(client):
+        return None
+
+    return transaction
+
+
+def collecting(document_cls):
+    """:returns: the javascript transaction, which collects the writes of a document class, or `None`
+
+    The client of the class is only resolved within a transaction.
+    """
+
+    if not _stack():
+        return None
+
+    return current(collecting=True, client=document_cls.client)
+
+
+def check_not_collecting(client, action):
+    """Raise :py:exc:`arangodb.exc.TransactionError`, if a javascript transaction would miss the writes of
+    an action, which does not write single documents."""
+
+    if current(collecting=True, client=client) is not None:
+        raise exc.TransactionError("{0} cannot be collected by a javascript transaction, "
+                                   "use a stream transaction instead".format(action))
+
+
+def collection_name(collection):
+    return getattr(collection, '__collection_name__', collection)
+
+
+class Transaction(object):
+
+    """Ship related writes together in one server-side transaction.
+
+    A javascript transaction collects all writes of single documents of its
+    database in this thread and executes them on commit with one request.
+    Bulk writes and session flushes raise :py:exc:`arangodb.exc.TransactionError`
+    meanwhile. The documents get their `_id`, `_key` and `_rev` after the commit.
+    An edge can be set up with a new document, once it is saved in the transaction::
+
+        with client.transaction(write=[Person, knows]):
+            person.save()
+            knows(person, friend).save()
+
+    Saving a document again replaces its collected write.
+
+    A stream transaction is begun on the server and every request of this
+    thread to the same database is part of it, until it is committed or aborted.
+    """
+
+    def __init__(self, client, read=(), write=(), stream=False, **options):
+        """
+        :param read: the collections or document classes to read from
+        :param write: the collections or document classes to write into
+        :param stream: begin a stream transaction instead of collecting the writes
+        :param options: `sync` and `lock_timeout`
+        """
+
+        self.client = client
+        self.read = [collection_name(collection) for collection in read]
+        self.write = [collection_name(collection) for collection in write]
+        self.stream = stream
+        self.options = options
+
+        # the id of a stream transaction
+        self.id = None
+
+        # a list of (operation, callback)
+        self.operations = []
+
+        # the index of the collected write by the id of a document
+        self.indexes = {}
+
+    def __enter__(self):
+        self.begin()
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.commit()
+
+        else:
+            self.abort()
+
+    def begin(self):
+        if self.stream:
+            self.id = self.client.transactions.begin(read=self.read, write=self.write, **self.options)
+            LOG.debug("Begin stream transaction: %s", self.id)
+
+        _stack().append(self)
+
+    def _end(self):
+        stack = _stack()
+
+        if self in stack:
+            stack.remove(self)
+
+    def is_for(self, client):
+        """:returns: True if a client connects to the database of this transaction"""
+
+        return (client.endpoint, client.database) == (self.client.endpoint, self.client.database)
+
+    def pending(self, document):
+        """:returns: True if the creation of a document is collected"""
+
+        index = self.indexes.get(id(document))
+
+        return index is not None and self.operations[index][0]['type'] == 'create'
+
+    def _refs(self, document, serialized):
+        """:returns: the indexes of the created documents by `_from` and `_to` of an edge, which refers to them"""
+
+        refs = {}
+
+        # pylint: disable=W0212
+        for key, endpoint in getattr(document, '__endpoints__', {}).items():
+            if key in serialized or '_id' in endpoint:
+                continue
+
+            if not self.pending(endpoint):
+                raise TypeError("The document for setting `{0}` has no `_id`: {1}".format(key, endpoint))
+
+            refs[key] = self.indexes[id(endpoint)]
+
+        return refs
+
+    def _collect(self, document, operation, callback):
+        """Append a write or replace the collected write of the same document."""
+
+        index = self.indexes.get(id(document))
+
+        if index is None:
+            self.indexes[id(document)] = len(self.operations)
+            self.operations.append((operation, callback))
+
+        else:
+            self.operations[index] = (operation, callback)
+
+    def save(self, document):
+        """Collect the creation or modification of a document."""
+
+        serialized = document.serialize()
+        operation = document._operation(serialized)       # pylint: disable=W0212
+
+        if operation is None:
+            return
+
+        kind, doc, keep = operation
+        refs = self._refs(document, serialized) if kind == 'create' else {}
+
+        def saved(result):
+            # the created documents, which the edge refers to, got their `_id` before
+            for key in refs:
+                document[key] = document.__endpoints__[key]
+
+            ids = dict((key, document[key]) for key in refs)
+            document._saved(dict(serialized, **ids), result)        # pylint: disable=W0212
+
+        operation = {
+            'type': kind,
+            'collection': document.__collection_name__,
+            'handle': document.get('_id'),
+            'doc': doc,
+            'keep': keep,
+        }
+
+        if refs:
+            operation['refs'] = refs
+
+        self._collect(document, operation, saved)
+
+    def delete(self, document):
+        """Collect the deletion of a document."""
+
+        self._collect(document, {
+            'type': 'delete',
+            'collection': document.__collection_name__,
+            'handle': document['_id'],
+        }, lambda result: document._deleted())       # pylint: disable=W0212
+
+    def commit(self):
+        """Commit a stream transaction or execute all collected writes.
+
+        :returns: the results of all collected writes
+        """
+
+        self._end()
+
+        if self.stream:
+            trx_id, self.id = self.id, None
+
+            self.client.transactions.commit(trx_id)
+
+            return []
+
+        operations, self.operations = self.operations, []
+        self.indexes = {}
+
+        if not operations:
+            return []
+
+        write = list(self.write)
+        for operation, _ in operations:
+            if operation['collection'] not in write:
+                write.append(operation['collection'])
+
+        results = self.client.transactions.execute(
+            ACTION,
+            read=self.read,
+            write=write,
+            params={'operations': [operation for operation, _ in operations]},
+            **self.options
+        )
+
+        for (_, callback), result in zip(operations, results):
+            callback(result)
+
+        return results
+
+    def abort(self):
+        """Abort a stream transaction or forget all collected writes."""
+
+        self._end()
+
+        if self.stream:
+            trx_id, self.id = self.id, None
+
+            if trx_id is not None:
+                self.client.transactions.abort(trx_id)
+
+        else:
+            del self.operations[:]
+            self.indexes.clear()
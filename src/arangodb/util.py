@@ -1,3 +1,8 @@
+import threading
+
+from six.moves import queue
+
+
 class classproperty(object):
     """Create a property for the class."""
 
@@ -6,3 +11,57 @@ class classproperty(object):
 
     def __get__(self, instance, owner):
         return self.getter(owner)
+
+
+def prefetched(iterable, timeout=0.1):
+    """Iterate in a background thread, so the next item is fetched while the current one is processed.
+
+    Errors are raised in the consuming thread.
+    """
+
+    items = queue.Queue(maxsize=1)
+    stop = threading.Event()
+    done = object()
+
+    def put(item):
+        while not stop.is_set():
+            try:
+                items.put(item, timeout=timeout)
+                return True
+
+            except queue.Full:
+                pass
+
+        return False
+
+    def produce():
+        try:
+            for item in iterable:
+                if not put((item, None)):
+                    return
+
+        except Exception as ex:     # pylint: disable=W0703
+            put((None, ex))
+            return
+
+        put((done, None))
+
+    thread = threading.Thread(target=produce)
+    thread.daemon = True
+    thread.start()
+
+    try:
+        while True:
+            item, error = items.get()
+
+            if error is not None:
+                raise error
+
+            if item is done:
+                return
+
+            yield item
+
+    finally:
+        # the consumer may step out early
+        stop.set()
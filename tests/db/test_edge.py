@@ -46,16 +46,148 @@ def test_connections(Cursor):
     db.Edge.connections(db.Document(_id="foo"))
 
     Cursor.assert_called_with(
-        'FOR p IN PATHS(@@c_0, @@c_1, @value_0) '
-        'FILTER p.`source`.`_id` == @value_1 AND LENGTH(p.`edges`) == @value_2 '
-        # 'AND FIND_FIRST(p.`destination`.`_id`, @value_3) '
-        'RETURN p.`destination`',
+        'FOR v IN 1..1 ANY @value_0 @@c_0 RETURN v',
         {
-            'value_1': "foo",
-            'value_2': 1,
-            # 'value_3': 'Foo',
-            'value_0': 'any',
-            '@c_0': 'Document',
-            '@c_1': 'Edge'
+            'value_0': "foo",
+            '@c_0': 'Edge'
         }
     )
+
+
+@mock.patch("arangodb.cursor.Cursor")
+def test_outbounds_collection(Cursor):
+    from arangodb import db
+
+    db.Edge.outbounds(db.Document(_id="foo"), db.Document)
+
+    Cursor.assert_called_with(
+        'FOR v IN 1..1 OUTBOUND @value_0 @@c_0 OPTIONS {"vertexCollections": ["Document"]} RETURN v',
+        {
+            'value_0': "foo",
+            '@c_0': 'Edge'
+        }
+    )
+
+
+@mock.patch("arangodb.cursor.Cursor")
+def test_connections_many(Cursor):
+    from arangodb import db
+
+    class Person(db.Document):
+        pass
+
+    Cursor.return_value.iter_result.return_value = [
+        {'start': 'Person/1', 'vertex': {'_id': 'Person/2', '_key': '2'}},
+        {'start': 'Person/1', 'vertex': {'_id': 'Person/3', '_key': '3'}},
+    ]
+
+    connections = db.Edge.connections_many(
+        [Person(_id="Person/1"), Person(_id="Person/4")], direction=db.EDGE_DIRECTION_OUTBOUND)
+
+    Cursor.assert_called_once_with(
+        'FOR start IN @value_0 FOR v IN 1..1 OUTBOUND start @@c_0 RETURN {"start": start, "vertex": v}',
+        {
+            'value_0': ["Person/1", "Person/4"],
+            '@c_0': 'Edge'
+        }
+    )
+
+    assert list(connections) == ['Person/1', 'Person/4']
+    assert [doc['_id'] for doc in connections['Person/1']] == ['Person/2', 'Person/3']
+    assert all(isinstance(doc, Person) for doc in connections['Person/1'])
+    assert connections['Person/4'] == []
+
+
+@mock.patch("arangodb.cursor.Cursor")
+def test_load_many(Cursor):
+    from arangodb import db
+
+    class knows(db.Edge):
+        pass
+
+    class Member(db.Document):
+        pass
+
+    Cursor.return_value.iter_result.return_value = [
+        {
+            'edge': {'_id': 'knows/1', '_key': '1', '_from': 'Member/1', '_to': 'Member/2'},
+            'from': {'_id': 'Member/1', '_key': '1'},
+            'to': {'_id': 'Member/2', '_key': '2'},
+        },
+        {'edge': None, 'from': None, 'to': None},
+    ]
+
+    with mock.patch.object(db.Document, 'load') as load:
+        edges = knows.load_many(['1', 'knows/2'])
+
+        assert not load.called
+
+    Cursor.assert_called_once_with(
+        'FOR handle IN @value_0 LET edge = DOCUMENT(handle) '
+        'RETURN {"edge": edge, "from": DOCUMENT(edge.`_from`), "to": DOCUMENT(edge.`_to`)}',
+        {
+            'value_0': ["knows/1", "knows/2"],
+        }
+    )
+
+    edge, missing = edges
+
+    assert missing is None
+    assert isinstance(edge, knows)
+    assert edge['_from'] == 'Member/1'
+    assert isinstance(edge.from_document, Member)
+    assert edge.to_document['_id'] == 'Member/2'
+
+
+@mock.patch("arangodb.cursor.Cursor")
+def test_load_missing(Cursor):
+    from arangodb import db, exc
+
+    Cursor.return_value.iter_result.return_value = [{'edge': None, 'from': None, 'to': None}]
+
+    with pytest.raises(exc.DocumentNotFound):
+        db.Edge.load('1')
+
+
+def test_endpoint_documents():
+    from arangodb import db
+
+    d1 = db.Document(_id='foo/1')
+    d2 = db.Document(_id='foo/2')
+
+    e = db.Edge(d1, d2)
+
+    assert e.from_document is d1
+    assert e.to_document is d2
+
+    e['_to'] = 'foo/3'
+
+    with mock.patch.object(db.Document, 'load') as load:
+        assert e.to_document is load.return_value
+        load.assert_called_once_with('foo/3')
+
+
+@mock.patch("arangodb.cursor.Cursor")
+def test_load_many_cache(Cursor):
+    from arangodb import db, cache
+
+    class likes(db.Edge):
+        pass
+
+    class Fellow(db.Document):
+        __cache__ = cache.DocumentCache()
+
+    Cursor.return_value.iter_result.return_value = [
+        {
+            'edge': {'_id': 'likes/1', '_key': '1', '_rev': '1', '_from': 'Fellow/1', '_to': 'Fellow/2'},
+            'from': {'_id': 'Fellow/1', '_key': '1', '_rev': '2', 'name': 'foo'},
+            'to': {'_id': 'Fellow/2', '_key': '2', '_rev': '3'},
+        },
+    ]
+
+    edge = likes.load('1')
+
+    assert edge.from_document['name'] == 'foo'
+    assert Fellow.__cache__.get('Fellow/1')['_rev'] == '2'
+    assert Fellow.__cache__.get('Fellow/2')['_rev'] == '3'
+    assert 'likes/1' not in Fellow.__cache__
@@ -0,0 +1,57 @@
+try:
+    import unittest.mock as mock
+except ImportError:
+    import mock
+
+
+def test_declare():
+    from arangodb import db
+
+    class Visitor(db.Document):
+        by_name = db.UniqueHash('name')
+        by_mail = db.Persistent('mail', sparse=True)
+        expiry = db.TTL('created', expire_after=3600)
+
+    assert Visitor.__indexes__ == [Visitor.by_mail, Visitor.by_name, Visitor.expiry]
+    assert Visitor.by_name.collection is Visitor
+    assert Visitor.expiry.definition == {'unique': False, 'expireAfter': 3600}
+
+
+def test_save_collection_name():
+    from arangodb import db
+
+    class Guest(db.Document):
+        pass
+
+    index = db.Hash('name', collection=Guest)
+
+    with mock.patch.object(db.Index.__class__, 'api', new_callable=mock.PropertyMock) as api:
+        index.save()
+
+        api.return_value.create.assert_called_once_with('Guest', 'hash', fields=['name'], unique=False)
+
+
+def test_sync_indexes():
+    from arangodb import db
+
+    class Host(db.Document):
+        by_name = db.Hash('name')
+        by_age = db.Skiplist('age', sparse=True)
+        location = db.Geo('location', geo_json=True)
+
+    client = mock.Mock()
+    client.indexes.get.return_value = {'indexes': [
+        {'id': 'Host/0', 'type': 'primary', 'fields': ['_key'], 'unique': True, 'sparse': False},
+        # hash and skiplist are persistent with RocksDB
+        {'id': 'Host/1', 'type': 'persistent', 'fields': ['name'], 'unique': False, 'sparse': False},
+        {'id': 'Host/2', 'type': 'skiplist', 'fields': ['age'], 'unique': False, 'sparse': False},
+        {'id': 'Host/3', 'type': 'geo', 'fields': ['location'], 'geoJson': True, 'unique': False, 'sparse': True},
+    ]}
+
+    with mock.patch.object(db.Document.__class__, 'client', new_callable=mock.PropertyMock, return_value=client):
+        created = db.sync_indexes([Host])
+
+    client.indexes.get.assert_called_once_with('Host')
+    client.indexes.create.assert_called_once_with('Host', 'skiplist', fields=['age'], unique=False, sparse=True)
+
+    assert created == {'Host': [client.indexes.create.return_value]}
@@ -0,0 +1,245 @@
+try:
+    import unittest.mock as mock
+except ImportError:
+    import mock
+
+import pytest
+
+
+@pytest.fixture
+def index():
+    from arangodb import cursor, adjacency
+
+    client = mock.Mock()
+    client.exports.create.return_value = {'result': [
+        {'_id': 'follows/1', '_from': 'P/a', '_to': 'P/b'},
+        {'_id': 'follows/2', '_from': 'P/a', '_to': 'P/c'},
+    ], 'hasMore': True, 'id': 'export'}
+    client.cursors.pursue.return_value = {'result': [
+        {'_id': 'follows/3', '_from': 'P/b', '_to': 'P/d'},
+        {'_id': 'follows/4', '_from': 'P/c', '_to': 'P/a'},
+    ], 'hasMore': False}
+
+    with mock.patch.object(cursor.Cursor.__class__, 'client', new_callable=mock.PropertyMock, return_value=client):
+        index = adjacency.AdjacencyIndex(edges=['follows'], batch=2).load()
+
+    client.exports.create.assert_called_once_with('follows', fields=['_id', '_from', '_to'], batch=2)
+
+    return index
+
+
+def test_csr():
+    from arangodb import adjacency
+
+    offsets, targets = adjacency.build_csr(3, [2, 0, 2, 0], [0, 1, 1, 2])
+
+    assert offsets.tolist() == [0, 2, 2, 4]
+    assert targets.tolist() == [1, 2, 0, 1]
+
+
+def test_neighbors(index):
+    from arangodb import db
+
+    assert len(index) == 4
+    assert index.neighbors('P/a', db.EDGE_DIRECTION_OUTBOUND) == ['P/b', 'P/c']
+    assert index.neighbors('P/a', db.EDGE_DIRECTION_INBOUND) == ['P/c']
+    assert index.neighbors(db.Document(_id='P/a')) == ['P/b', 'P/c']
+    assert index.neighbors('P/x') == []
+
+    assert index.degree('P/a') == 3
+    assert index.degree('P/d', db.EDGE_DIRECTION_OUTBOUND) == 0
+
+
+def test_bfs(index):
+    from arangodb import db
+
+    assert index.bfs('P/a', depth=1, direction=db.EDGE_DIRECTION_OUTBOUND) == {'P/b': 1, 'P/c': 1}
+    assert list(index.bfs('P/a', depth=2, direction=db.EDGE_DIRECTION_OUTBOUND).items()) == [
+        ('P/b', 1), ('P/c', 1), ('P/d', 2)
+    ]
+    assert index.bfs('P/d', depth=3, direction=db.EDGE_DIRECTION_INBOUND) == {'P/b': 1, 'P/a': 2, 'P/c': 3}
+
+
+def test_apply_changes(index):
+    from arangodb import db
+
+    before = index.adjacency
+
+    index.apply_changes(
+        inserted=[
+            {'_id': 'follows/5', '_from': 'P/d', '_to': 'P/e'},
+            {'_id': 'follows/3', '_from': 'P/b', '_to': 'P/e'},
+        ],
+        removed=['follows/1', 'follows/unknown']
+    )
+
+    assert len(index) == 4
+    assert index.neighbors('P/a', db.EDGE_DIRECTION_OUTBOUND) == ['P/c']
+    assert sorted(index.neighbors('P/e', db.EDGE_DIRECTION_INBOUND)) == ['P/b', 'P/d']
+    assert index.degree('P/b') == 1
+
+    # the former snapshot is not modified
+    assert before.index['P/a'] == 0
+    assert 'P/e' not in before.index
+
+
+def test_merge(index):
+    from arangodb import db
+
+    index.merge_ratio = 0.5
+
+    index.apply_changes(removed=['follows/1'])
+    rows = index.adjacency
+
+    index.apply_changes(inserted=[{'_id': 'follows/5', '_from': 'P/d', '_to': 'P/a'}])
+
+    assert index.adjacency is rows
+    assert index.changed == 2
+
+    index.apply_changes(inserted=[{'_id': 'follows/6', '_from': 'P/d', '_to': 'P/b'}])
+
+    # the changes are merged into new rows
+    assert index.adjacency is not rows
+    assert index.changed == 0
+    assert index.neighbors('P/d', db.EDGE_DIRECTION_OUTBOUND) == ['P/a', 'P/b']
+    assert index.neighbors('P/a', db.EDGE_DIRECTION_OUTBOUND) == ['P/c']
+
+
+def test_load_during_changes():
+    from arangodb import cursor, adjacency, db
+
+    index = adjacency.AdjacencyIndex(edges=['follows'], batch=1)
+
+    def pursue(_):
+        # changes arrive, while the edges are loaded
+        index.apply_changes(inserted=[{'_id': 'follows/3', '_from': 'P/c', '_to': 'P/a'}], removed=['follows/1'])
+
+        return {'result': [{'_id': 'follows/2', '_from': 'P/b', '_to': 'P/c'}], 'hasMore': False}
+
+    client = mock.Mock()
+    client.wal.last_tick.return_value = '10'
+    client.exports.create.return_value = {
+        'result': [{'_id': 'follows/1', '_from': 'P/a', '_to': 'P/b'}], 'hasMore': True, 'id': 'export'
+    }
+    client.cursors.pursue.side_effect = pursue
+
+    with mock.patch.object(cursor.Cursor.__class__, 'client', new_callable=mock.PropertyMock, return_value=client):
+        index.load()
+
+    assert index.tick == '10'
+    assert index.buffered is None
+    assert len(index) == 2
+    assert index.neighbors('P/a', db.EDGE_DIRECTION_OUTBOUND) == []
+    assert index.neighbors('P/c', db.EDGE_DIRECTION_OUTBOUND) == ['P/a']
+
+
+def test_poll(index):
+    from arangodb import api, cursor, db
+
+    client = mock.Mock()
+    client.wal.tail.side_effect = [
+        ([
+            {'tick': '11', 'type': api.WAL_DOCUMENT, 'cname': 'follows',
+             'data': {'_key': '5', '_from': 'P/d', '_to': 'P/a'}},
+            {'tick': '12', 'type': api.WAL_DOCUMENT, 'cname': 'other', 'data': {'_key': '1'}},
+        ], '12', True),
+        ([{'tick': '13', 'type': api.WAL_REMOVE, 'cname': 'follows', 'data': {'_key': '1'}}], '13', False),
+    ]
+
+    index.tick = '10'
+
+    with mock.patch.object(cursor.Cursor.__class__, 'client', new_callable=mock.PropertyMock, return_value=client):
+        assert index.poll() == 2
+
+    assert client.wal.tail.call_args_list == [mock.call('10', chunk_size=None), mock.call('12', chunk_size=None)]
+    assert index.tick == '13'
+    assert index.neighbors('P/d', db.EDGE_DIRECTION_OUTBOUND) == ['P/a']
+    assert index.neighbors('P/a', db.EDGE_DIRECTION_OUTBOUND) == ['P/c']
+
+
+def test_wal_tail():
+    import requests
+    from arangodb import api
+
+    response = mock.Mock(status_code=200, text='{"tick": "11", "type": 2300}\n{"tick": "12", "type": 2302}\n',
+                         headers=requests.structures.CaseInsensitiveDict({
+                             'x-arango-replication-lastincluded': '12',
+                             'x-arango-replication-checkmore': 'true',
+                         }))
+
+    proxy = mock.Mock()
+    proxy.get_raw.return_value = response
+
+    entries, tick, more = api.Wal(proxy).tail('10', chunk_size=100)
+
+    proxy.get_raw.assert_called_once_with('tail', params={'from': '10', 'chunkSize': 100})
+    assert [entry['tick'] for entry in entries] == ['11', '12']
+    assert (tick, more) == ('12', True)
+
+    proxy.get_raw.return_value = mock.Mock(status_code=204)
+
+    assert api.Wal(proxy).tail('12') == ([], '12', False)
+
+
+def test_schedule():
+    import threading
+    from arangodb import adjacency
+
+    index = adjacency.AdjacencyIndex(edges=[])
+    refreshed = threading.Event()
+
+    with mock.patch.object(index, 'refresh', side_effect=refreshed.set):
+        index.start(0.01)
+
+        assert refreshed.wait(5)
+
+        index.stop()
+
+    assert index.timer is None
+
+
+@pytest.mark.parametrize('mapped, cast', [(False, True), (True, True), (True, False)])
+def test_export_adjacency(tmpdir, monkeypatch, mapped, cast):
+    from arangodb import cursor, adjacency
+
+    # python 2 has no memoryview.cast
+    monkeypatch.setattr(adjacency, 'MEMORYVIEW_CAST', cast)
+
+    collections = {
+        'P': [{'_id': 'P/a'}, {'_id': 'P/b'}, {'_id': 'P/c'}],
+        'follows': [
+            {'_from': 'P/b', '_to': 'P/a'},
+            {'_from': 'P/a', '_to': 'P/c'},
+            {'_from': 'P/b', '_to': 'P/c'},
+            # outside of the subgraph
+            {'_from': 'P/a', '_to': 'Q/x'},
+        ],
+    }
+
+    client = mock.Mock()
+    client.exports.create.side_effect = lambda collection, **kwargs: {
+        'result': collections[collection], 'hasMore': False
+    }
+
+    path = str(tmpdir.join('graph.csr')) if mapped else None
+
+    with mock.patch.object(cursor.Cursor.__class__, 'client', new_callable=mock.PropertyMock, return_value=client):
+        matrix = adjacency.export_adjacency(['P'], ['follows'], path=path, chunk=1)
+
+    assert (matrix.mapped is not None) == (mapped and cast)
+
+    with matrix:
+        assert matrix.ids == ['P/a', 'P/b', 'P/c']
+        assert list(matrix.offsets) == [0, 1, 3, 3]
+        assert len(matrix) == 3
+        assert list(matrix.row(0)) == [2]
+        assert list(matrix.row(1)) == [0, 2]
+
+    if mapped:
+        from array import array
+
+        stored = array('l')
+        with open(path, 'rb') as fileobj:
+            stored.fromfile(fileobj, 7)
+
+        assert list(stored) == [0, 1, 3, 3, 2, 0, 2]
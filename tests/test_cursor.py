@@ -0,0 +1,250 @@
+import bz2
+import gzip
+import io
+
+import pytest
+
+try:
+    import unittest.mock as mock
+except ImportError:
+    import mock
+
+
+def cursors(*batches):
+    """Serve batches like the cursor api."""
+
+    api = mock.Mock()
+
+    results = [
+        {'result': batch, 'hasMore': i < len(batches) - 1, 'id': 'cursor'}
+        for i, batch in enumerate(batches)
+    ]
+
+    api.create.return_value = results[0]
+    api.pursue.side_effect = results[1:]
+
+    return api
+
+
+def patch_api(api):
+    from arangodb import cursor
+
+    return mock.patch.object(
+        cursor.Cursor.__class__, 'api', new_callable=mock.PropertyMock, return_value=api)
+
+
+def test_iter_batches():
+    from arangodb import cursor
+
+    with patch_api(cursors([1, 2], [3])) as api:
+        c = cursor.Cursor('FOR d IN @@c RETURN d', {'@c': 'foo'}, batch=2)
+
+        assert list(c.iter_batches()) == [[1, 2], [3]]
+        api.return_value.create.assert_called_once_with('FOR d IN @@c RETURN d', bind={'@c': 'foo'}, batch=2)
+        api.return_value.pursue.assert_called_once_with('cursor')
+
+
+def test_iter_documents_batch():
+    from arangodb import cursor, db
+
+    class Apple(db.Document):
+        pass
+
+    class Pear(db.Document):
+        pass
+
+    class Objective(object):
+        def deserialize_many(self, docs):
+            return [dict(doc, checked=True) for doc in docs]
+
+    Pear.__objective__ = Objective()
+
+    batch = [
+        {'_id': 'Apple/1'},
+        {'_id': 'Pear/1'},
+        {'_id': 'Apple/2'},
+    ]
+
+    with patch_api(cursors(batch, [{'_id': 'Pear/2'}])):
+        docs = list(cursor.Cursor('FOR d IN @@c RETURN d').iter_documents())
+
+    assert [doc['_id'] for doc in docs] == ['Apple/1', 'Pear/1', 'Apple/2', 'Pear/2']
+    assert [type(doc) for doc in docs] == [Apple, Pear, Apple, Pear]
+    assert docs[0].__data__ is batch[0]
+    assert docs[1]['checked']
+    assert not any(doc.dirty for doc in docs)
+
+
+def test_to_columns():
+    from arangodb import cursor
+
+    batches = (
+        [{'a': 1, 'b': {'c': 1.5}}, {'a': None, 'b': {}}],
+        [{'a': 3, 'b': {'c': 2.5}, 'd': 'x'}],
+    )
+
+    with patch_api(cursors(*batches)):
+        columns = cursor.Cursor('FOR d IN @@c RETURN d').to_columns(['a', 'b.c', 'd'], dtypes={'a': 'q', 'b.c': 'd'})
+
+    assert list(columns) == ['a', 'b.c', 'd']
+
+    a = columns['a']
+    assert a.values.tolist() == [1, 0, 3]
+    assert a.mask.tolist() == [0, 1, 0]
+    assert list(a) == [1, None, 3]
+    assert len(a) == 3
+
+    assert list(columns['b.c']) == [1.5, None, 2.5]
+    assert columns['d'].values == [None, None, 'x']
+    assert columns['d'][2] == 'x'
+
+
+def test_export_jsonl():
+    import io
+    import json
+    from arangodb import cursor
+
+    batches = (
+        [{'a': 1, 'b': {'c': 1.5}}, {'b': {}}],
+        [{'a': 3, 'b': {'c': 2.5}, 'd': 'x'}],
+    )
+
+    out = io.StringIO()
+    with patch_api(cursors(*batches)):
+        count = cursor.Cursor('FOR d IN @@c RETURN d').export(out, fields=['a', 'b.c'])
+
+    assert count == 3
+    assert [json.loads(line) for line in out.getvalue().splitlines()] == [
+        {'a': 1, 'b.c': 1.5},
+        {},
+        {'a': 3, 'b.c': 2.5},
+    ]
+
+
+def test_export_path(tmpdir):
+    import csv
+    import io
+    import json
+    from arangodb import cursor
+
+    batches = ([{'a': 1, 'b': u'\xe4'}], [{'a': 2}])
+
+    path = str(tmpdir.join('out.jsonl'))
+    with patch_api(cursors(*batches)):
+        assert cursor.Cursor('FOR d IN @@c RETURN d').export(path) == 2
+
+    with io.open(path, encoding='utf-8') as fileobj:
+        assert [json.loads(line) for line in fileobj] == [{'a': 1, 'b': u'\xe4'}, {'a': 2}]
+
+    path = str(tmpdir.join('out.csv'))
+    with patch_api(cursors(*batches)):
+        assert cursor.Cursor('FOR d IN @@c RETURN d').export(path, format='csv') == 2
+
+    with io.open(path, encoding='utf-8', newline='') as fileobj:
+        assert list(csv.reader(fileobj)) == [['a', 'b'], ['1', u'\xe4'], ['2', '']]
+
+
+def test_export_csv_gzip():
+    import csv
+    import gzip
+    import io
+    from arangodb import cursor
+
+    batches = (
+        [{'a': 1, 'b': [1, 2]}, {'a': None}],
+        [{'a': 'x', 'b': 'y', 'c': 'z'}],
+    )
+
+    out = io.BytesIO()
+    with patch_api(cursors(*batches)):
+        count = cursor.Cursor('FOR d IN @@c RETURN d').export(out, format='csv', compression='gzip')
+
+    assert count == 3
+    assert not out.closed
+
+    text = gzip.GzipFile(fileobj=io.BytesIO(out.getvalue())).read().decode('utf-8')
+    assert list(csv.reader(io.StringIO(text))) == [
+        ['a', 'b'],
+        ['1', '[1, 2]'],
+        ['', ''],
+        ['x', 'y'],
+    ]
+
+
+@pytest.mark.parametrize('compression, decompress', [
+    ('gzip', lambda data: gzip.GzipFile(fileobj=io.BytesIO(data)).read()),
+    ('bz2', bz2.decompress),
+])
+@pytest.mark.parametrize('format, text', [
+    ('jsonl', u'{"a": 1, "b": "\\u00e4"}\n{"a": 2}\n'),
+    ('csv', u'a,b\r\n1,\xe4\r\n2,\r\n'),
+])
+def test_export_compressed(compression, decompress, format, text):      # pylint: disable=W0622
+    from arangodb import cursor
+
+    batches = ([{'a': 1, 'b': u'\xe4'}], [{'a': 2}])
+
+    out = io.BytesIO()
+    with patch_api(cursors(*batches)):
+        count = cursor.Cursor('FOR d IN @@c RETURN d').export(
+            out, format=format, fields=['a', 'b'], compression=compression)
+
+    assert count == 2
+    assert not out.closed
+    assert decompress(out.getvalue()).decode('utf-8') == text
+
+
+def test_collection_cursor_export_api():
+    from arangodb import cursor
+
+    client = mock.Mock()
+    client.exports.create.return_value = {'result': [{'a': 1}], 'hasMore': False}
+
+    with mock.patch.object(cursor.Cursor.__class__, 'client', new_callable=mock.PropertyMock, return_value=client):
+        c = cursor.CollectionCursor('foo', fields=['a'], batch=100)
+
+        assert list(c.iter_result()) == [{'a': 1}]
+
+    client.exports.create.assert_called_once_with('foo', fields=['a'], batch=100)
+    assert not client.cursors.create.called
+
+
+def test_collection_cursor_fallback():
+    from arangodb import cursor, exc
+
+    client = mock.Mock()
+    client.exports.create.side_effect = exc.ApiError(501, 9, "not implemented", args=())
+    client.cursors.create.return_value = {'result': [{'a': 1}], 'hasMore': False}
+
+    with mock.patch.object(cursor.Cursor.__class__, 'client', new_callable=mock.PropertyMock, return_value=client):
+        c = cursor.CollectionCursor('foo', fields=['a'])
+
+        assert list(c.iter_result()) == [{'a': 1}]
+
+    client.cursors.create.assert_called_once_with(
+        'FOR doc IN @@collection RETURN KEEP(doc, @fields)', bind={'@collection': 'foo', 'fields': ['a']})
+
+
+def test_prefetch():
+    from arangodb import cursor
+
+    with patch_api(cursors([1, 2], [3], [4])):
+        c = cursor.Cursor('FOR d IN @@c RETURN d', prefetch=True)
+
+        assert list(c.iter_batches()) == [[1, 2], [3], [4]]
+
+
+def test_prefetch_error():
+    import pytest
+    from arangodb import cursor
+
+    api = cursors([1], [2])
+    api.pursue.side_effect = ValueError("lost")
+
+    with patch_api(api):
+        batches = cursor.Cursor('FOR d IN @@c RETURN d', prefetch=True).iter_batches()
+
+        assert next(batches) == [1]
+
+        with pytest.raises(ValueError):
+            next(batches)
@@ -6,3 +6,442 @@ class TestDocumentDict(object):
         doc = db.Document(data)
 
         assert dict(doc) == data
+
+
+class TestDocumentCache(object):
+    def test_lru(self):
+        from arangodb import cache
+
+        c = cache.DocumentCache(size=2)
+
+        for i in range(3):
+            c.put({'_id': 'foo/{0}'.format(i), '_rev': '1'})
+
+        assert 'foo/0' not in c
+        assert c.get('foo/1') == {'_id': 'foo/1', '_rev': '1'}
+
+        c.put({'_id': 'foo/3', '_rev': '1'})
+
+        assert 'foo/1' in c
+        assert 'foo/2' not in c
+
+    def test_max_bytes(self):
+        from arangodb import cache
+
+        c = cache.DocumentCache(max_bytes=100)
+
+        c.put({'_id': 'foo/1', '_rev': '1', 'text': 'x' * 50})
+        c.put({'_id': 'foo/2', '_rev': '1', 'text': 'x' * 50})
+
+        assert list(c.entries) == ['foo/2']
+        assert c.bytes <= 100
+
+        c.put({'_id': 'foo/3', '_rev': '1', 'text': 'x' * 200})
+
+        assert 'foo/3' not in c
+
+    def test_load_revalidates(self):
+        try:
+            import unittest.mock as mock
+        except ImportError:
+            import mock
+
+        from arangodb import db, cache
+
+        class Config(db.Document):
+            __cache__ = cache.DocumentCache()
+
+        api = mock.Mock()
+        api.get.side_effect = [
+            {'_id': 'Config/1', '_key': '1', '_rev': '1', 'foo': 'bar'},
+            None,
+            {'_id': 'Config/1', '_key': '1', '_rev': '3', 'foo': 'baz'},
+        ]
+
+        with mock.patch.object(db.Document.__class__, 'api', new_callable=mock.PropertyMock) as patched_api:
+            patched_api.return_value = api
+
+            assert Config.load('1')['foo'] == 'bar'
+
+            config = Config.load('1')
+            assert config['foo'] == 'bar'
+            assert isinstance(config, Config)
+
+            config['foo'] = 'local'
+            assert Config.load('1')['foo'] == 'baz'
+
+            assert api.get.call_args_list == [
+                mock.call('Config', '1'),
+                mock.call('Config', '1', rev='1'),
+                mock.call('Config', '1', rev='1'),
+            ]
+
+            api.update.return_value = {'_id': 'Config/1', '_key': '1', '_rev': '4'}
+            config.save()
+            assert Config.__cache__.get('Config/1')['_rev'] == '4'
+
+            config.delete()
+            assert 'Config/1' not in Config.__cache__
+
+
+class TestDirtyFields(object):
+    @staticmethod
+    def api():
+        try:
+            import unittest.mock as mock
+        except ImportError:
+            import mock
+
+        from arangodb import db
+
+        patched = mock.patch.object(db.Document.__class__, 'api', new_callable=mock.PropertyMock)
+
+        return patched
+
+    def test_loaded_is_clean(self):
+        from arangodb import db
+
+        doc = db.Document._polymorph({'_id': 'Document/1', '_key': '1', '_rev': '1', 'foo': 'bar'})
+
+        assert not doc.dirty
+
+        doc['foo'] = 'baz'
+
+        assert doc.dirty
+
+    def test_save_nothing(self):
+        from arangodb import db
+
+        with self.api() as api:
+            doc = db.Document._polymorph({'_id': 'Document/1', '_key': '1', '_rev': '1', 'foo': 'bar'})
+            doc.save()
+
+            assert not api.return_value.update.called
+            assert not api.return_value.replace.called
+
+    def test_save_patch(self):
+        from arangodb import db
+
+        with self.api() as api:
+            api.return_value.update.return_value = {'_id': 'Document/1', '_key': '1', '_rev': '2'}
+
+            doc = db.Document._polymorph({'_id': 'Document/1', '_key': '1', '_rev': '1', 'foo': 'bar', 'x': 1})
+            doc['foo'] = None
+            doc.save()
+
+            api.return_value.update.assert_called_once_with({'foo': None}, 'Document/1', keep=True, merge=False)
+            assert doc['_rev'] == '2'
+            assert not doc.dirty
+
+            del doc['x']
+            doc['y'] = 2
+            doc.save()
+
+            api.return_value.update.assert_called_with({'x': None, 'y': 2}, 'Document/1', keep=False, merge=False)
+
+    def test_save_replace(self):
+        from arangodb import db
+
+        with self.api() as api:
+            api.return_value.replace.return_value = {'_id': 'Document/1', '_key': '1', '_rev': '2'}
+
+            doc = db.Document._polymorph({'_id': 'Document/1', '_key': '1', '_rev': '1', 'foo': 'bar', 'x': 1})
+
+            # a null and a deleted key cannot be patched together
+            doc['foo'] = None
+            del doc['x']
+            doc.save()
+
+            api.return_value.replace.assert_called_once_with(
+                {'_id': 'Document/1', '_key': '1', '_rev': '1', 'foo': None}, 'Document/1')
+
+
+class TestCompactDocument(object):
+    def test_compact(self):
+        import pytest
+        from arangodb import db
+
+        class Row(db.Document):
+            __compact__ = True
+
+        class SubRow(Row):
+            pass
+
+        data = {'_id': 'SubRow/1', 'foo': 'bar'}
+        row = db.Document._polymorph(data)
+
+        assert isinstance(row, SubRow)
+        assert row.__data__ is data
+        assert row.serialize() is data
+        assert SubRow.deserialize(data) is data
+
+        with pytest.raises(AttributeError):
+            row.foo = 'bar'
+
+    def test_not_adoptable(self):
+        from arangodb import db
+
+        class Upper(db.Document):
+            def __setitem__(self, key, value):
+                super(Upper, self).__setitem__(key, value.upper())
+
+        data = {'_id': 'Upper/1', 'foo': 'bar'}
+        doc = db.Document._polymorph(data)
+
+        assert not Upper.__adoptable__
+        assert db.Edge.__adoptable__
+        assert doc['foo'] == 'BAR'
+        assert data['foo'] == 'bar'
+        assert not doc.dirty
+
+    def test_mixin_not_adoptable(self):
+        from arangodb import db
+
+        class Initialized(object):
+            def __init__(self, *args, **kwargs):
+                super(Initialized, self).__init__(*args, **kwargs)
+                self['initialized'] = True
+
+        class Mixed(Initialized, db.Document):
+            pass
+
+        class Plain(object):
+            pass
+
+        class Unmixed(Plain, db.Document):
+            pass
+
+        assert not Mixed.__adoptable__
+        assert Unmixed.__adoptable__
+        assert db.Document._polymorph({'_id': 'Mixed/1'})['initialized']
+
+
+class TestLazyDocument(object):
+    def test_lazy_deserialize(self):
+        from arangodb import db
+
+        class Wide(db.Document):
+            pass
+
+        class Objective(object):
+            calls = 0
+
+            def deserialize(self, doc):
+                self.calls += 1
+                return dict(doc, checked=True)
+
+        Wide.__objective__ = objective = Objective()
+
+        raw = {'_id': 'Wide/1', '_key': '1', 'foo': {'bar': [1, 2]}}
+
+        doc = db.Document._polymorph_lazy(raw)
+
+        assert isinstance(doc, Wide)
+        assert doc.__raw__ is raw
+        assert objective.calls == 0
+
+        assert doc['foo'] == {'bar': [1, 2]}
+        assert doc['checked']
+        assert 'qux' not in doc
+        assert doc.__raw__ is None
+        assert objective.calls == 1
+        assert not doc.dirty
+
+        doc = db.Document._polymorph_lazy(dict(raw))
+        doc['qux'] = 1
+
+        assert dict(doc) == dict(raw, checked=True, qux=1)
+        assert doc.__dirty__ == {'qux'}
+
+    def test_nothing_to_defer(self):
+        from arangodb import db
+
+        raw = {'_id': 'Document/1', 'foo': 1}
+        doc = db.Document._polymorph_lazy(raw)
+
+        assert doc.__raw__ is None
+        assert doc.__data__ is raw
+        assert doc.serialize() == raw
+
+
+class TestIterAll(object):
+    def test_scan(self):
+        try:
+            import unittest.mock as mock
+        except ImportError:
+            import mock
+
+        from arangodb import db, cursor
+
+        client = mock.Mock()
+        client.exports.create.return_value = {
+            'result': [{'_id': 'Document/1', '_key': '1', '_rev': '1', 'foo': 1}],
+            'hasMore': True, 'id': 'export'
+        }
+        client.cursors.pursue.return_value = {
+            'result': [{'_id': 'Document/2', '_key': '2', '_rev': '1', 'foo': 2}],
+            'hasMore': False
+        }
+
+        with mock.patch.object(cursor.Cursor.__class__, 'client', new_callable=mock.PropertyMock,
+                               return_value=client):
+            docs = list(db.Document._iter_all(batch=1, fields=['foo'], prefetch=True))
+
+        client.exports.create.assert_called_once_with('Document', fields=['foo', '_id', '_key', '_rev'], batch=1)
+        client.cursors.pursue.assert_called_once_with('export')
+
+        assert [doc['foo'] for doc in docs] == [1, 2]
+        assert all(isinstance(doc, db.Document) and not doc.dirty for doc in docs)
+
+    def test_save_partial(self):
+        try:
+            import unittest.mock as mock
+        except ImportError:
+            import mock
+
+        import pytest
+        from arangodb import api, db, cursor, exc
+
+        class Projected(db.Document):
+            pass
+
+        class Objective(object):
+            def deserialize(self, doc):
+                return dict(doc)
+
+            def serialize(self, doc):
+                return dict(doc)
+
+        Projected.__objective__ = Objective()
+
+        client = mock.Mock()
+        client.exports.create.return_value = {
+            'result': [{'_id': 'Projected/1', '_key': '1', '_rev': '1', 'foo': 1}], 'hasMore': False
+        }
+
+        proxy = mock.Mock()
+        proxy.patch.return_value = {'_id': 'Projected/1', '_key': '1', '_rev': '2'}
+
+        with mock.patch.object(cursor.Cursor.__class__, 'client', new_callable=mock.PropertyMock,
+                               return_value=client), \
+                mock.patch.object(db.Document.__class__, 'api', new_callable=mock.PropertyMock,
+                                  return_value=api.Documents(proxy)):
+            doc, = Projected._iter_all(fields=['foo'])
+
+            doc.save()
+            assert not proxy.patch.called
+
+            doc['foo'] = 2
+            doc.save()
+
+            assert not proxy.put.called
+            proxy.patch.assert_called_once_with(
+                'Projected/1', json={'_id': 'Projected/1', '_key': '1', '_rev': '1', 'foo': 2},
+                params={'keepNull': True, 'mergeObjects': False}
+            )
+
+            del doc['foo']
+
+            with pytest.raises(exc.ArangoException):
+                doc.save()
+
+
+class TestLoadMany(object):
+    @staticmethod
+    def cursor(*results):
+        try:
+            import unittest.mock as mock
+        except ImportError:
+            import mock
+
+        patched = mock.patch("arangodb.cursor.Cursor")
+        patched.new = mock.MagicMock()
+        patched.new.return_value.iter_result.return_value = list(results)
+
+        return patched
+
+    def test_order_and_polymorph(self):
+        from arangodb import db
+
+        class Lower(db.Document):
+            pass
+
+        with self.cursor({'_id': 'Document/1', '_key': '1'}, None, {'_id': 'Lower/1', '_key': '1'}) as cursor:
+            docs = db.Document.load_many(['1', '2', 'Lower/1'])
+
+        cursor.assert_called_once_with(
+            'FOR handle IN @value_0 RETURN DOCUMENT(handle)',
+            {'value_0': ['Document/1', 'Document/2', 'Lower/1']}
+        )
+
+        assert type(docs[0]) is db.Document
+        assert docs[1] is None
+        assert type(docs[2]) is Lower
+
+    def test_strict(self):
+        import pytest
+        from arangodb import db, exc
+
+        with self.cursor(None, {'_id': 'Document/2', '_key': '2'}, None):
+            with pytest.raises(exc.DocumentNotFound) as info:
+                db.Document.load_many(['1', '2', '3'], strict=True)
+
+        assert info.value.kwargs == {'keys': ['1', '3']}
+
+
+class TestSaveMany(object):
+    @staticmethod
+    def client():
+        try:
+            import unittest.mock as mock
+        except ImportError:
+            import mock
+
+        from arangodb import db
+
+        return mock.patch.object(db.Document.__class__, 'client', new_callable=mock.PropertyMock)
+
+    def test_save_many(self):
+        from arangodb import db, exc
+
+        with self.client() as client:
+            documents = client.return_value.documents
+            documents.create_many.return_value = [
+                {'_id': 'Document/new', '_key': 'new', '_rev': '1'},
+                exc.ApiError(409, 1210, "unique constraint violated", args=()),
+            ]
+            documents.update_many.return_value = [{'_id': 'Document/1', '_key': '1', '_rev': '2'}]
+
+            new = db.Document(foo=1)
+            duplicate = db.Document(_key='dup', foo=2)
+            modified = db.Document._polymorph({'_id': 'Document/1', '_key': '1', '_rev': '1', 'foo': 3})
+            modified['foo'] = 4
+            unmodified = db.Document._polymorph({'_id': 'Document/2', '_key': '2', '_rev': '1'})
+
+            results = db.Document.save_many([new, duplicate, modified, unmodified], chunk=2, overwrite='ignore')
+
+            documents.create_many.assert_called_once_with(
+                'Document', [{'foo': 1}, {'_key': 'dup', 'foo': 2}], overwrite='ignore')
+            documents.update_many.assert_called_once_with(
+                'Document', [{'_key': '1', 'foo': 4}], keep=True, merge=False)
+            assert not documents.replace_many.called
+
+        assert results[0]['_key'] == 'new'
+        assert isinstance(results[1], exc.UniqueConstraintViolated)
+        assert results[3] is None
+
+        assert new['_id'] == 'Document/new' and not new.dirty
+        assert '_id' not in duplicate
+        assert modified['_rev'] == '2' and not modified.dirty
+
+    def test_chunks(self):
+        from arangodb import db
+
+        with self.client() as client:
+            documents = client.return_value.documents
+            documents.delete_many.side_effect = lambda collection, keys: [{'_key': key} for key in keys]
+
+            docs = [db.Document(_id='Document/{0}'.format(i), _key=str(i)) for i in range(5)]
+
+            assert db.Document.delete_many(docs, chunk=2) == [{'_key': str(i)} for i in range(5)]
+            assert [call[0][1] for call in documents.delete_many.call_args_list] == [['0', '1'], ['2', '3'], ['4']]
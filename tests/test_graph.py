@@ -1,3 +1,11 @@
+try:
+    import unittest.mock as mock
+except ImportError:
+    import mock
+
+import pytest
+
+
 class TestGraphEdge(object):
     def test_collection_name(self):
         from arangodb import db, graph
@@ -11,6 +19,75 @@ class TestGraphEdge(object):
         assert MyGraphEdge.__collection_name__ == "MyEdge"
 
 
+@pytest.fixture(scope='module')
+def Map():
+    from arangodb import db, graph
+
+    class Town(db.Document):
+        pass
+
+    class Street(db.Document):
+        pass
+
+    class Road(db.Edge):
+        pass
+
+    class Map(graph.Graph):
+        class road(graph.GraphEdge, Road):
+            pass
+
+        @road.from_vertex
+        @road.to_vertex
+        class town(graph.GraphVertex, Town):
+            pass
+
+        class street(graph.GraphVertex, Street):
+            pass
+
+    return Map
+
+
+def test_members(Map):
+    from arangodb import graph
+
+    class SubMap(Map):
+        class street(graph.GraphVertex, Map.street.__bases__[1]):
+            pass
+
+    assert Map.__graph_edges__ == {'Road': Map.road}
+    assert Map.__graph_vertices__ == {'Town': Map.town, 'Street': Map.street}
+    assert Map.road.__graph__ is Map
+
+    # inherited members still belong to the base graph
+    assert SubMap.__graph_vertices__ == {'Town': Map.town, 'Street': SubMap.street}
+    assert SubMap.street.__graph__ is SubMap
+    assert Map.town.__graph__ is Map
+
+
+class TestBulk(object):
+    def test_invalid_edge(self, Map):
+        from arangodb import exc
+
+        edge = Map.road(_from='Town/1', _to='Street/1')
+
+        with pytest.raises(exc.InvalidEdge):
+            Map.road.save_many([edge])
+
+    @mock.patch("arangodb.cursor.Cursor")
+    def test_delete_vertices(self, Cursor, Map):
+        from arangodb import db
+
+        with mock.patch.object(db.Document.__class__, 'client', new_callable=mock.PropertyMock) as client:
+            client.return_value.documents.delete_many.return_value = [{'_key': '1'}]
+
+            Map.town.delete_many([Map.town(_id='Town/1', _key='1')])
+
+        Cursor.assert_called_once_with(
+            'FOR edge IN @@c_0 FILTER edge.`_from` IN @value_0 OR edge.`_to` IN @value_1 REMOVE edge IN @@c_1',
+            {'@c_0': 'Road', 'value_0': ['Town/1'], 'value_1': ['Town/1'], '@c_1': 'Road'}
+        )
+
+
 def test_graph(docker_arangodb):
     from arangodb import db, graph
 
@@ -68,3 +145,115 @@ def test_graph(docker_arangodb):
         "edgeDefinitions": [G1.edge.__definition__],
         "orphanCollections": ["D3"]
     }
+
+
+class TestBulkLoad(object):
+    @staticmethod
+    def client():
+        from arangodb import meta
+
+        return mock.patch.object(meta.MetaBase, 'client', new_callable=mock.PropertyMock)
+
+    def test_vertices_first(self, Map):
+        with self.client() as client:
+            documents = client.return_value.documents
+            documents.create_many.side_effect = [
+                [{'_id': 'Town/a', '_key': 'a', '_rev': '1'}, {'_id': 'Town/b', '_key': 'b', '_rev': '1'}],
+                [{'_id': 'Road/1', '_key': '1', '_rev': '1'}],
+            ]
+
+            a, b = Map.town(name='a'), Map.town(name='b')
+
+            vertices, edges = Map.bulk_load([a, b], [(Map.road, a, b, {'length': 3})])
+
+            assert [call[0] for call in documents.create_many.call_args_list] == [
+                ('Town', [{'name': 'a'}, {'name': 'b'}]),
+                ('Road', [{'_from': 'Town/a', '_to': 'Town/b', 'length': 3}]),
+            ]
+
+        assert a['_id'] == 'Town/a'
+        assert edges == [{'_id': 'Road/1', '_key': '1', '_rev': '1'}]
+
+    def test_unsaved_vertex(self, Map):
+        from arangodb import exc
+
+        with self.client() as client:
+            documents = client.return_value.documents
+            error = exc.ApiError(409, 1210, "unique constraint violated", args=())
+            documents.create_many.return_value = [{'_id': 'Town/a', '_key': 'a', '_rev': '1'}, error]
+
+            a, b = Map.town(name='a'), Map.town(name='b')
+
+            vertices, edges = Map.bulk_load([a, b], [(Map.road, a, b)])
+
+            assert vertices[1] is error
+            assert isinstance(edges[0], exc.InvalidEdge)
+            assert documents.create_many.call_count == 1
+
+    def test_validate_locally(self, Map):
+        from arangodb import exc
+
+        with self.client() as client:
+            town, street = Map.town(name='a'), Map.street(name='b')
+
+            with pytest.raises(exc.InvalidEdge):
+                Map.bulk_load([town, street], [(Map.road, town, street)])
+
+            with pytest.raises(TypeError):
+                Map.bulk_load([Map.road(_from='Town/1', _to='Town/2')])
+
+            assert not client.return_value.mock_calls
+
+
+class TestPaths(object):
+    @mock.patch("arangodb.cursor.Cursor")
+    def test_shortest_path(self, Cursor, Map):
+        Cursor.return_value.iter_result.return_value = [
+            {'vertex': {'_id': 'Town/1', '_key': '1'}, 'edge': None},
+            {'vertex': {'_id': 'Town/2', '_key': '2'},
+             'edge': {'_id': 'Road/1', '_key': '1', '_from': 'Town/1', '_to': 'Town/2', 'km': 5}},
+            {'vertex': {'_id': 'Town/3', '_key': '3'},
+             'edge': {'_id': 'Road/2', '_key': '2', '_from': 'Town/2', '_to': 'Town/3', 'km': None}},
+            {'vertex': {'_id': 'Town/4', '_key': '4'},
+             'edge': {'_id': 'Road/3', '_key': '3', '_from': 'Town/3', '_to': 'Town/4', 'km': 'far'}},
+        ]
+
+        path = Map.shortest_path(Map.town(_id='Town/1'), 'Town/4', direction='outbound', weight='km',
+                                 default_weight=10)
+
+        Cursor.assert_called_once_with(
+            'FOR vertex, edge IN OUTBOUND SHORTEST_PATH @value_0 TO @value_1 GRAPH @value_2 '
+            'OPTIONS {"defaultWeight": 10, "weightAttribute": "km"} RETURN {"edge": edge, "vertex": vertex}',
+            {'value_0': 'Town/1', 'value_1': 'Town/4', 'value_2': 'Map'}
+        )
+
+        assert [vertex['_id'] for vertex in path] == ['Town/1', 'Town/2', 'Town/3', 'Town/4']
+        assert [vertex.__class__.__name__ for vertex in path.vertices] == ['Town'] * 4
+        assert [edge.__class__.__name__ for edge in path.edges] == ['Road'] * 3
+
+        # null and non-numeric weights are the default weight like on the server
+        assert (len(path), path.weight) == (3, 25)
+        assert (path.start['_id'], path.target['_id']) == ('Town/1', 'Town/4')
+
+        Cursor.return_value.iter_result.return_value = []
+
+        assert Map.shortest_path('Town/1', 'Town/4') is None
+
+    @mock.patch("arangodb.cursor.Cursor")
+    def test_k_shortest_paths(self, Cursor, Map):
+        Cursor.return_value.iter_result.return_value = [{
+            'vertices': [{'_id': 'Town/1', '_key': '1'}, {'_id': 'Town/2', '_key': '2'}],
+            'edges': [{'_id': 'Road/1', '_key': '1', '_from': 'Town/1', '_to': 'Town/2'}],
+            'weight': 1,
+        }]
+
+        paths = Map.k_shortest_paths('Town/1', 'Town/2', 5)
+
+        Cursor.assert_called_once_with(
+            'FOR path IN ANY K_SHORTEST_PATHS @value_0 TO @value_1 GRAPH @value_2 LIMIT 5 RETURN path',
+            {'value_0': 'Town/1', 'value_1': 'Town/2', 'value_2': 'Map'}
+        )
+
+        assert len(paths) == 1
+        assert paths[0].edges[0].__class__.__name__ == 'Road'
+        assert paths[0].weight == 1
@@ -0,0 +1,127 @@
+try:
+    import unittest.mock as mock
+except ImportError:
+    import mock
+
+import pytest
+
+
+class FakePregel(object):
+
+    """Simulate the lifecycle of pregel jobs like the server."""
+
+    def __init__(self, polls=2, final='done'):
+        self.polls = polls
+        self.final = final
+        self.jobs = {}
+
+    def start(self, algorithm, graph=None, vertex_collections=None, edge_collections=None, params=None):
+        job_id = str(len(self.jobs) + 1)
+        self.jobs[job_id] = {'algorithm': algorithm, 'graph': graph, 'params': params, 'polls': 0,
+                             'state': 'running'}
+
+        return job_id
+
+    def status(self, job_id):
+        job = self.jobs[job_id]
+        job['polls'] += 1
+
+        if job['state'] == 'running' and job['polls'] > self.polls:
+            job['state'] = self.final
+
+        return {'state': job['state'], 'gss': job['polls']}
+
+    def cancel(self, job_id):
+        self.jobs[job_id]['state'] = 'canceled'
+
+        return ''
+
+
+@pytest.fixture
+def Social():
+    from arangodb import db, graph
+
+    class Fan(db.Document):
+        pass
+
+    class Likes(db.Edge):
+        pass
+
+    class Social(graph.Graph):
+        class likes(graph.GraphEdge, Likes):
+            pass
+
+        @likes.from_vertex
+        @likes.to_vertex
+        class fan(graph.GraphVertex, Fan):
+            pass
+
+    yield Social
+
+    for name in ('Fan', 'Likes'):
+        db.Document.__documents__.pop(name)
+
+
+@pytest.fixture
+def client():
+    from arangodb import meta
+
+    client = mock.Mock()
+    client.pregel = FakePregel()
+
+    with mock.patch.object(meta.MetaBase, 'client', new_callable=mock.PropertyMock, return_value=client):
+        yield client
+
+
+def test_lifecycle(Social, client):
+    job = Social.pagerank(maxGSS=10)
+
+    assert client.pregel.jobs[job.id]['params'] == {'maxGSS': 10, 'store': True, 'resultField': 'result'}
+    assert client.pregel.jobs[job.id]['graph'] == 'Social'
+    assert job.status()['state'] == 'running'
+
+    assert job.wait(interval=0)['state'] == 'done'
+
+
+@pytest.mark.parametrize('final', ['fatal error', 'in error'])
+def test_failed(Social, client, final):
+    from arangodb import exc
+
+    client.pregel.final = final
+
+    with pytest.raises(exc.PregelFailed):
+        Social.connected_components().wait(interval=0)
+
+    client.pregel.polls = 100
+
+    job = Social.label_propagation()
+
+    with pytest.raises(exc.PregelTimeout):
+        job.wait(interval=0, timeout=0)
+
+    job.cancel()
+
+    with pytest.raises(exc.PregelFailed):
+        job.wait(interval=0)
+
+
+@mock.patch("arangodb.cursor.Cursor")
+def test_results(Cursor, Social, client):
+    Cursor.return_value.iter_result.return_value = [{'_id': 'Fan/1', '_key': '1', 'rank': 0.5}]
+
+    job = Social.pagerank(store=False, result_field='rank')
+
+    assert list(job.iter_results()) == [{'_id': 'Fan/1', '_key': '1', 'rank': 0.5}]
+    Cursor.assert_called_once_with('FOR vertex IN PREGEL_RESULT(@value_0) RETURN vertex', {'value_0': job.id})
+
+    Cursor.reset_mock()
+
+    job = Social.sssp(Social.fan(_id='Fan/1'))
+
+    assert client.pregel.jobs[job.id]['params']['source'] == 'Fan/1'
+
+    list(job.iter_results())
+    Cursor.assert_called_once_with(
+        'FOR vertex IN @@c_0 RETURN KEEP(vertex, @value_0, @value_1, @value_2)',
+        {'@c_0': 'Fan', 'value_0': '_id', 'value_1': '_key', 'value_2': 'result'}
+    )
@@ -300,3 +300,274 @@ def test_remove_query():
     qstr, params = q.query()
 
     assert qstr == "FOR foo IN @@c_0 REMOVE foo IN @@c_0"
+
+
+def test_collect_query():
+    from arangodb import query
+
+    a = query.Alias("foo")
+    city = query.Alias("city")
+    total = query.Alias("total")
+
+    q = query.Query(a, query.Collection("bar"))\
+        .collect(city=a.city)\
+        .aggregate(total=query.SUM(a.amount))\
+        .sort(query.Desc(total))\
+        .action(city)
+
+    qstr, params = q.query()
+
+    assert qstr == "FOR foo IN @@c_0 COLLECT city = foo.`city` AGGREGATE total = SUM(foo.`amount`) "\
+        "SORT total DESC RETURN city"
+    assert params == {
+        "@c_0": "bar"
+    }
+
+
+def test_collect_aggregate_with_count():
+    import pytest
+    from arangodb import query
+
+    a = query.Alias("foo")
+
+    assert query.Query(a, query.Collection("bar")).action(query.COUNT(a.tags)).query()[0] == \
+        "FOR foo IN @@c_0 RETURN COUNT(foo.`tags`)"
+
+    q = query.Query(a, query.Collection("bar")).collect(city=a.city).aggregate(total=query.SUM(a.amount))
+
+    with pytest.raises(TypeError):
+        q.with_count("length")
+
+    q = query.Query(a, query.Collection("bar")).collect(city=a.city).with_count("length")
+
+    with pytest.raises(TypeError):
+        q.aggregate(total=query.COUNT(a.amount))
+
+
+def test_collect_with_count():
+    from arangodb import query
+
+    a = query.Alias("foo")
+
+    q = query.Query(a, query.Collection("bar"))\
+        .filter(a.age > 18)\
+        .collect((query.Alias("city"), a.city))\
+        .with_count("length")\
+        .action(query.Alias("length"))
+
+    qstr, params = q.query()
+
+    assert qstr == "FOR foo IN @@c_0 FILTER foo.`age` > @value_0 "\
+        "COLLECT city = foo.`city` WITH COUNT INTO length RETURN length"
+    assert params == {
+        "@c_0": "bar",
+        "value_0": 18
+    }
+
+
+def test_aggregate_needs_function():
+    import pytest
+    from arangodb import query
+
+    a = query.Alias("foo")
+
+    with pytest.raises(TypeError):
+        query.Query(a, query.Collection("bar")).aggregate(total=a.amount)
+
+
+def test_distinct():
+    import pytest
+    from arangodb import query
+
+    a = query.Alias("foo")
+
+    q = query.Query(a, query.Collection("bar")).action(a.city).distinct()
+
+    qstr, _ = q.query()
+
+    assert qstr == "FOR foo IN @@c_0 RETURN DISTINCT foo.`city`"
+
+    with pytest.raises(TypeError):
+        query.Query(a, query.Collection("bar")).distinct()
+
+
+def test_insert_query():
+    from arangodb import query
+
+    a = query.Alias("doc")
+    docs = [{"foo": 1}, {"foo": 2}]
+
+    q = query.Query(a, docs).action(query.Insert(a, "bar", options={"ignoreErrors": True}, returns=query.NEW))
+
+    qstr, params = q.query()
+
+    assert qstr == 'FOR doc IN @value_0 INSERT doc INTO @@c_0 OPTIONS {"ignoreErrors": true} RETURN NEW'
+    assert params == {
+        'value_0': docs,
+        '@c_0': 'bar'
+    }
+
+
+def test_update_query():
+    from arangodb import query
+
+    a = query.Alias("foo")
+    c = query.Collection("bar")
+
+    q = query.Query(a, c)\
+        .filter(a.count > 1)\
+        .action(query.Update(a, c, {"count": 0}, options={"mergeObjects": False}, returns=query.OLD._key))
+
+    qstr, params = q.query()
+
+    assert qstr == 'FOR foo IN @@c_0 FILTER foo.`count` > @value_0 '\
+        'UPDATE foo WITH @value_1 IN @@c_0 OPTIONS {"mergeObjects": false} RETURN OLD.`_key`'
+    assert params == {
+        '@c_0': 'bar',
+        'value_0': 1,
+        'value_1': {"count": 0}
+    }
+
+
+def test_replace():
+    from arangodb import query
+
+    a = query.Alias("foo")
+    q = query.Replace(a, query.Collection("bar"), options={"waitForSync": True})
+
+    qstr, params = q.query()
+
+    assert qstr == 'REPLACE foo IN @@c_0 OPTIONS {"waitForSync": true}'
+    assert params == {
+        '@c_0': 'bar'
+    }
+
+
+def test_upsert():
+    from arangodb import query
+
+    q = query.Upsert({"name": "foo"}, {"name": "foo", "count": 1}, {"count": 2}, "bar", returns="NEW")
+
+    qstr, params = q.query()
+
+    assert qstr == 'UPSERT @value_0 INSERT @value_1 UPDATE @value_2 IN @@c_0 RETURN NEW'
+    assert params == {
+        '@c_0': 'bar',
+        'value_0': {"name": "foo"},
+        'value_1': {"name": "foo", "count": 1},
+        'value_2': {"count": 2},
+    }
+
+    q.replace = True
+    qstr, _ = q.query()
+
+    assert qstr == 'UPSERT @value_0 INSERT @value_1 REPLACE @value_2 IN @@c_0 RETURN NEW'
+
+
+def test_traversal_query():
+    from arangodb import query
+
+    v, e, p = query.Alias("v"), query.Alias("e"), query.Alias("p")
+
+    q = query.Query(
+        (v, e, p),
+        query.Traversal(
+            "foo/1", ["bar", "baz"], direction="outbound", depth=(1, 3),
+            prune=v.name == "x", unique_vertices="path", bfs=True
+        )
+    ).action(v)
+
+    qstr, params = q.query()
+
+    assert qstr == 'FOR v, e, p IN 1..3 OUTBOUND @value_0 @@c_0, @@c_1 PRUNE v.`name` == @value_1 '\
+        'OPTIONS {"bfs": true, "uniqueVertices": "path"} RETURN v'
+    assert params == {
+        'value_0': 'foo/1',
+        'value_1': 'x',
+        '@c_0': 'bar',
+        '@c_1': 'baz',
+    }
+
+
+def test_traversal_graph():
+    import pytest
+    from arangodb import query
+
+    v = query.Alias("v")
+
+    q = query.Query(v, query.Traversal("foo/1", graph="social", direction="INBOUND", depth=2)).action(v)
+
+    qstr, params = q.query()
+
+    assert qstr == 'FOR v IN 2..2 INBOUND @value_0 GRAPH @value_1 RETURN v'
+    assert params == {
+        'value_0': 'foo/1',
+        'value_1': 'social',
+    }
+
+    with pytest.raises(TypeError):
+        query.Traversal("foo/1")
+
+    with pytest.raises(TypeError):
+        query.Traversal("foo/1", "bar", direction="sideways")
+
+
+def test_lazy_query():
+    import pytest
+    from arangodb import query
+
+    a = query.Alias("foo")
+
+    q = query.Query(a, query.Collection("bar")).action(a).lazy()
+
+    qstr, params = q.query()
+
+    assert qstr == "FOR foo IN @@c_0 RETURN foo"
+    assert q.cursor.lazy
+
+    with pytest.raises(TypeError):
+        query.Query(a, query.Collection("bar"), query.Remove(a, "bar")).lazy()
+
+
+def test_shortest_path():
+    from arangodb import query
+
+    v, e = query.Alias("v"), query.Alias("e")
+
+    q = query.Query(
+        (v, e),
+        query.ShortestPath("foo/1", "foo/2", ["bar", "baz"], direction="outbound", weight="distance",
+                           default_weight=2)
+    ).action(v)
+
+    qstr, params = q.query()
+
+    assert qstr == 'FOR v, e IN OUTBOUND SHORTEST_PATH @value_0 TO @value_1 @@c_0, @@c_1 '\
+        'OPTIONS {"defaultWeight": 2, "weightAttribute": "distance"} RETURN v'
+    assert params == {
+        'value_0': 'foo/1',
+        'value_1': 'foo/2',
+        '@c_0': 'bar',
+        '@c_1': 'baz',
+    }
+
+
+def test_k_shortest_paths():
+    import pytest
+    from arangodb import query
+
+    p = query.Alias("p")
+
+    q = query.Query(p, query.KShortestPaths("foo/1", "foo/2", graph="social")).limit(3).action(p)
+
+    qstr, params = q.query()
+
+    assert qstr == 'FOR p IN ANY K_SHORTEST_PATHS @value_0 TO @value_1 GRAPH @value_2 LIMIT 3 RETURN p'
+    assert params == {
+        'value_0': 'foo/1',
+        'value_1': 'foo/2',
+        'value_2': 'social',
+    }
+
+    with pytest.raises(TypeError):
+        query.KShortestPaths("foo/1", "foo/2")
@@ -0,0 +1,95 @@
+try:
+    import unittest.mock as mock
+except ImportError:
+    import mock
+
+import pytest
+
+
+@pytest.fixture
+def client():
+    from arangodb import meta, schema
+
+    client = mock.Mock(endpoint='http://localhost:8529', database='test')
+    client.collections.get.return_value = {'result': [
+        {'name': 'Shelf', 'type': 2},
+        {'name': 'Book', 'type': 2},
+    ]}
+    client.graphs.get.return_value = [{'_key': 'Archive', 'name': 'Archive', 'edgeDefinitions': []}]
+
+    schema.clear()
+
+    with mock.patch.object(meta.MetaBase, 'client', new_callable=mock.PropertyMock, return_value=client):
+        yield client
+
+    schema.clear()
+
+
+def test_bootstrap(client):
+    from arangodb import db, graph, schema
+
+    class Shelf(db.Document):
+        by_number = db.Hash('number')
+
+    class Book(db.Document):
+        pass
+
+    class Author(db.Document):
+        pass
+
+    class Stores(db.Edge):
+        pass
+
+    class Library(graph.Graph):
+        class stores(graph.GraphEdge, Stores):
+            pass
+
+        @stores.from_vertex
+        class shelf(graph.GraphVertex, Shelf):
+            pass
+
+        @stores.to_vertex
+        class book(graph.GraphVertex, Book):
+            pass
+
+    client.indexes.get.return_value = {'indexes': []}
+
+    created = schema.bootstrap(documents=[Shelf, Book, Author], graphs=[Library])
+
+    assert sorted(created['collections']) == ['Author', 'Stores']
+    assert created['graphs'] == ['Library']
+    assert list(created['indexes']) == ['Shelf']
+
+    # listed once
+    assert client.collections.get.call_count == 1
+    assert client.graphs.get.call_count == 1
+
+    assert sorted(call[0][0] for call in client.collections.create.call_args_list) == ['Author', 'Stores']
+    client.graphs.create.assert_called_once_with(Library.__definition__)
+
+    # the snapshot is cached and updated
+    assert schema.bootstrap(documents=[Shelf, Book, Author], graphs=[Library], indexes=False) == {
+        'collections': [], 'graphs': [], 'indexes': {}
+    }
+    assert client.collections.get.call_count == 1
+
+
+def test_wrong_type(client):
+    from arangodb import db, exc, schema
+
+    client.collections.get.return_value = {'result': [{'name': 'Shelve', 'type': 2}]}
+
+    class Shelve(db.Edge):
+        pass
+
+    with pytest.raises(exc.ArangoException):
+        schema.bootstrap(documents=[Shelve], graphs=[])
+
+
+def test_abstract():
+    from arangodb import db, schema
+
+    documents = schema.registered_documents()
+
+    assert db.Document not in documents
+    assert db.Edge not in documents
@@ -0,0 +1,156 @@
+try:
+    import unittest.mock as mock
+except ImportError:
+    import mock
+
+import pytest
+
+
+@pytest.fixture
+def Note():
+    from arangodb import db
+
+    class Note(db.Document):
+        pass
+
+    yield Note
+
+    db.Document.__documents__.pop('Note')
+
+
+def test_identity_map(Note):
+    from arangodb import session
+
+    with mock.patch.object(Note, 'load') as load:
+        load.side_effect = lambda _id: Note(_id=_id, _key=_id.split('/')[1], text='foo')
+
+        s = session.Session()
+
+        note = s.load(Note, '1')
+        note['text'] = 'bar'
+
+        assert s.load(Note, 'Note/1') is note
+        assert s.load(Note, '1')['text'] == 'bar'
+
+        load.assert_called_once_with('Note/1')
+
+        assert s.merge(Note(_id='Note/1', text='foo')) is note
+        assert s.dirty == [note]
+
+
+def test_load_many(Note):
+    from arangodb import session
+
+    s = session.Session()
+    note = s.merge(Note._polymorph({'_id': 'Note/1', '_key': '1', '_rev': '1'}))
+
+    with mock.patch.object(Note, 'load_many') as load_many:
+        load_many.return_value = [Note._polymorph({'_id': 'Note/2', '_key': '2', '_rev': '1'}), None]
+
+        notes = s.load_many(Note, ['1', '2', 'Note/3'])
+
+        load_many.assert_called_once_with(['Note/2', 'Note/3'], strict=False)
+
+    assert notes[0] is note
+    assert notes[1]['_key'] == '2'
+    assert notes[2] is None
+    assert s.load(Note, '2') is notes[1]
+
+
+@mock.patch("arangodb.cursor.Cursor")
+def test_commit(Cursor, Note):
+    from arangodb import session
+
+    changed = Note(_id='Note/1', _key='1', _rev='1', text='foo')
+    unchanged = Note(_id='Note/2', _key='2', _rev='1', text='foo')
+    deleted = Note(_id='Note/3', _key='3', _rev='1', text='foo')
+    new = Note(text='new')
+
+    Cursor.return_value.iter_result.side_effect = [
+        [{'_id': 'Note/4', '_key': '4', '_rev': '1'}],
+        ['2'],
+        [],
+    ]
+
+    with session.Session() as s:
+        for doc in (changed, unchanged, deleted):
+            s.add(doc)
+
+        changed['text'] = 'bar'
+        s.add(new)
+        s.delete(deleted)
+
+    assert Cursor.call_args_list == [
+        mock.call(
+            'FOR doc IN @value_0 INSERT doc INTO @@c_0 '
+            'RETURN {"_id": NEW.`_id`, "_key": NEW.`_key`, "_rev": NEW.`_rev`}',
+            {'value_0': [{'text': 'new'}], '@c_0': 'Note'}
+        ),
+        mock.call(
+            'FOR doc IN @value_0 REPLACE doc IN @@c_0 RETURN NEW.`_rev`',
+            {'value_0': [{'_id': 'Note/1', '_key': '1', '_rev': '1', 'text': 'bar'}], '@c_0': 'Note'}
+        ),
+        mock.call(
+            'FOR doc IN @value_0 REMOVE doc IN @@c_0',
+            {'value_0': ['3'], '@c_0': 'Note'}
+        ),
+    ]
+
+    assert new['_id'] == 'Note/4'
+    assert changed['_rev'] == '2'
+    assert new in s
+    assert deleted not in s
+    assert s.dirty == []
+
+
+@mock.patch("arangodb.cursor.Cursor")
+def test_flush_partial(Cursor, Note):
+    from arangodb import exc, session
+
+    Cursor.return_value.iter_result.return_value = ['2']
+
+    s = session.Session()
+    note = s.merge(Note._polymorph({'_id': 'Note/1', '_key': '1', '_rev': '1', 'text': 'foo', 'n': 1}))
+    note.__partial__ = True
+
+    note['text'] = 'bar'
+    note['tags'] = ['baz']
+    s.flush()
+
+    # only the modified fields, a replace would delete the fields not loaded
+    Cursor.assert_called_once_with(
+        'FOR doc IN @value_0 UPDATE doc IN @@c_0 OPTIONS {"mergeObjects": false} RETURN NEW.`_rev`',
+        {'value_0': [{'_key': '1', 'text': 'bar', 'tags': ['baz']}], '@c_0': 'Note'}
+    )
+    assert note['_rev'] == '2'
+    assert s.dirty == []
+
+    del note['n']
+
+    with pytest.raises(exc.ArangoException):
+        s.flush()
+
+
+def test_dirty_nested(Note):
+    from arangodb import session
+
+    s = session.Session()
+    note = s.merge(Note._polymorph({'_id': 'Note/1', '_key': '1', '_rev': '1', 'tags': ['foo']}))
+
+    assert s.dirty == []
+
+    note['tags'].append('bar')
+
+    assert s.dirty == [note]
+
+
+def test_rollback(Note):
+    from arangodb import session
+
+    with pytest.raises(ValueError):
+        with session.Session() as s:
+            s.add(Note(text='new'))
+
+            raise ValueError()
+
+    assert s.new == []
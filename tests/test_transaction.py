@@ -0,0 +1,190 @@
+try:
+    import unittest.mock as mock
+except ImportError:
+    import mock
+
+import pytest
+
+
+@pytest.fixture
+def client():
+    from arangodb import meta
+
+    client = mock.Mock()
+
+    with mock.patch.object(meta.MetaBase, 'client', new_callable=mock.PropertyMock, return_value=client):
+        yield client
+
+
+def test_collect_writes(client):
+    from arangodb import db, transaction
+
+    client.transactions.execute.return_value = [
+        {'_id': 'Document/new', '_key': 'new', '_rev': '1'},
+        {'_id': 'Document/1', '_key': '1', '_rev': '2'},
+        {'_id': 'Document/2', '_key': '2', '_rev': '1'},
+    ]
+
+    new = db.Document(foo=1)
+    modified = db.Document._polymorph({'_id': 'Document/1', '_key': '1', '_rev': '1', 'foo': 1})
+    modified['foo'] = 2
+    deleted = db.Document._polymorph({'_id': 'Document/2', '_key': '2', '_rev': '1'})
+
+    with mock.patch.object(db.Document.__class__, 'api', new_callable=mock.PropertyMock) as api:
+        with transaction.Transaction(client, read=['Other']) as trx:
+            new.save()
+            modified.save()
+            deleted.delete()
+
+            assert transaction.current() is trx
+            assert '_id' not in new
+
+        assert not api.return_value.mock_calls
+
+    assert transaction.current() is None
+
+    client.transactions.execute.assert_called_once_with(
+        transaction.ACTION,
+        read=['Other'],
+        write=['Document'],
+        params={'operations': [
+            {'type': 'create', 'collection': 'Document', 'handle': None, 'doc': {'foo': 1}, 'keep': None},
+            {'type': 'update', 'collection': 'Document', 'handle': 'Document/1', 'doc': {'foo': 2}, 'keep': True},
+            {'type': 'delete', 'collection': 'Document', 'handle': 'Document/2'},
+        ]}
+    )
+
+    assert new['_id'] == 'Document/new' and not new.dirty
+    assert modified['_rev'] == '2' and not modified.dirty
+
+
+def test_abort(client):
+    from arangodb import db, transaction
+
+    with pytest.raises(ValueError):
+        with transaction.Transaction(client) as trx:
+            db.Document(foo=1).save()
+
+            raise ValueError()
+
+    assert not trx.operations
+    assert not client.transactions.execute.called
+
+
+def test_pending_edge(client):
+    from arangodb import db, transaction
+
+    class Follows(db.Edge):
+        pass
+
+    client.transactions.execute.return_value = [
+        {'_id': 'Document/new', '_key': 'new', '_rev': '2'},
+        {'_id': 'Follows/1', '_key': '1', '_rev': '1'},
+    ]
+
+    new = db.Document(foo=1)
+    other = db.Document._polymorph({'_id': 'Document/2', '_key': '2', '_rev': '1'})
+
+    with pytest.raises(TypeError):
+        Follows(new, other)
+
+    with transaction.Transaction(client):
+        with pytest.raises(TypeError):
+            Follows(new, other)
+
+        new.save()
+        edge = Follows(new, other, bar=1)
+        edge.save()
+
+        # a second save replaces the collected creation
+        new['foo'] = 2
+        new.save()
+
+    client.transactions.execute.assert_called_once_with(
+        transaction.ACTION,
+        read=[],
+        write=['Document', 'Follows'],
+        params={'operations': [
+            {'type': 'create', 'collection': 'Document', 'handle': None, 'doc': {'foo': 2}, 'keep': None},
+            {'type': 'create', 'collection': 'Follows', 'handle': None, 'doc': {'_to': 'Document/2', 'bar': 1},
+             'keep': None, 'refs': {'_from': 0}},
+        ]}
+    )
+
+    assert new['_id'] == 'Document/new' and not new.dirty
+    assert edge['_from'] == 'Document/new' and edge['_id'] == 'Follows/1' and not edge.dirty
+    assert edge.from_document is new
+
+
+def test_no_client_outside(client):
+    from arangodb import db, meta
+
+    with mock.patch.object(meta.MetaBase, 'client', new_callable=mock.PropertyMock) as client_property:
+        with mock.patch.object(db.Document.__class__, 'api', new_callable=mock.PropertyMock) as api:
+            api.return_value.create.return_value = {'_id': 'Document/1', '_key': '1', '_rev': '1'}
+
+            db.Document(foo=1).save()
+
+    assert not client_property.called
+
+
+def test_other_database(client):
+    from arangodb import db, exc, session, transaction
+
+    other = mock.Mock()
+    doc = db.Document(foo=1)
+
+    client.documents.create_many.return_value = [{'_id': 'Document/2', '_key': '2', '_rev': '1'}]
+
+    with mock.patch.object(db.Document.__class__, 'api', new_callable=mock.PropertyMock) as api:
+        api.return_value.create.return_value = {'_id': 'Document/1', '_key': '1', '_rev': '1'}
+
+        with transaction.Transaction(other) as trx:
+            doc.save()
+
+            # the documents of other databases are not part of the transaction
+            assert doc['_id'] == 'Document/1'
+            assert not trx.operations
+
+            db.Document.save_many([db.Document(foo=2)])
+
+        with transaction.Transaction(client):
+            with pytest.raises(exc.TransactionError):
+                db.Document.save_many([db.Document(foo=2)])
+
+            with pytest.raises(exc.TransactionError):
+                db.Document.delete_many([doc])
+
+            with pytest.raises(exc.TransactionError):
+                session.Session().flush()
+
+    assert not other.transactions.execute.called
+
+
+def test_stream_header():
+    import requests
+    from arangodb import api
+
+    response = mock.Mock(status_code=200, headers=requests.structures.CaseInsensitiveDict({
+        'content-type': 'application/json'
+    }))
+    response.json.return_value = {'_id': 'foo/1'}
+
+    session = mock.Mock()
+    session.get.return_value = response
+
+    client = api.Client('test', session=session)
+    client.transactions = mock.Mock()
+    client.transactions.begin.return_value = '123'
+
+    with client.transaction(write=['foo'], stream=True, sync=True):
+        client.documents.get('foo/1')
+
+    client.transactions.begin.assert_called_once_with(read=[], write=['foo'], sync=True)
+    client.transactions.commit.assert_called_once_with('123')
+
+    assert session.get.call_args[1]['headers'] == {'x-arango-trx-id': '123'}
+
+    client.documents.get('foo/1')
+
+    assert session.get.call_args[1]['headers'] == {}